@@ -1,4 +1,5 @@
 import time
+from contextlib import contextmanager
 from cryptography.hazmat.primitives.asymmetric import rsa, ec, padding
 from cryptography.hazmat.primitives import serialization, hashes
 
@@ -22,17 +23,11 @@ def benchmark_rsa_kem(algo_name="RSA-2048", payload=None):
     secret = b"x" * 32
     
     t0 = time.perf_counter()
-    ct = pub.encrypt(
-        secret,
-        padding.OAEP(mgf=padding.MGF1(algorithm=hashes.SHA256()), algorithm=hashes.SHA256(), label=None)
-    )
+    ct = pub.encrypt(secret, _oaep())
     t_enc = (time.perf_counter() - t0) * 1000
 
     t0 = time.perf_counter()
-    _ = priv.decrypt(
-        ct,
-        padding.OAEP(mgf=padding.MGF1(algorithm=hashes.SHA256()), algorithm=hashes.SHA256(), label=None)
-    )
+    _ = priv.decrypt(ct, _oaep())
     t_dec = (time.perf_counter() - t0) * 1000
 
     return {
@@ -44,13 +39,18 @@ def benchmark_rsa_kem(algo_name="RSA-2048", payload=None):
         "CT/Sig Size (B)": len(ct)
     }
 
-def benchmark_ecdsa_sign(algo_name="SECP256R1 (P-256)", payload=b"test"):
+def _curve(algo_name):
     if "P-256" in algo_name:
-        curve = ec.SECP256R1()
+        return ec.SECP256R1()
     elif "P-384" in algo_name:
-        curve = ec.SECP384R1()
-    else:
-        curve = ec.SECP521R1()
+        return ec.SECP384R1()
+    return ec.SECP521R1()
+
+def _oaep():
+    return padding.OAEP(mgf=padding.MGF1(algorithm=hashes.SHA256()), algorithm=hashes.SHA256(), label=None)
+
+def benchmark_ecdsa_sign(algo_name="SECP256R1 (P-256)", payload=b"test"):
+    curve = _curve(algo_name)
 
     t0 = time.perf_counter()
     priv = ec.generate_private_key(curve)
@@ -75,4 +75,53 @@ def benchmark_ecdsa_sign(algo_name="SECP256R1 (P-256)", payload=b"test"):
         "PK Size (B)": len(pk_bytes), 
         "SK Size (B)": len(sk_bytes), 
         "CT/Sig Size (B)": len(sig)
-    }
\ No newline at end of file
+    }
+
+@contextmanager
+def rsa_kem_operations(algo_name="RSA-2048"):
+    """Prepare one RSA keypair and yield (operations, sizes) for operation-level benchmarks."""
+    size = int(algo_name.split("-")[1])
+    priv = rsa.generate_private_key(public_exponent=65537, key_size=size)
+    pub = priv.public_key()
+
+    pk_bytes = pub.public_bytes(serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo)
+    sk_bytes = priv.private_bytes(serialization.Encoding.DER, serialization.PrivateFormat.PKCS8, serialization.NoEncryption())
+
+    secret = b"x" * 32
+    ct = pub.encrypt(secret, _oaep())
+
+    operations = {
+        "KeyGen": lambda: rsa.generate_private_key(public_exponent=65537, key_size=size),
+        "Encaps": lambda: pub.encrypt(secret, _oaep()),
+        "Decaps": lambda: priv.decrypt(ct, _oaep()),
+    }
+    sizes = {
+        "PK Size (B)": len(pk_bytes),
+        "SK Size (B)": len(sk_bytes),
+        "CT/Sig Size (B)": len(ct)
+    }
+    yield operations, sizes
+
+@contextmanager
+def ecdsa_sign_operations(algo_name="SECP256R1 (P-256)", payload=b"test"):
+    """Prepare one ECDSA keypair and yield (operations, sizes) for operation-level benchmarks."""
+    curve = _curve(algo_name)
+    priv = ec.generate_private_key(curve)
+    pub = priv.public_key()
+
+    pk_bytes = pub.public_bytes(serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo)
+    sk_bytes = priv.private_bytes(serialization.Encoding.DER, serialization.PrivateFormat.PKCS8, serialization.NoEncryption())
+
+    sig = priv.sign(payload, ec.ECDSA(hashes.SHA256()))
+
+    operations = {
+        "KeyGen": lambda: ec.generate_private_key(curve),
+        "Sign": lambda: priv.sign(payload, ec.ECDSA(hashes.SHA256())),
+        "Verify": lambda: pub.verify(sig, payload, ec.ECDSA(hashes.SHA256())),
+    }
+    sizes = {
+        "PK Size (B)": len(pk_bytes),
+        "SK Size (B)": len(sk_bytes),
+        "CT/Sig Size (B)": len(sig)
+    }
+    yield operations, sizes
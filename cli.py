@@ -0,0 +1,260 @@
+"""
+Headless command-line entry point for running benchmark sweeps.
+Uses the same engine as the Streamlit UI and writes results via export_utils.
+
+Usage:
+    python -m cli run --mode kem --algos RSA-2048 ML-KEM-768 --iterations 100
+    python -m cli run --mode hybrid --thread-sweep --payload-size 67108864 --threads 8
+    python -m cli run --mode scenario --scenario "TLS 1.3 Handshake" --kem ML-KEM-768 --sig ML-DSA-65
+    python -m cli list --mode sign
+"""
+
+import os
+import sys
+import argparse
+
+import pandas as pd
+
+import benchmark_engine
+import isolation
+import timers
+import tls_load
+import network_model
+import classic_algo
+import pqc_algo
+import export_utils
+
+
+MODES = {
+    "kem": "KEM (Key Exchange Only)",
+    "sign": "Digital Signatures",
+    "hybrid": "Hybrid Encryption (KEM+AES)",
+    "scenario": "Real-World Scenarios",
+}
+
+FORMATS = ["csv", "json", "pdf"]
+
+
+def get_default_algos(mode):
+    """Return all available algorithms for a CLI mode."""
+    if mode == "sign":
+        return classic_algo.get_ecc_options() + pqc_algo.get_available_sig()
+    return classic_algo.get_rsa_options() + pqc_algo.get_available_kem()
+
+
+def build_parser():
+    """Build the argument parser for the CLI."""
+    parser = argparse.ArgumentParser(prog="python -m cli", description="PQC vs Classic crypto benchmark (headless)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", help="Run a benchmark sweep")
+    run.add_argument("--mode", choices=list(MODES), required=True, help="Benchmark mode")
+    run.add_argument("--algos", nargs="+", help="Algorithms to benchmark (default: all available)")
+    run.add_argument("--iterations", type=int, default=50, help="Iterations per algorithm (default: 50)")
+    run.add_argument("--iteration-mode", choices=["roundtrip", "operation", "throughput", "adaptive"],
+                     default="roundtrip", help="Iteration mode (default: roundtrip)")
+    run.add_argument("--keypairs", type=int, default=1, help="Keypairs in operation mode (default: 1)")
+    run.add_argument("--time-budget", type=float, default=1.0,
+                     help="Seconds per operation in throughput mode, maximum in adaptive mode (default: 1.0)")
+    run.add_argument("--precision", type=float, default=2.0,
+                     help="Target 95%% CI half-width in percent of the mean (adaptive mode, default: 2)")
+    run.add_argument("--payload-size", type=int, default=10240,
+                     help="Message / file size in bytes for sign, hybrid and scenario modes (default: 10240)")
+    run.add_argument("--seed", type=int, default=benchmark_engine.DEFAULT_PAYLOAD_SEED,
+                     help="Payload seed for reproducible runs; -1 for non-deterministic payloads")
+    run.add_argument("--file", help="Memory-map this file as the payload (hybrid mode, code signing scenario)")
+    run.add_argument("--chunk-size", type=int, help="Streaming AES-GCM chunk size in bytes (hybrid mode)")
+    run.add_argument("--threads", type=int, default=1,
+                     help="Chunk encryption threads (hybrid streaming), maximum for --thread-sweep")
+    run.add_argument("--thread-sweep", action="store_true",
+                     help="Measure AES-GCM chunk encryption on 1, 2, 4, ... threads, one row per thread count "
+                          "(hybrid mode; up to --threads, or the CPU count if --threads is 1)")
+    run.add_argument("--timer", choices=list(timers.TIMERS), default=timers.DEFAULT_TIMER,
+                     help="Clock for operation, throughput and adaptive modes (default: perf_counter)")
+    run.add_argument("--cycles", action="store_true",
+                     help="Report median CPU cycles/op via perf_event_open (Linux, where available)")
+    run.add_argument("--no-context-pool", action="store_true",
+                     help="Construct new liboqs contexts every round trip instead of reusing pooled ones")
+    run.add_argument("--report-setup", action="store_true",
+                     help="Report liboqs context setup time as 'Setup (ms)' (round-trip KEM / sign modes)")
+    run.add_argument("--no-warmup", action="store_true",
+                     help="Record samples without warming up until steady state")
+    run.add_argument("--workers", type=int, default=1, help="Parallel worker processes (default: 1)")
+    run.add_argument("--pin-cpus", action="store_true", help="Pin every worker process to its own CPU")
+    run.add_argument("--isolate", action="store_true",
+                     help="Run each algorithm in its own worker process with GC disabled (sequential runs)")
+    run.add_argument("--cpu", type=int, help="CPU core the isolated worker is pinned to")
+    run.add_argument("--scenario", default="TLS 1.3 Handshake", help="Scenario name (scenario mode)")
+    run.add_argument("--kem", nargs="+", help="KEM algorithms (scenario mode)")
+    run.add_argument("--sig", nargs="+", help="Signature algorithms (scenario mode)")
+    run.add_argument("--link", choices=list(network_model.LINK_PROFILES), default=network_model.DEFAULT_LINK_PROFILE,
+                     help="Network link profile for TLS, email and VPN scenarios (default: Broadband)")
+    run.add_argument("--packets", type=int, default=100000,
+                     help="Packets encrypted in the session (VPN Session scenario, default: 100000)")
+    run.add_argument("--packet-size", type=int, default=1400,
+                     help="Packet payload size in bytes (VPN Session scenario, default: 1400)")
+    run.add_argument("--rekey-interval", type=int, default=10000,
+                     help="Re-key every N packets (VPN Session scenario, default: 10000)")
+    run.add_argument("--messages", type=int, default=5000,
+                     help="Messages per session (Secure Messaging scenario, default: 5000)")
+    run.add_argument("--ratchet-interval", type=int, default=100,
+                     help="KEM ratchet step every N messages (Secure Messaging scenario, default: 100)")
+    run.add_argument("--concurrency", type=int, nargs="+",
+                     help="Concurrent clients per load level (TLS Handshake Load scenario, default: 1 4 16 64)")
+    run.add_argument("--duration", type=float, default=2.0,
+                     help="Seconds of load per concurrency level (TLS Handshake Load scenario, default: 2)")
+    run.add_argument("--output", default="benchmark", help="Output base filename (default: benchmark)")
+    run.add_argument("--formats", nargs="+", choices=FORMATS, default=["csv", "json"],
+                     help="Export formats (default: csv json)")
+    run.add_argument("--save-history", action="store_true", help="Record the run in the result store")
+    run.add_argument("--label", help="Label for the stored run")
+    run.add_argument("--quiet", action="store_true", help="Do not print progress")
+
+    list_cmd = subparsers.add_parser("list", help="List available algorithms")
+    list_cmd.add_argument("--mode", choices=["kem", "sign"], default="kem")
+
+    return parser
+
+
+def run(args):
+    """Run a benchmark sweep from parsed arguments; returns the process exit code."""
+    mode = MODES[args.mode]
+    log = (lambda msg: None) if args.quiet else (lambda msg: print(msg, file=sys.stderr))
+
+    seed = None if args.seed < 0 else args.seed
+    payload_bytes = b"x" * 32 if args.mode == "kem" else benchmark_engine.generate_payload(args.payload_size, seed)
+    if args.file and not os.path.isfile(args.file):
+        log(f"File not found: {args.file}")
+        return 2
+    if args.thread_sweep and args.mode != "hybrid":
+        log("--thread-sweep requires --mode hybrid")
+        return 2
+
+    noise_report = isolation.get_noise_report()
+    for warning in noise_report["warnings"]:
+        log(f"Noise: {warning}")
+
+    raw_measurements = {}
+    histograms = {}
+    if args.thread_sweep:
+        import parallel_encryption
+        thread_counts = parallel_encryption.get_thread_counts(args.threads if args.threads > 1 else None)
+        chunk_size = args.chunk_size or parallel_encryption.DEFAULT_CHUNK_SIZE
+
+        results = parallel_encryption.benchmark_parallel_encryption(
+            args.file or payload_bytes, thread_counts, chunk_size,
+            on_step=lambda threads: log(f"[{thread_counts.index(threads) + 1}/{len(thread_counts)}] "
+                                        f"{threads} thread(s)"))
+        errors = []
+    elif args.mode == "scenario":
+        kem_algos = args.kem or ["RSA-2048"]
+        sig_algos = args.sig or ["SECP256R1 (P-256)"]
+
+        def on_complete(done, total, kem, sig, error):
+            status = f"failed: {error}" if error else "done"
+            log(f"[{done}/{total}] {kem} + {sig}: {status}")
+
+        options = {"concurrency_levels": args.concurrency, "duration": args.duration, "link_profile": args.link,
+                   "message_count": args.messages, "ratchet_interval": args.ratchet_interval,
+                   "packet_count": args.packets, "packet_size": args.packet_size,
+                   "rekey_interval": args.rekey_interval}
+        results, errors = benchmark_engine.run_scenarios(args.scenario, kem_algos, sig_algos,
+                                                         payload_bytes, args.file, on_complete,
+                                                         options=options)
+    else:
+        algos = args.algos or get_default_algos("sign" if args.mode == "sign" else "kem")
+
+        def on_complete(done, job, result, error):
+            status = f"failed: {error}" if error else "done"
+            log(f"[{done}/{len(algos)}] {job['algo']}: {status}")
+
+        results, raw_measurements, histograms, errors = benchmark_engine.run_benchmark(
+            mode, algos, payload_bytes, args.iterations, args.iteration_mode, args.keypairs,
+            args.time_budget, args.chunk_size, args.file if args.mode == "hybrid" else None, args.threads,
+            max_workers=args.workers, pin_cpus=args.pin_cpus, on_complete=on_complete,
+            precision=args.precision / 100, warmup=not args.no_warmup,
+            timer=args.timer, cycles=args.cycles, isolate=args.isolate, isolate_cpu=args.cpu,
+            context_pool=not args.no_context_pool, report_setup=args.report_setup)
+
+    df = pd.DataFrame(results)
+    if df.empty:
+        log("No results collected")
+        return 1
+    if "Client Bound" in df.columns and df["Client Bound"].any():
+        levels = ", ".join(str(c) for c in df.loc[df["Client Bound"], "Concurrency"].unique())
+        log(f"Warning: client-bound at concurrency {levels}; handshakes/s there measure the load generator")
+
+    config = {
+        "mode": mode,
+        "iterations": args.iterations,
+        "iteration_mode": args.iteration_mode,
+        "keypairs": args.keypairs,
+        "time_budget": args.time_budget,
+        "precision": args.precision / 100,
+        "warmup": not args.no_warmup,
+        "context_pool": not args.no_context_pool,
+        "report_setup": args.report_setup,
+        "timer": args.timer,
+        "cycles": args.cycles,
+        "isolate": args.isolate,
+        "isolate_cpu": args.cpu,
+        "noise": noise_report,
+        "chunk_size": args.chunk_size,
+        "encryption_threads": args.threads,
+        "parallel_workers": args.workers,
+        "payload_seed": seed,
+        "payload_size": os.path.getsize(args.file) if args.file else len(payload_bytes),
+    }
+    if args.thread_sweep:
+        config["mode"] = "Parallel Encryption"
+        config["chunk_size"] = chunk_size
+        config["thread_counts"] = thread_counts
+    if args.mode == "scenario":
+        config["scenario"] = args.scenario
+        config["link_profile"] = args.link
+        if args.scenario == "TLS Handshake Load":
+            config["concurrency_levels"] = args.concurrency or tls_load.DEFAULT_CONCURRENCY_LEVELS
+            config["load_duration"] = args.duration
+        elif args.scenario == "VPN Session":
+            config["packet_count"] = args.packets
+            config["packet_size"] = args.packet_size
+            config["rekey_interval"] = args.rekey_interval
+        elif args.scenario == "Secure Messaging":
+            config["message_count"] = args.messages
+            config["ratchet_interval"] = args.ratchet_interval
+    system_info = export_utils.get_system_info()
+    metadata = export_utils.create_metadata(config, system_info)
+
+    if "csv" in args.formats:
+        log(f"Wrote {export_utils.export_to_csv(df, f'{args.output}.csv')}")
+    if "json" in args.formats:
+        log(f"Wrote {export_utils.export_to_json(df, metadata, f'{args.output}.json', histograms)}")
+    if "pdf" in args.formats:
+        pdf_path = export_utils.export_to_pdf(df, filename=f"{args.output}.pdf")
+        if pdf_path:
+            log(f"Wrote {pdf_path}")
+
+    if args.save_history:
+        import result_store
+        with result_store.ResultStore() as store:
+            run_id = store.save_run(df, raw_measurements, config, system_info, label=args.label,
+                                    histograms=histograms)
+        log(f"Saved to result store as run #{run_id}")
+
+    return 1 if errors else 0
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    args = build_parser().parse_args(argv)
+
+    if args.command == "list":
+        for algo in get_default_algos(args.mode):
+            print(algo)
+        return 0
+
+    return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
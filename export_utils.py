@@ -6,7 +6,7 @@ Supports CSV, JSON, and PDF report generation.
 import json
 import os
 from datetime import datetime
-import pandas as pd
+from functools import lru_cache
 
 
 def export_to_csv(df, filename="benchmark_results.csv"):
@@ -25,7 +25,7 @@ def export_to_csv(df, filename="benchmark_results.csv"):
     return filepath
 
 
-def export_to_json(df, metadata=None, filename="benchmark_results.json"):
+def export_to_json(df, metadata=None, filename="benchmark_results.json", histograms=None):
     """
     Export DataFrame to JSON with metadata.
     
@@ -33,6 +33,7 @@ def export_to_json(df, metadata=None, filename="benchmark_results.json"):
         df: pandas DataFrame with results
         metadata: Optional dictionary with additional metadata
         filename: Output filename
+        histograms: Optional {algorithm: {key: HdrHistogram}} latency histograms
         
     Returns:
         Path to exported file
@@ -42,6 +43,8 @@ def export_to_json(df, metadata=None, filename="benchmark_results.json"):
         "metadata": metadata or {},
         "results": df.to_dict('records')
     }
+    if histograms:
+        export_data["histograms"] = histograms_to_dict(histograms)
     
     filepath = filename
     with open(filepath, 'w') as f:
@@ -50,6 +53,12 @@ def export_to_json(df, metadata=None, filename="benchmark_results.json"):
     return filepath
 
 
+def histograms_to_dict(histograms):
+    """Serialize {algorithm: {key: HdrHistogram}} to JSON-compatible dictionaries."""
+    return {algo: {key: histogram.to_dict() for key, histogram in algo_histograms.items()}
+            for algo, algo_histograms in histograms.items()}
+
+
 def export_to_pdf(df, title="Cryptographic Benchmark Report", filename="benchmark_report.pdf", 
                   charts_data=None, analysis_text=None):
     """
@@ -237,9 +246,17 @@ def get_system_info():
     """
     Collect system information for metadata.
     
+    The information is collected once per process (cpuinfo spawns
+    subprocesses and takes about a second); a copy is returned.
+    
     Returns:
         Dictionary with system information
     """
+    return dict(_collect_system_info())
+
+
+@lru_cache(maxsize=1)
+def _collect_system_info():
     import platform
     
     info = {
@@ -0,0 +1,223 @@
+"""
+HDR-style latency histogram.
+Records values (nanoseconds) into log-bucketed counters with a fixed relative
+precision and fixed memory, following the HdrHistogram layout: each power-of-two
+bucket is split into linear sub-buckets so that every recorded value keeps
+`significant_figures` decimal digits of precision. Histograms merge by adding
+counts and support percentile queries up to p99.99 and beyond.
+"""
+
+import math
+import json
+import zlib
+import base64
+
+import numpy as np
+
+
+class HdrHistogram:
+    """
+    Fixed-memory latency histogram with nanosecond resolution.
+
+    Args:
+        lowest: Lowest discernible value in ns (>= 1)
+        highest: Highest trackable value in ns; larger values are clamped
+        significant_figures: Decimal digits of precision (1-5)
+    """
+
+    def __init__(self, lowest=1, highest=3600 * 10**9, significant_figures=3):
+        if lowest < 1 or highest < 2 * lowest or not 1 <= significant_figures <= 5:
+            raise ValueError("Invalid histogram range or precision")
+        self.lowest = int(lowest)
+        self.highest = int(highest)
+        self.significant_figures = int(significant_figures)
+
+        largest_single_unit = 2 * 10 ** significant_figures
+        self._unit_magnitude = int(math.floor(math.log2(lowest)))
+        sub_bucket_count_magnitude = int(math.ceil(math.log2(largest_single_unit)))
+        self._sub_half_magnitude = max(sub_bucket_count_magnitude, 1) - 1
+        self._sub_count = 1 << (self._sub_half_magnitude + 1)
+        self._sub_half = self._sub_count // 2
+        self._sub_mask = (self._sub_count - 1) << self._unit_magnitude
+
+        smallest_untrackable = self._sub_count << self._unit_magnitude
+        bucket_count = 1
+        while smallest_untrackable <= highest:
+            smallest_untrackable <<= 1
+            bucket_count += 1
+        self._bucket_count = bucket_count
+
+        self.counts = np.zeros((bucket_count + 1) * self._sub_half, dtype=np.int64)
+        self.total_count = 0
+        self.min = None
+        self.max = None
+        self._sum = 0
+
+    # ----- index arithmetic -----
+
+    def _bucket_index(self, value):
+        return (value | self._sub_mask).bit_length() - self._unit_magnitude - (self._sub_half_magnitude + 1)
+
+    def _index_of(self, value):
+        bucket = self._bucket_index(value)
+        sub = value >> (bucket + self._unit_magnitude)
+        return ((bucket + 1) << self._sub_half_magnitude) + (sub - self._sub_half)
+
+    def _indices_of(self, values):
+        """Vectorized _index_of for an int64 array (values < 2**53)."""
+        # frexp exponent == bit_length for positive integers exactly representable as float
+        bit_length = np.frexp((values | self._sub_mask).astype(np.float64))[1]
+        bucket = bit_length - self._unit_magnitude - (self._sub_half_magnitude + 1)
+        sub = values >> (bucket + self._unit_magnitude)
+        return ((bucket + 1) << self._sub_half_magnitude) + (sub - self._sub_half)
+
+    def _value_range(self, index):
+        """Return (lowest, highest) equivalent value of a counts index."""
+        bucket = (index >> self._sub_half_magnitude) - 1
+        sub = (index & (self._sub_half - 1)) + self._sub_half
+        if bucket < 0:
+            sub -= self._sub_half
+            bucket = 0
+        low = sub << (bucket + self._unit_magnitude)
+        size = 1 << (bucket + self._unit_magnitude)
+        return low, low + size - 1
+
+    def _clamp(self, value):
+        # Rounded like record_many, so every entry point buckets a value alike
+        return min(max(int(round(value)), 0), self.highest)
+
+    # ----- recording -----
+
+    def record(self, value_ns, count=1):
+        """Record a value in nanoseconds (rounded and clamped to [0, highest])."""
+        value = self._clamp(value_ns)
+        self.counts[self._index_of(value)] += count
+        self.total_count += count
+        self._sum += value * count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def record_ms(self, value_ms):
+        """Record a value in milliseconds."""
+        self.record(round(value_ms * 1e6))
+
+    def record_many(self, values_ns):
+        """Record an array of nanosecond values at once."""
+        values = np.clip(np.asarray(values_ns, dtype=np.float64).round(), 0, self.highest).astype(np.int64)
+        if values.size == 0:
+            return
+        np.add.at(self.counts, self._indices_of(values), 1)
+        self.total_count += int(values.size)
+        self._sum += int(values.sum())
+        low, high = int(values.min()), int(values.max())
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+
+    @classmethod
+    def from_ms(cls, values_ms, **kwargs):
+        """Build a histogram from a list of millisecond samples."""
+        histogram = cls(**kwargs)
+        histogram.record_many(np.asarray(values_ms, dtype=np.float64) * 1e6)
+        return histogram
+
+    def merge(self, other):
+        """Add another histogram's counts (same configuration) into this one."""
+        if (other.lowest, other.highest, other.significant_figures) != \
+                (self.lowest, self.highest, self.significant_figures):
+            raise ValueError("Cannot merge histograms with different configurations")
+        self.counts += other.counts
+        self.total_count += other.total_count
+        self._sum += other._sum
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    # ----- queries -----
+
+    def value_at_percentile(self, percentile):
+        """
+        Return the value (ns) at a percentile (0-100).
+
+        As in HdrHistogram, this is the highest value equivalent to the bucket
+        holding the requested rank, capped at the recorded maximum.
+        """
+        if self.total_count == 0:
+            return 0
+        rank = max(1, int(math.ceil(min(percentile, 100.0) / 100.0 * self.total_count)))
+        index = int(np.searchsorted(np.cumsum(self.counts), rank))
+        return min(self._value_range(index)[1], self.max)
+
+    def percentile_ms(self, percentile):
+        """Return the value at a percentile in milliseconds."""
+        return self.value_at_percentile(percentile) / 1e6
+
+    @property
+    def mean(self):
+        """Exact mean of the recorded values (ns)."""
+        return self._sum / self.total_count if self.total_count else 0.0
+
+    def stddev(self):
+        """Standard deviation (ns) estimated from bucket midpoints."""
+        if self.total_count == 0:
+            return 0.0
+        nonzero = np.nonzero(self.counts)[0]
+        mids = np.array([sum(self._value_range(int(i))) / 2 for i in nonzero])
+        weights = self.counts[nonzero]
+        return float(np.sqrt(np.sum(weights * (mids - self.mean) ** 2) / self.total_count))
+
+    def summary(self, percentiles=(50, 90, 99, 99.9, 99.99)):
+        """Return count, min, mean, max and percentiles in milliseconds."""
+        result = {
+            "Count": self.total_count,
+            "Min (ms)": (self.min or 0) / 1e6,
+            "Mean (ms)": self.mean / 1e6,
+            "Max (ms)": (self.max or 0) / 1e6,
+        }
+        for p in percentiles:
+            result[f"P{p:g} (ms)"] = self.percentile_ms(p)
+        return result
+
+    # ----- serialization -----
+
+    def to_dict(self):
+        """Serialize to a JSON-compatible dictionary with sparse counts."""
+        nonzero = np.nonzero(self.counts)[0]
+        return {
+            "lowest": self.lowest,
+            "highest": self.highest,
+            "significant_figures": self.significant_figures,
+            "total_count": self.total_count,
+            "sum": self._sum,
+            "min": self.min,
+            "max": self.max,
+            "indices": nonzero.tolist(),
+            "counts": self.counts[nonzero].tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a histogram serialized with to_dict."""
+        histogram = cls(data["lowest"], data["highest"], data["significant_figures"])
+        histogram.counts[np.asarray(data["indices"], dtype=np.int64)] = data["counts"]
+        histogram.total_count = data["total_count"]
+        histogram._sum = data["sum"]
+        histogram.min = data["min"]
+        histogram.max = data["max"]
+        return histogram
+
+    def encode(self):
+        """Serialize to a compact base64 string (zlib-compressed JSON)."""
+        return base64.b64encode(zlib.compress(json.dumps(self.to_dict()).encode())).decode("ascii")
+
+    @classmethod
+    def decode(cls, encoded):
+        """Rebuild a histogram serialized with encode."""
+        return cls.from_dict(json.loads(zlib.decompress(base64.b64decode(encoded))))
+
+    def __getstate__(self):
+        # Pickle sparse counts so histograms are cheap to send between processes
+        return self.to_dict()
+
+    def __setstate__(self, state):
+        self.__dict__.update(HdrHistogram.from_dict(state).__dict__)
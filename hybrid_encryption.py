@@ -6,6 +6,10 @@ for benchmarking purposes.
 
 import time
 import os
+import hashlib
+import mmap
+import tempfile
+from contextlib import contextmanager
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
@@ -13,6 +17,32 @@ import classic_algo
 import pqc_algo
 
 
+@contextmanager
+def map_file(path):
+    """
+    Memory-map a file read-only and yield a memoryview over its contents.
+
+    Slices of the view are zero-copy, so large files can be passed to the
+    AEAD and hash calls without being read into Python bytes.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap cannot map empty files
+            yield memoryview(b"")
+            return
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mm)
+        try:
+            yield view
+        finally:
+            view.release()
+            try:
+                mm.close()
+            except BufferError:
+                # Slices are still referenced; the mapping is released when they are collected
+                pass
+
+
 def derive_aes_key(shared_secret, salt=None):
     """Derive AES-256 key from KEM shared secret using HKDF."""
     if salt is None:
@@ -27,60 +57,103 @@ def derive_aes_key(shared_secret, salt=None):
     return kdf.derive(shared_secret)
 
 
-def benchmark_hybrid_encryption_rsa(algo_name, file_data):
+def exchange_aes_key(algo_name):
     """
-    Benchmark RSA-based hybrid encryption:
-    1. RSA-OAEP for key encapsulation (32-byte secret)
-    2. AES-256-GCM for file encryption
+    Run one KEM key exchange and derive the AES-256 key on both sides.
+
+    Returns:
+        Dictionary with KeyGen/Encaps/Decaps timings, key sizes, the sender's
+        AES key and the key recovered by the receiver
     """
-    from cryptography.hazmat.primitives.asymmetric import rsa, padding
-    from cryptography.hazmat.primitives import serialization
-    
-    size = int(algo_name.split("-")[1])
-    
-    # Step 1: Key Generation
-    t0 = time.perf_counter()
-    priv = rsa.generate_private_key(public_exponent=65537, key_size=size)
-    pub = priv.public_key()
-    t_gen = (time.perf_counter() - t0) * 1000
+    if "RSA" in algo_name:
+        from cryptography.hazmat.primitives.asymmetric import rsa, padding
+        from cryptography.hazmat.primitives import serialization
 
-    pk_bytes = pub.public_bytes(serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo)
-    sk_bytes = priv.private_bytes(serialization.Encoding.DER, serialization.PrivateFormat.PKCS8, serialization.NoEncryption())
+        size = int(algo_name.split("-")[1])
+        oaep = padding.OAEP(mgf=padding.MGF1(algorithm=hashes.SHA256()), algorithm=hashes.SHA256(), label=None)
 
-    # Step 2: Generate and encapsulate random AES key
-    aes_key = os.urandom(32)
-    
-    t0 = time.perf_counter()
-    kem_ciphertext = pub.encrypt(
-        aes_key,
-        padding.OAEP(mgf=padding.MGF1(algorithm=hashes.SHA256()), algorithm=hashes.SHA256(), label=None)
-    )
-    t_encaps = (time.perf_counter() - t0) * 1000
+        t0 = time.perf_counter()
+        priv = rsa.generate_private_key(public_exponent=65537, key_size=size)
+        pub = priv.public_key()
+        t_gen = (time.perf_counter() - t0) * 1000
+
+        pk_bytes = pub.public_bytes(serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo)
+        sk_bytes = priv.private_bytes(serialization.Encoding.DER, serialization.PrivateFormat.PKCS8, serialization.NoEncryption())
+
+        aes_key = os.urandom(32)
+        t0 = time.perf_counter()
+        kem_ciphertext = pub.encrypt(aes_key, oaep)
+        t_encaps = (time.perf_counter() - t0) * 1000
+
+        t0 = time.perf_counter()
+        recovered_key = priv.decrypt(kem_ciphertext, oaep)
+        t_decaps = (time.perf_counter() - t0) * 1000
+
+        pk_size, sk_size = len(pk_bytes), len(sk_bytes)
+    else:
+        if not pqc_algo.OQS_AVAILABLE:
+            raise RuntimeError("Liboqs not available")
+
+        pool = pqc_algo.CONTEXT_POOL
+        client = pool.acquire("kem", algo_name)
+        server = pool.acquire("kem", algo_name)
+        try:
+            t0 = time.perf_counter()
+            public_key = client.generate_keypair()
+            t_gen = (time.perf_counter() - t0) * 1000
+            secret_key = client.export_secret_key()
+
+            t0 = time.perf_counter()
+            kem_ciphertext, shared_secret_server = server.encap_secret(public_key)
+            t_encaps = (time.perf_counter() - t0) * 1000
+
+            t0 = time.perf_counter()
+            shared_secret_client = client.decap_secret(kem_ciphertext)
+            t_decaps = (time.perf_counter() - t0) * 1000
+        finally:
+            pool.release("kem", algo_name, client)
+            pool.release("kem", algo_name, server)
+
+        aes_key = derive_aes_key(shared_secret_server)
+        recovered_key = derive_aes_key(shared_secret_client)
+        pk_size, sk_size = len(public_key), len(secret_key)
+
+    return {
+        "KeyGen (ms)": t_gen,
+        "KEM Encaps (ms)": t_encaps,
+        "KEM Decaps (ms)": t_decaps,
+        "PK Size (B)": pk_size,
+        "SK Size (B)": sk_size,
+        "KEM CT Size (B)": len(kem_ciphertext),
+        "aes_key": aes_key,
+        "recovered_key": recovered_key,
+    }
 
-    # Step 3: Encrypt file data with AES-256-GCM
+
+def benchmark_hybrid_encryption(algo_name, file_data):
+    """
+    Benchmark hybrid encryption of an in-memory payload:
+    1. KEM key exchange (see exchange_aes_key): RSA-OAEP of a random 32-byte
+       AES key, or a liboqs KEM with the AES key derived by HKDF
+    2. AES-256-GCM encryption of the whole payload with the sender's key
+    3. AES-256-GCM decryption with the key recovered by the receiver
+    """
+    kem = exchange_aes_key(algo_name)
     nonce = os.urandom(12)
-    aesgcm = AESGCM(aes_key)
     
     t0 = time.perf_counter()
-    file_ciphertext = aesgcm.encrypt(nonce, file_data, None)
+    file_ciphertext = AESGCM(kem["aes_key"]).encrypt(nonce, file_data, None)
     t_aes_enc = (time.perf_counter() - t0) * 1000
     
-    # Step 4: Decapsulate AES key
-    t0 = time.perf_counter()
-    recovered_key = priv.decrypt(
-        kem_ciphertext,
-        padding.OAEP(mgf=padding.MGF1(algorithm=hashes.SHA256()), algorithm=hashes.SHA256(), label=None)
-    )
-    t_decaps = (time.perf_counter() - t0) * 1000
-    
-    # Step 5: Decrypt file data
     t0 = time.perf_counter()
-    recovered_data = aesgcm.decrypt(nonce, file_ciphertext, None)
+    recovered_data = AESGCM(kem["recovered_key"]).decrypt(nonce, file_ciphertext, None)
     t_aes_dec = (time.perf_counter() - t0) * 1000
     
-    assert recovered_key == aes_key
     assert recovered_data == file_data
 
+    t_gen, t_encaps, t_decaps = kem["KeyGen (ms)"], kem["KEM Encaps (ms)"], kem["KEM Decaps (ms)"]
+    overhead = kem["KEM CT Size (B)"] + (len(file_ciphertext) - len(file_data)) + 12  # +12 for nonce
+
     return {
         "KeyGen (ms)": t_gen,
         "KEM Encaps (ms)": t_encaps,
@@ -90,92 +163,291 @@ def benchmark_hybrid_encryption_rsa(algo_name, file_data):
         "Total Encrypt (ms)": t_encaps + t_aes_enc,
         "Total Decrypt (ms)": t_decaps + t_aes_dec,
         "Total Time (ms)": t_gen + t_encaps + t_decaps + t_aes_enc + t_aes_dec,
-        "PK Size (B)": len(pk_bytes),
-        "SK Size (B)": len(sk_bytes),
-        "KEM CT Size (B)": len(kem_ciphertext),
+        "PK Size (B)": kem["PK Size (B)"],
+        "SK Size (B)": kem["SK Size (B)"],
+        "KEM CT Size (B)": kem["KEM CT Size (B)"],
         "File Size (B)": len(file_data),
         "Ciphertext Size (B)": len(file_ciphertext),
-        "Total Overhead (B)": len(kem_ciphertext) + (len(file_ciphertext) - len(file_data)) + 12,  # +12 for nonce
-        "Overhead (%)": ((len(file_ciphertext) - len(file_data) + len(kem_ciphertext) + 12) / len(file_data)) * 100 if len(file_data) > 0 else 0
+        "Total Overhead (B)": overhead,
+        "Overhead (%)": (overhead / len(file_data)) * 100 if len(file_data) > 0 else 0
     }
 
 
-def benchmark_hybrid_encryption_pqc(algo_name, file_data):
+@contextmanager
+def hybrid_encryption_operations(algo_name, file_data):
     """
-    Benchmark PQC-based hybrid encryption:
-    1. PQC KEM for key encapsulation
-    2. AES-256-GCM for file encryption
+    Prepare one KEM keypair plus an AES-256-GCM key and ciphertext, yielding
+    (operations, sizes) for operation-level benchmarks.
     """
-    if not pqc_algo.OQS_AVAILABLE:
-        raise RuntimeError("Liboqs not available")
-    
-    import oqs
-    
-    with oqs.KeyEncapsulation(algo_name) as client:
-        with oqs.KeyEncapsulation(algo_name) as server:
-            
-            # Step 1: Key Generation
-            t0 = time.perf_counter()
-            public_key = client.generate_keypair()
-            t_gen = (time.perf_counter() - t0) * 1000
-            
-            secret_key = client.export_secret_key()
-            
-            # Step 2: Encapsulation (generates shared secret)
-            t0 = time.perf_counter()
-            kem_ciphertext, shared_secret_server = server.encap_secret(public_key)
-            t_encaps = (time.perf_counter() - t0) * 1000
-            
-            # Derive AES key from shared secret
-            aes_key = derive_aes_key(shared_secret_server)
-            
-            # Step 3: Encrypt file data with AES-256-GCM
-            nonce = os.urandom(12)
-            aesgcm = AESGCM(aes_key)
-            
-            t0 = time.perf_counter()
-            file_ciphertext = aesgcm.encrypt(nonce, file_data, None)
-            t_aes_enc = (time.perf_counter() - t0) * 1000
-            
-            # Step 4: Decapsulation
-            t0 = time.perf_counter()
-            shared_secret_client = client.decap_secret(kem_ciphertext)
-            t_decaps = (time.perf_counter() - t0) * 1000
-            
-            # Derive same AES key
-            recovered_aes_key = derive_aes_key(shared_secret_client)
-            
-            # Step 5: Decrypt file data
-            t0 = time.perf_counter()
-            recovered_data = aesgcm.decrypt(nonce, file_ciphertext, None)
-            t_aes_dec = (time.perf_counter() - t0) * 1000
-            
-            assert shared_secret_client == shared_secret_server
-            assert recovered_aes_key == aes_key
-            assert recovered_data == file_data
-
-            return {
-                "KeyGen (ms)": t_gen,
-                "KEM Encaps (ms)": t_encaps,
-                "KEM Decaps (ms)": t_decaps,
-                "AES Encrypt (ms)": t_aes_enc,
-                "AES Decrypt (ms)": t_aes_dec,
-                "Total Encrypt (ms)": t_encaps + t_aes_enc,
-                "Total Decrypt (ms)": t_decaps + t_aes_dec,
-                "Total Time (ms)": t_gen + t_encaps + t_decaps + t_aes_enc + t_aes_dec,
-                "PK Size (B)": len(public_key),
-                "SK Size (B)": len(secret_key),
-                "KEM CT Size (B)": len(kem_ciphertext),
-                "File Size (B)": len(file_data),
-                "Ciphertext Size (B)": len(file_ciphertext),
-                "Total Overhead (B)": len(kem_ciphertext) + (len(file_ciphertext) - len(file_data)) + 12,
-                "Overhead (%)": ((len(file_ciphertext) - len(file_data) + len(kem_ciphertext) + 12) / len(file_data)) * 100 if len(file_data) > 0 else 0
-            }
+    if "RSA" in algo_name:
+        kem_operations = classic_algo.rsa_kem_operations(algo_name)
+    else:
+        kem_operations = pqc_algo.pqc_kem_operations(algo_name)
 
+    with kem_operations as (kem_ops, kem_sizes):
+        aes_key = os.urandom(32)
+        nonce = os.urandom(12)
+        aesgcm = AESGCM(aes_key)
+        file_ciphertext = aesgcm.encrypt(nonce, file_data, None)
+        assert aesgcm.decrypt(nonce, file_ciphertext, None) == file_data
 
-def benchmark_hybrid_encryption(algo_name, file_data):
-    """Unified interface for benchmarking hybrid encryption."""
-    if "RSA" in algo_name:
-        return benchmark_hybrid_encryption_rsa(algo_name, file_data)
+        kem_ct_size = kem_sizes["CT/Sig Size (B)"]
+        overhead = kem_ct_size + (len(file_ciphertext) - len(file_data)) + 12  # +12 for nonce
+
+        operations = {
+            "KeyGen": kem_ops["KeyGen"],
+            "KEM Encaps": kem_ops["Encaps"],
+            "KEM Decaps": kem_ops["Decaps"],
+            "AES Encrypt": lambda: aesgcm.encrypt(nonce, file_data, None),
+            "AES Decrypt": lambda: aesgcm.decrypt(nonce, file_ciphertext, None),
+        }
+        sizes = {
+            "PK Size (B)": kem_sizes["PK Size (B)"],
+            "SK Size (B)": kem_sizes["SK Size (B)"],
+            "KEM CT Size (B)": kem_ct_size,
+            "File Size (B)": len(file_data),
+            "Ciphertext Size (B)": len(file_ciphertext),
+            "Total Overhead (B)": overhead,
+            "Overhead (%)": (overhead / len(file_data)) * 100 if len(file_data) > 0 else 0
+        }
+        yield operations, sizes
+
+
+@contextmanager
+def hybrid_encryption_file_operations(algo_name, path):
+    """Memory-map a file and yield hybrid_encryption_operations over its contents."""
+    with map_file(path) as file_data:
+        with hybrid_encryption_operations(algo_name, file_data) as prepared:
+            yield prepared
+
+
+# ========== Streaming (chunked) AES-GCM ==========
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+NONCE_PREFIX_SIZE = 7
+GCM_TAG_SIZE = 16
+
+
+def stream_nonce(nonce_prefix, counter, last):
+    """
+    Build the 12-byte nonce for one chunk of a stream.
+
+    Layout (as in the STREAM construction): 7-byte random per-stream prefix,
+    32-bit big-endian chunk counter and a 1-byte flag marking the final chunk,
+    so reordered, duplicated or truncated chunks fail authentication.
+    """
+    if counter >= 2 ** 32:
+        raise ValueError("Stream too long for a 32-bit chunk counter")
+    return nonce_prefix + counter.to_bytes(4, "big") + (b"\x01" if last else b"\x00")
+
+
+def _rechunk(pieces, chunk_size):
+    """Regroup an iterable of byte strings into fixed-size chunks."""
+    buffer = bytearray()
+    for piece in pieces:
+        buffer += piece
+        while len(buffer) >= chunk_size:
+            yield bytes(buffer[:chunk_size])
+            del buffer[:chunk_size]
+    if buffer:
+        yield bytes(buffer)
+
+
+def iter_chunks(source, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yield fixed-size plaintext chunks from a data source.
+
+    Args:
+        source: bytes-like object, file path (memory-mapped), binary file
+                object or an iterable of byte strings
+        chunk_size: Chunk size in bytes (the last chunk may be shorter)
+
+    Yields:
+        Chunks of at most chunk_size bytes; zero-copy memoryview slices for
+        bytes-like and file path sources
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source)
+        for offset in range(0, len(view), chunk_size):
+            yield view[offset:offset + chunk_size]
+    elif isinstance(source, (str, os.PathLike)):
+        with map_file(source) as view:
+            for offset in range(0, len(view), chunk_size):
+                yield view[offset:offset + chunk_size]
+    elif hasattr(source, "read"):
+        yield from iter(lambda: source.read(chunk_size), b"")
     else:
-        return benchmark_hybrid_encryption_pqc(algo_name, file_data)
+        yield from _rechunk(source, chunk_size)
+
+
+def _mark_last(chunks):
+    """Yield (chunk, is_last) pairs; an empty stream yields one empty final chunk."""
+    iterator = iter(chunks)
+    try:
+        current = next(iterator)
+    except StopIteration:
+        yield b"", True
+        return
+    for following in iterator:
+        yield current, False
+        current = following
+    yield current, True
+
+
+def encrypt_stream(aes_key, chunks, nonce_prefix, timings=None):
+    """
+    Encrypt a stream of plaintext chunks with AES-256-GCM.
+
+    Args:
+        aes_key: 32-byte AES key
+        chunks: Iterable of plaintext chunks
+        nonce_prefix: 7-byte random per-stream nonce prefix
+        timings: Optional list receiving the duration (ms) of every AEAD call
+
+    Yields:
+        Ciphertext chunks (plaintext chunk + 16-byte tag)
+    """
+    aesgcm = AESGCM(aes_key)
+    for counter, (chunk, last) in enumerate(_mark_last(chunks)):
+        nonce = stream_nonce(nonce_prefix, counter, last)
+        t0 = time.perf_counter()
+        ciphertext = aesgcm.encrypt(nonce, chunk, None)
+        if timings is not None:
+            timings.append((time.perf_counter() - t0) * 1000)
+        yield ciphertext
+
+
+def decrypt_stream(aes_key, ciphertext_chunks, nonce_prefix, timings=None):
+    """
+    Decrypt a stream produced by encrypt_stream.
+
+    Raises cryptography.exceptions.InvalidTag if any chunk was modified,
+    reordered or dropped, including truncation of the final chunk.
+
+    Args:
+        aes_key: 32-byte AES key
+        ciphertext_chunks: Iterable of ciphertext chunks (chunk_size + 16 bytes)
+        nonce_prefix: 7-byte nonce prefix used for encryption
+        timings: Optional list receiving the duration (ms) of every AEAD call
+
+    Yields:
+        Plaintext chunks
+    """
+    aesgcm = AESGCM(aes_key)
+    for counter, (chunk, last) in enumerate(_mark_last(ciphertext_chunks)):
+        nonce = stream_nonce(nonce_prefix, counter, last)
+        t0 = time.perf_counter()
+        plaintext = aesgcm.decrypt(nonce, chunk, None)
+        if timings is not None:
+            timings.append((time.perf_counter() - t0) * 1000)
+        yield plaintext
+
+
+def _hashed(chunks, digest):
+    """Pass chunks through while feeding them into a running hash."""
+    for chunk in chunks:
+        digest.update(chunk)
+        yield chunk
+
+
+def benchmark_hybrid_encryption_streaming(algo_name, source, chunk_size=DEFAULT_CHUNK_SIZE, threads=1):
+    """
+    Benchmark hybrid encryption of a stream in fixed-size AES-256-GCM chunks.
+
+    The ciphertext is spooled to a temporary file and decrypted back chunk by
+    chunk, so peak memory stays at a few chunk sizes regardless of the input
+    size. The round trip is checked by comparing SHA-256 digests. AES timings
+    are the sum of the AEAD calls only (file I/O is excluded); with threads > 1
+    chunks are processed by parallel_encryption and AES timings are wall-clock.
+
+    Args:
+        algo_name: KEM algorithm (RSA-* or a liboqs KEM)
+        source: bytes-like object, file path, binary file object or iterable
+                of byte strings (see iter_chunks)
+        chunk_size: Plaintext chunk size in bytes
+        threads: Number of threads encrypting/decrypting chunks
+
+    Returns:
+        Dictionary with the same timing and size keys as
+        benchmark_hybrid_encryption plus chunk statistics and AES throughput
+    """
+    kem = exchange_aes_key(algo_name)
+    nonce_prefix = os.urandom(NONCE_PREFIX_SIZE)
+
+    enc_timings = []
+    dec_timings = []
+    plaintext_digest = hashlib.sha256()
+    recovered_digest = hashlib.sha256()
+    file_size = 0
+    ciphertext_size = 0
+    chunk_count = 0
+
+    if threads > 1:
+        import parallel_encryption
+        encrypt = lambda key, chunks: parallel_encryption.encrypt_stream_parallel(key, chunks, nonce_prefix, threads)
+        decrypt = lambda key, chunks: parallel_encryption.decrypt_stream_parallel(key, chunks, nonce_prefix, threads)
+    else:
+        encrypt = lambda key, chunks: encrypt_stream(key, chunks, nonce_prefix, enc_timings)
+        decrypt = lambda key, chunks: decrypt_stream(key, chunks, nonce_prefix, dec_timings)
+
+    with tempfile.TemporaryFile() as spool:
+        plaintext = _hashed(iter_chunks(source, chunk_size), plaintext_digest)
+        t0 = time.perf_counter()
+        for ciphertext in encrypt(kem["aes_key"], plaintext):
+            spool.write(ciphertext)
+            ciphertext_size += len(ciphertext)
+            file_size += len(ciphertext) - GCM_TAG_SIZE
+            chunk_count += 1
+        t_enc_wall = (time.perf_counter() - t0) * 1000
+
+        spool.seek(0)
+        ciphertext_chunks = iter(lambda: spool.read(chunk_size + GCM_TAG_SIZE), b"")
+        t0 = time.perf_counter()
+        for chunk in decrypt(kem["recovered_key"], ciphertext_chunks):
+            recovered_digest.update(chunk)
+        t_dec_wall = (time.perf_counter() - t0) * 1000
+
+    assert kem["recovered_key"] == kem["aes_key"]
+    assert recovered_digest.digest() == plaintext_digest.digest()
+
+    t_aes_enc = sum(enc_timings) if threads <= 1 else t_enc_wall
+    t_aes_dec = sum(dec_timings) if threads <= 1 else t_dec_wall
+    t_gen, t_encaps, t_decaps = kem["KeyGen (ms)"], kem["KEM Encaps (ms)"], kem["KEM Decaps (ms)"]
+    overhead = kem["KEM CT Size (B)"] + (ciphertext_size - file_size) + NONCE_PREFIX_SIZE
+
+    return {
+        "KeyGen (ms)": t_gen,
+        "KEM Encaps (ms)": t_encaps,
+        "KEM Decaps (ms)": t_decaps,
+        "AES Encrypt (ms)": t_aes_enc,
+        "AES Decrypt (ms)": t_aes_dec,
+        "Total Encrypt (ms)": t_encaps + t_aes_enc,
+        "Total Decrypt (ms)": t_decaps + t_aes_dec,
+        "Total Time (ms)": t_gen + t_encaps + t_decaps + t_aes_enc + t_aes_dec,
+        "PK Size (B)": kem["PK Size (B)"],
+        "SK Size (B)": kem["SK Size (B)"],
+        "KEM CT Size (B)": kem["KEM CT Size (B)"],
+        "File Size (B)": file_size,
+        "Ciphertext Size (B)": ciphertext_size,
+        "Total Overhead (B)": overhead,
+        "Overhead (%)": (overhead / file_size) * 100 if file_size > 0 else 0,
+        "Chunk Size (B)": chunk_size,
+        "Chunks": chunk_count,
+        "Threads": threads,
+        "AES Encrypt (MB/s)": (file_size / 1e6) / (t_aes_enc / 1000) if t_aes_enc > 0 else 0,
+        "AES Decrypt (MB/s)": (file_size / 1e6) / (t_aes_dec / 1000) if t_aes_dec > 0 else 0,
+    }
+
+
+def benchmark_hybrid_encryption_file(algo_name, path, chunk_size=None, threads=1):
+    """
+    Benchmark hybrid encryption of a file on disk without reading it into memory.
+
+    The file is memory-mapped and passed to AES-GCM as a memoryview. With
+    chunk_size set the streaming mode is used, which is required for files
+    larger than a single AES-GCM call accepts (2 GiB).
+    """
+    if chunk_size:
+        return benchmark_hybrid_encryption_streaming(algo_name, path, chunk_size, threads)
+    with map_file(path) as file_data:
+        return benchmark_hybrid_encryption(algo_name, file_data)
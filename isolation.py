@@ -0,0 +1,152 @@
+"""
+Isolated benchmark execution and measurement noise detection.
+Runs a benchmark job in a dedicated worker process, pinned to one CPU and
+with the garbage collector disabled, so that the Streamlit server (websocket
+handling, Plotly serialization, GC of UI objects) does not share a process
+with the timed code. Also reports system settings known to add noise.
+"""
+
+import os
+import gc
+import glob
+import multiprocessing
+from contextlib import contextmanager
+
+import benchmark_engine
+
+
+CPUFREQ_ROOT = "/sys/devices/system/cpu"
+
+
+@contextmanager
+def gc_disabled():
+    """Run a block after a full collection with the garbage collector disabled."""
+    was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _read(path):
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def get_noise_report(cpus=None):
+    """
+    Detect system settings that make benchmark timings noisy.
+
+    Args:
+        cpus: CPU ids to inspect (default: all CPUs this process may use)
+
+    Returns:
+        Dictionary with 'governors' ({cpu: governor}), 'turbo' (True, False
+        or None if unknown), 'smt' (same), 'load_average' (1/5/15 min tuple
+        or None), 'cpu_count' and 'warnings' (list of human-readable issues)
+    """
+    if cpus is None:
+        cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else range(os.cpu_count() or 1)
+    cpu_count = len(cpus)
+
+    governors = {}
+    for cpu in cpus:
+        governor = _read(f"{CPUFREQ_ROOT}/cpu{cpu}/cpufreq/scaling_governor")
+        if governor is not None:
+            governors[cpu] = governor
+
+    # intel_pstate exposes no_turbo, acpi-cpufreq / amd-pstate expose boost
+    turbo = None
+    no_turbo = _read(f"{CPUFREQ_ROOT}/intel_pstate/no_turbo")
+    if no_turbo is not None:
+        turbo = no_turbo == "0"
+    else:
+        boost = _read(f"{CPUFREQ_ROOT}/cpufreq/boost")
+        if boost is not None:
+            turbo = boost == "1"
+
+    smt_active = _read(f"{CPUFREQ_ROOT}/smt/active")
+    smt = None if smt_active is None else smt_active == "1"
+
+    load_average = os.getloadavg() if hasattr(os, "getloadavg") else None
+
+    warnings = []
+    not_performance = sorted({g for g in governors.values() if g != "performance"})
+    if not_performance:
+        warnings.append(f"CPU frequency governor is '{', '.join(not_performance)}' instead of 'performance'; "
+                        "frequency scaling changes per-operation times")
+    if turbo:
+        warnings.append("Turbo boost is enabled; clock speed depends on temperature and active cores")
+    if smt:
+        warnings.append("SMT (hyper-threading) is active; a sibling thread can share the benchmark core")
+    if load_average is not None and load_average[0] > 0.5 * cpu_count:
+        warnings.append(f"1-minute load average is {load_average[0]:.2f} on {cpu_count} CPU(s); "
+                        "other processes compete for the CPU")
+    if not governors and not glob.glob(f"{CPUFREQ_ROOT}/cpu*/cpufreq"):
+        warnings.append("CPU frequency settings are not visible (virtual machine or container); "
+                        "the host may scale frequency or migrate vCPUs")
+
+    return {
+        "governors": governors,
+        "turbo": turbo,
+        "smt": smt,
+        "load_average": load_average,
+        "cpu_count": cpu_count,
+        "warnings": warnings,
+    }
+
+
+def _isolated_worker(conn, job, cpu):
+    """Worker process body: pin, disable GC, benchmark and send the outcome back."""
+    try:
+        if cpu is not None and hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, {cpu})
+        with gc_disabled():
+            result = benchmark_engine.benchmark_algorithm(**job)
+        conn.send((result, None))
+    except Exception as e:
+        conn.send((None, str(e)))
+    finally:
+        conn.close()
+
+
+def run_isolated(job, cpu=None, timeout=None):
+    """
+    Run one benchmark job in a fresh worker process.
+
+    The worker pins itself to `cpu`, runs benchmark_engine.benchmark_algorithm
+    with the garbage collector disabled (after a full collection, so no
+    collection pause lands in a timed region) and returns its outcome over
+    a pipe.
+
+    Args:
+        job: Keyword arguments for benchmark_engine.benchmark_algorithm
+        cpu: CPU id to pin the worker to (default: not pinned)
+        timeout: Seconds to wait for the result before the worker is killed
+
+    Returns:
+        Tuple (result, error message) as runner.run_benchmark_jobs expects
+    """
+    parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=_isolated_worker, args=(child_conn, job, cpu),
+                                      name=f"benchmark-{job.get('algo', '')}", daemon=True)
+    process.start()
+    child_conn.close()
+    try:
+        if not parent_conn.poll(timeout):
+            return None, f"Isolated worker timed out after {timeout} s"
+        return parent_conn.recv()
+    except EOFError:
+        process.join()
+        return None, f"Isolated worker exited with code {process.exitcode}"
+    finally:
+        parent_conn.close()
+        if process.is_alive():
+            process.terminate()
+        process.join()
@@ -0,0 +1,137 @@
+"""
+Background benchmark jobs.
+Runs benchmark sweeps on a worker thread so that Streamlit reruns triggered
+by widget interaction neither block on nor restart a running sweep. The UI
+keeps a JobManager in st.session_state and polls job progress.
+"""
+
+import time
+import uuid
+import threading
+
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+
+class Job:
+    """
+    State of one background job.
+
+    The target function receives the Job as its first argument and reports
+    through report() / warn(); it should check `cancel_event` between units
+    of work and return early once it is set.
+    """
+
+    def __init__(self, target, args=(), kwargs=None, description=""):
+        self.id = uuid.uuid4().hex[:8]
+        self.description = description
+        self.status = PENDING
+        self.progress = 0.0
+        self.message = ""
+        self.warnings = []
+        self.result = None
+        self.error = None
+        self.created = time.time()
+        self.finished = None
+        self.cancel_event = threading.Event()
+        self._lock = threading.Lock()
+        self._target = target
+        self._args = args
+        self._kwargs = kwargs or {}
+        self._thread = None
+
+    def start(self):
+        """Start the job on a daemon thread."""
+        self._thread = threading.Thread(target=self._run, name=f"benchmark-job-{self.id}", daemon=True)
+        self.status = RUNNING
+        self._thread.start()
+
+    def _run(self):
+        try:
+            result = self._target(self, *self._args, **self._kwargs)
+            with self._lock:
+                self.result = result
+                self.status = CANCELLED if self.cancel_event.is_set() else DONE
+        except Exception as e:
+            with self._lock:
+                self.error = str(e)
+                self.status = FAILED
+        finally:
+            self.finished = time.time()
+
+    def report(self, progress, message=None):
+        """Update the progress fraction (0-1) and optional status message."""
+        with self._lock:
+            self.progress = max(0.0, min(1.0, progress))
+            if message is not None:
+                self.message = message
+
+    def warn(self, message):
+        """Record a non-fatal warning to show once the job is finished."""
+        with self._lock:
+            self.warnings.append(message)
+
+    def cancel(self):
+        """Ask the job to stop; results collected so far are kept."""
+        self.cancel_event.set()
+
+    @property
+    def done(self):
+        """True once the job has finished, failed or been cancelled."""
+        return self.status in (DONE, FAILED, CANCELLED)
+
+    @property
+    def elapsed(self):
+        """Seconds since the job was created (until it finished)."""
+        return (self.finished or time.time()) - self.created
+
+    def wait(self, timeout=None):
+        """Block until the job finishes; returns True if it did."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.done
+
+
+class JobManager:
+    """Submits background jobs and keeps the most recent ones for lookup."""
+
+    def __init__(self, max_jobs=10):
+        self.max_jobs = max_jobs
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, target, *args, description="", **kwargs):
+        """
+        Start target(job, *args, **kwargs) in the background.
+
+        Returns:
+            The started Job
+        """
+        job = Job(target, args, kwargs, description)
+        with self._lock:
+            self._jobs[job.id] = job
+            finished = [j for j in self._jobs.values() if j.done]
+            for old in finished[:max(0, len(self._jobs) - self.max_jobs)]:
+                del self._jobs[old.id]
+        job.start()
+        return job
+
+    def get(self, job_id):
+        """Return the job with this ID, or None."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id):
+        """Request cancellation of a job."""
+        job = self.get(job_id)
+        if job is not None:
+            job.cancel()
+
+    def active(self):
+        """Return the jobs that are still running."""
+        with self._lock:
+            return [job for job in self._jobs.values() if not job.done]
@@ -1,5 +1,8 @@
+import time
+_script_start = time.perf_counter()
+
 import os
-import tempfile
+import sys
 import json
 
 # Use home directory instead of /tmp to avoid "No space left on device" in Docker
@@ -11,20 +14,19 @@ except OSError:
     # If can't create matplotlib cache, continue anyway (matplotlib will use default)
     pass
 
+# Only what the sidebar needs is imported up front; the benchmark engine
+# (and numpy) is imported by the job that runs it, pandas, plotly and the
+# analysis modules where results are first rendered, and mode-specific
+# modules in the sidebar branch that uses them
 import streamlit as st
-import pandas as pd
-import numpy as np
-import json
-import plotly.express as px
-import plotly.graph_objects as go
 import classic_algo
 import pqc_algo
-import hybrid_encryption
-import scenarios
-import statistics_utils
 import export_utils
-import analysis_utils
 import translations
+import runner
+import payloads
+
+_imports_done = time.perf_counter()
 
 st.set_page_config(page_title="PQC vs Classic Crypto Benchmark", layout="wide", page_icon="🔐")
 
@@ -76,7 +78,9 @@ mode_map = {
     t['mode_kem']: "KEM (Key Exchange Only)",
     t['mode_signatures']: "Digital Signatures",
     t['mode_hybrid']: "Hybrid Encryption (KEM+AES)",
-    t['mode_scenarios']: "Real-World Scenarios"
+    t['mode_scenarios']: "Real-World Scenarios",
+    t['mode_scaling']: "Multi-core Scaling",
+    t['mode_parallel']: "Parallel Encryption"
 }
 
 mode_display = st.sidebar.radio(
@@ -85,11 +89,32 @@ mode_display = st.sidebar.radio(
     help=t['select_scenario']
 )
 mode = mode_map[mode_display]
+is_standard_mode = mode not in ("Real-World Scenarios", "Multi-core Scaling", "Parallel Encryption")
 
 st.sidebar.divider()
 
+@st.cache_resource(show_spinner=False)
+def get_payload_cache():
+    """Process-wide payload cache shared by all sessions, bounded by total bytes rather than entries."""
+    return payloads.PayloadCache(payloads.PAYLOAD_CACHE_BYTES)
+
+
+def get_payload(size, seed):
+    """Seeded payload shared across reruns; bytes are immutable, so no per-rerun copy is needed."""
+    return get_payload_cache().get(size, seed)
+
+
+payload_seed = payloads.DEFAULT_PAYLOAD_SEED
+if mode != "KEM (Key Exchange Only)":
+    payload_seed = int(st.sidebar.number_input(t['payload_seed'], 0, 2**31 - 1, payloads.DEFAULT_PAYLOAD_SEED,
+                                               help=t['payload_seed_help']))
+
 # Input configuration based on mode
 payload_bytes = b""
+chunk_size = None
+file_path = None
+encryption_threads = 1
+scenario_options = {}
 
 if mode == "KEM (Key Exchange Only)":
     st.sidebar.info(t['mode_kem_desc'])
@@ -101,7 +126,7 @@ elif mode == "Digital Signatures":
     
     if data_source == t['random_generated']:
         size_kb = st.sidebar.slider(t['message_size_kb'], 1, 1024, 10)
-        payload_bytes = os.urandom(size_kb * 1024)
+        payload_bytes = get_payload(size_kb * 1024, payload_seed)
         st.sidebar.success(f"{t['generated']} {size_kb} KB")
     else:
         uploaded_file = st.sidebar.file_uploader(t['upload_file_sign'], type=None)
@@ -110,18 +135,28 @@ elif mode == "Digital Signatures":
             st.sidebar.success(f"{t['loaded']} {len(payload_bytes)/1024:.2f} KB")
         else:
             st.sidebar.warning(f"{t['no_file_uploaded']} 1KB")
-            payload_bytes = os.urandom(1024)
+            payload_bytes = get_payload(1024, payload_seed)
             
 elif mode == "Hybrid Encryption (KEM+AES)":
     st.sidebar.info(t['mode_hybrid_desc'])
     
-    data_source = st.sidebar.radio(t['file_source'], [t['random_generated'], t['upload_file']])
+    data_source = st.sidebar.radio(t['file_source'], [t['random_generated'], t['upload_file'], t['local_file_path']])
     
     if data_source == t['random_generated']:
         size_options = [1, 10, 100, 500, 1024, 5120, 10240]
         size_kb = st.sidebar.select_slider(t['file_size_kb'], options=size_options, value=100)
-        payload_bytes = os.urandom(size_kb * 1024)
+        payload_bytes = get_payload(size_kb * 1024, payload_seed)
         st.sidebar.success(f"{t['generated']} {size_kb} KB")
+    elif data_source == t['local_file_path']:
+        path_input = st.sidebar.text_input(t['file_path'], help=t['file_path_help'])
+        if path_input and os.path.isfile(path_input):
+            file_path = path_input
+            st.sidebar.success(f"{t['mapped']} {os.path.getsize(file_path)/1024:.2f} KB")
+        else:
+            if path_input:
+                st.sidebar.error(t['file_not_found'])
+            st.sidebar.warning(f"{t['no_file_uploaded']} 100KB")
+            payload_bytes = get_payload(102400, payload_seed)
     else:
         uploaded_file = st.sidebar.file_uploader(t['upload_file_encrypt'], type=None)
         if uploaded_file is not None:
@@ -129,16 +164,24 @@ elif mode == "Hybrid Encryption (KEM+AES)":
             st.sidebar.success(f"{t['loaded']} {len(payload_bytes)/1024:.2f} KB")
         else:
             st.sidebar.warning(f"{t['no_file_uploaded']} 100KB")
-            payload_bytes = os.urandom(102400)
+            payload_bytes = get_payload(102400, payload_seed)
+    
+    if st.sidebar.checkbox(t['streaming_mode'], value=False, help=t['streaming_mode_help']):
+        chunk_kb = st.sidebar.select_slider(t['chunk_size_kb'], options=[64, 256, 1024, 4096, 16384], value=1024)
+        chunk_size = chunk_kb * 1024
+        encryption_threads = st.sidebar.slider(t['encryption_threads'], 1, os.cpu_count() or 1, 1,
+                                               help=t['encryption_threads_help'])
             
 elif mode == "Real-World Scenarios":
     st.sidebar.info(t['mode_scenarios_desc'])
     
     scenario_map = {
         t['scenario_tls']: "TLS 1.3 Handshake",
+        t['scenario_tls_load']: "TLS Handshake Load",
         t['scenario_email']: "Secure Email (S/MIME)",
         t['scenario_vpn']: "VPN Session",
-        t['scenario_code']: "Code Signing"
+        t['scenario_code']: "Code Signing",
+        t['scenario_messaging']: "Secure Messaging"
     }
     
     scenario_display = st.sidebar.selectbox(
@@ -147,26 +190,184 @@ elif mode == "Real-World Scenarios":
     )
     scenario = scenario_map[scenario_display]
     
-    if scenario == "Secure Email (S/MIME)":
+    if scenario in ("TLS 1.3 Handshake", "Secure Email (S/MIME)", "VPN Session"):
+        import network_model
+        scenario_options['link_profile'] = st.sidebar.selectbox(
+            t['link_profile'], list(network_model.LINK_PROFILES),
+            index=list(network_model.LINK_PROFILES).index(network_model.DEFAULT_LINK_PROFILE),
+            format_func=lambda name: f"{name} ({network_model.LINK_PROFILES[name]['bandwidth_mbps']} Mbit/s, "
+                                     f"{network_model.LINK_PROFILES[name]['rtt_ms']} ms RTT)",
+            help=t['link_profile_help'])
+    
+    if scenario == "TLS Handshake Load":
+        import tls_load
+        scenario_options['concurrency_levels'] = sorted(st.sidebar.multiselect(
+            t['concurrency_levels'], [1, 2, 4, 8, 16, 32, 64, 128, 256],
+            default=tls_load.DEFAULT_CONCURRENCY_LEVELS, help=t['concurrency_levels_help']))
+        scenario_options['duration'] = st.sidebar.slider(t['load_duration'], 0.5, 10.0, 2.0, 0.5)
+        payload_bytes = get_payload(1024, payload_seed)
+    elif scenario == "Secure Email (S/MIME)":
         msg_size = st.sidebar.slider(t['email_size'], 1, 1024, 10)
-        payload_bytes = os.urandom(msg_size * 1024)
+        payload_bytes = get_payload(msg_size * 1024, payload_seed)
+    elif scenario == "VPN Session":
+        scenario_options['packet_count'] = st.sidebar.select_slider(
+            t['vpn_packets'], options=[10000, 100000, 500000, 1000000, 5000000], value=100000)
+        scenario_options['packet_size'] = st.sidebar.select_slider(
+            t['vpn_packet_size'], options=[64, 256, 512, 1024, 1400], value=1400)
+        scenario_options['rekey_interval'] = st.sidebar.select_slider(
+            t['rekey_interval'], options=[1000, 10000, 50000, 100000, 1000000], value=10000,
+            help=t['rekey_interval_help'])
+        payload_bytes = get_payload(1024, payload_seed)
+    elif scenario == "Secure Messaging":
+        msg_size = st.sidebar.select_slider(t['chat_message_size'], options=[64, 256, 1024, 4096, 16384], value=256)
+        payload_bytes = get_payload(msg_size, payload_seed)
+        scenario_options['message_count'] = st.sidebar.select_slider(
+            t['message_count'], options=[1000, 2000, 5000, 10000, 20000, 50000], value=5000)
+        scenario_options['ratchet_interval'] = st.sidebar.select_slider(
+            t['ratchet_interval'], options=[1, 10, 50, 100, 500, 1000], value=100, help=t['ratchet_interval_help'])
     elif scenario == "Code Signing":
-        file_size_mb = st.sidebar.slider(t['file_size_mb'], 1, 100, 1)
-        payload_bytes = os.urandom(file_size_mb * 1024 * 1024)
+        data_source = st.sidebar.radio(t['file_source'], [t['random_generated'], t['local_file_path']])
+        if data_source == t['local_file_path']:
+            path_input = st.sidebar.text_input(t['file_path'], help=t['file_path_help'])
+            if path_input and os.path.isfile(path_input):
+                file_path = path_input
+                st.sidebar.success(f"{t['mapped']} {os.path.getsize(file_path)/1024:.2f} KB")
+            elif path_input:
+                st.sidebar.error(t['file_not_found'])
+        if file_path is None:
+            file_size_mb = st.sidebar.slider(t['file_size_mb'], 1, 100, 1)
+            payload_bytes = get_payload(file_size_mb * 1024 * 1024, payload_seed)
     else:
-        payload_bytes = os.urandom(1024)
+        payload_bytes = get_payload(1024, payload_seed)
+
+elif mode == "Multi-core Scaling":
+    import scaling
+    st.sidebar.info(t['mode_scaling_desc'])
+    
+    scaling_kind_map = {
+        t['mode_kem']: "KEM (Key Exchange Only)",
+        t['mode_signatures']: "Digital Signatures"
+    }
+    scaling_kind = st.sidebar.radio(t['scaling_operation_type'], list(scaling_kind_map.keys()))
+    scaling_mode = scaling_kind_map[scaling_kind]
+    scaling_operation = st.sidebar.selectbox(t['scaling_operation'], scaling.get_operations(scaling_mode))
+    payload_bytes = b"x" * 32 if scaling_mode.startswith("KEM") else get_payload(1024, payload_seed)
+
+elif mode == "Parallel Encryption":
+    st.sidebar.info(t['mode_parallel_desc'])
+    
+    data_source = st.sidebar.radio(t['file_source'], [t['random_generated'], t['local_file_path']])
+    if data_source == t['local_file_path']:
+        path_input = st.sidebar.text_input(t['file_path'], help=t['file_path_help'])
+        if path_input and os.path.isfile(path_input):
+            file_path = path_input
+            st.sidebar.success(f"{t['mapped']} {os.path.getsize(file_path)/1024:.2f} KB")
+        elif path_input:
+            st.sidebar.error(t['file_not_found'])
+    if file_path is None:
+        file_size_mb = st.sidebar.select_slider(t['file_size_mb'], options=[16, 64, 256], value=64)
+        payload_bytes = get_payload(file_size_mb * 1024 * 1024, payload_seed)
+    chunk_kb = st.sidebar.select_slider(t['chunk_size_kb'], options=[64, 256, 1024, 4096, 16384], value=1024)
+    chunk_size = chunk_kb * 1024
 
 st.sidebar.divider()
 
 # Algorithm Selection
 st.sidebar.subheader(t['algo_selection'])
 
-iterations = st.sidebar.number_input(t['iterations'], 5, 500, 20, 
-                                     help=t['iterations_help'])
+iterations = 0
+if mode not in ("Multi-core Scaling", "Parallel Encryption"):
+    iterations = st.sidebar.number_input(t['iterations'], 5, 500, 20, 
+                                         help=t['iterations_help'])
+
+iteration_mode = "roundtrip"
+keypairs = 1
+time_budget = 1.0
+precision = 0.02
+if is_standard_mode:
+    iteration_mode_map = {
+        t['iteration_mode_roundtrip']: "roundtrip",
+        t['iteration_mode_operation']: "operation",
+        t['iteration_mode_throughput']: "throughput",
+        t['iteration_mode_adaptive']: "adaptive"
+    }
+    iteration_mode_display = st.sidebar.radio(
+        t['iteration_mode'],
+        list(iteration_mode_map.keys()),
+        help=t['iteration_mode_help']
+    )
+    iteration_mode = iteration_mode_map[iteration_mode_display]
+    if iteration_mode == "operation":
+        keypairs = st.sidebar.number_input(t['keypairs'], 1, 10, 1, help=t['keypairs_help'])
+    elif iteration_mode == "throughput":
+        time_budget = st.sidebar.slider(t['time_budget'], 0.1, 10.0, 1.0, step=0.1, help=t['time_budget_help'])
+    elif iteration_mode == "adaptive":
+        precision = st.sidebar.slider(t['target_precision'], 0.5, 10.0, 2.0, step=0.5,
+                                      help=t['target_precision_help']) / 100
+        time_budget = st.sidebar.slider(t['time_budget'], 0.1, 10.0, 1.0, step=0.1, help=t['time_budget_help'])
+
+context_pool = True
+report_setup = False
+if is_standard_mode and iteration_mode == "roundtrip" and not mode.startswith("Hybrid"):
+    context_pool = st.sidebar.checkbox(t['context_pool'], value=True, help=t['context_pool_help'])
+    report_setup = st.sidebar.checkbox(t['report_setup'], value=False, help=t['report_setup_help'])
+
+warmup = True
+timer = None
+count_cycles = False
+if is_standard_mode:
+    import timers
+    timer = timers.DEFAULT_TIMER
+    warmup = st.sidebar.checkbox(t['warmup'], value=True, help=t['warmup_help'])
+    if iteration_mode != "roundtrip":
+        timer_map = {
+            t['timer_perf_counter']: "perf_counter",
+            t['timer_process_time']: "process_time",
+            t['timer_thread_time']: "thread_time",
+        }
+        timer = timer_map[st.sidebar.selectbox(t['timer'], list(timer_map.keys()), help=t['timer_help'])]
+        cycles_available = timers.cycle_counter_available()
+        count_cycles = st.sidebar.checkbox(t['count_cycles'], value=cycles_available,
+                                           disabled=not cycles_available,
+                                           help=t['count_cycles_help'] if cycles_available else t['cycles_unavailable'])
+
+parallel_workers = 1
+pin_cpus = False
+if is_standard_mode:
+    parallel_workers = st.sidebar.number_input(t['workers'], 1, len(runner.get_available_cpus()), 1,
+                                               help=t['workers_help'])
+    if parallel_workers > 1:
+        pin_cpus = st.sidebar.checkbox(t['pin_cpus'], value=False, help=t['pin_cpus_help'])
+
+isolate = False
+isolate_cpu = None
+if is_standard_mode and parallel_workers == 1:
+    isolate = st.sidebar.checkbox(t['isolate'], value=False, help=t['isolate_help'])
+    if isolate:
+        isolate_cpu = st.sidebar.selectbox(t['isolate_cpu'], runner.get_available_cpus(),
+                                           index=len(runner.get_available_cpus()) - 1,
+                                           help=t['isolate_cpu_help'])
+
+scaling_backends = []
+if mode == "Multi-core Scaling":
+    max_cpus = len(runner.get_available_cpus())
+    scaling_max_workers = st.sidebar.slider(t['scaling_max_workers'], 1, max_cpus, max_cpus)
+    scaling_backend_map = {t['backend_process']: "process", t['backend_thread']: "thread"}
+    sel_backends = st.sidebar.multiselect(t['scaling_backends'], list(scaling_backend_map.keys()),
+                                          default=list(scaling_backend_map.keys()),
+                                          help=t['scaling_backends_help'])
+    scaling_backends = [scaling_backend_map[b] for b in sel_backends]
+    time_budget = st.sidebar.slider(t['time_budget'], 0.1, 10.0, 1.0, step=0.1, help=t['time_budget_help'])
+
+if mode == "Parallel Encryption":
+    max_threads = os.cpu_count() or 1
+    encryption_threads = st.sidebar.slider(t['max_threads'], 1, max_threads, max_threads,
+                                           help=t['max_threads_help'])
 
 selected_algos = []
 selected_kem = []
 selected_sig = []
+algo_mode = scaling_mode if mode == "Multi-core Scaling" else mode
 
 if mode == "Real-World Scenarios":
     st.sidebar.markdown(f"**{t['classic_kem']}**")
@@ -187,7 +388,10 @@ if mode == "Real-World Scenarios":
     
     selected_sig = sel_classic_sig + sel_pqc_sig
     
-elif mode.startswith("KEM") or mode.startswith("Hybrid"):
+elif mode == "Parallel Encryption":
+    st.sidebar.caption(t['parallel_algo_fixed'])
+
+elif algo_mode.startswith("KEM") or algo_mode.startswith("Hybrid"):
     st.sidebar.markdown(f"**{t['classic_kem']}**")
     classic_opts = classic_algo.get_rsa_options()
     sel_classic = st.sidebar.multiselect(t['rsa_sizes'], classic_opts, default=["RSA-2048"])
@@ -212,222 +416,280 @@ else:  # Digital Signatures
 
 st.sidebar.divider()
 
+save_history = st.sidebar.checkbox(t['save_history'], value=False, help=t['save_history_help'])
+history_label = st.sidebar.text_input(t['history_label']) if save_history else None
+
 # Run button
 run_button = st.sidebar.button(t['run_benchmark'], type="primary", use_container_width=True)
 
 # ========== MAIN CONTENT ==========
 
-if run_button:
-    # Validate selection
-    if mode == "Real-World Scenarios":
-        if not selected_kem or not selected_sig:
-            st.error(t['error_select_kem_sig'])
-            st.stop()
-    else:
-        if not selected_algos:
-            st.error(t['error_select_algos'])
-            st.stop()
-    
-    # Progress tracking
-    st.header(t['running_benchmarks'])
-    progress_bar = st.progress(0)
-    status_text = st.empty()
+def run_benchmark_job(job, params, t):
+    """
+    Background job body: run the configured sweep and return its results.
     
+    Runs on a worker thread, so it reports through the job instead of
+    calling Streamlit.
+    """
+    mode = params['mode']
     results = []
     raw_measurements = {}  # For statistical analysis
+    histograms = {}  # Latency distributions (HdrHistogram per operation)
+    statistics_df = None  # Per-metric statistics with bootstrap confidence intervals
+    
+    import isolation
+    import benchmark_engine
+    noise_report = isolation.get_noise_report()
     
     # Run benchmarks based on mode
     if mode == "Real-World Scenarios":
-        total_tests = len(selected_kem) * len(selected_sig)
-        idx = 0
+        def on_scenario_complete(done, total, kem, sig, error):
+            if error is not None:
+                job.warn(f"{t['failed_to_test']} {kem} + {sig}: {error}")
+            job.report(done / total, f"{t['testing']} {done}/{total}: {kem} + {sig}")
+        
+        results, _ = benchmark_engine.run_scenarios(params['scenario'], params['selected_kem'], params['selected_sig'],
+                                                    params['payload_bytes'], params['file_path'],
+                                                    on_complete=on_scenario_complete, cancel_event=job.cancel_event,
+                                                    options=params['scenario_options'])
+    
+    elif mode == "Multi-core Scaling":
+        import scaling
+        worker_counts = scaling.get_worker_counts(params['scaling_max_workers'])
+        total_steps = len(params['selected_algos']) * len(params['scaling_backends']) * len(worker_counts)
+        step = 0
         
-        for kem in selected_kem:
-            for sig in selected_sig:
-                idx += 1
-                status_text.text(f"{t['testing']} {idx}/{total_tests}: {kem} + {sig}")
+        for algo in params['selected_algos']:
+            for backend in params['scaling_backends']:
+                def on_step(workers):
+                    job.report(step / total_steps,
+                               f"{t['testing']} {algo} ({params['scaling_operation']}, {backend}): {workers} {t['workers_short']}")
                 
                 try:
-                    if scenario == "TLS 1.3 Handshake":
-                        result = scenarios.benchmark_tls_handshake(kem, sig)
-                    elif scenario == "Secure Email (S/MIME)":
-                        result = scenarios.benchmark_secure_email(sig, kem, len(payload_bytes))
-                    elif scenario == "VPN Session":
-                        result = scenarios.benchmark_vpn_session(kem, sig, 100)
-                    elif scenario == "Code Signing":
-                        result = scenarios.benchmark_code_signing(sig, len(payload_bytes))
-                    else:
-                        result = scenarios.benchmark_tls_handshake(kem, sig)
-                    
-                    # Add combined Algorithm column for visualization
-                    if "KEM Algorithm" in result and "Signature Algorithm" in result:
-                        result["Algorithm"] = f"{result['KEM Algorithm']} + {result['Signature Algorithm']}"
-                    elif "Signature Algorithm" in result:
-                        result["Algorithm"] = result["Signature Algorithm"]
-                    else:
-                        result["Algorithm"] = kem if kem else sig
-                    
-                    # Add Family for color coding
-                    is_pqc = any(pqc in kem for pqc in ["Kyber", "ML-KEM", "Dilithium", "ML-DSA", "Falcon", "SPHINCS"]) if kem else False
-                    is_pqc = is_pqc or (any(pqc in sig for pqc in ["Dilithium", "ML-DSA", "Falcon", "SPHINCS"]) if sig else False)
-                    result["Family"] = "Post-Quantum" if is_pqc else "Classic"
-                    
-                    results.append(result)
+                    rows = scaling.run_scaling_sweep(params['scaling_mode'], algo, params['payload_bytes'],
+                                                     params['scaling_operation'], worker_counts, backend,
+                                                     params['time_budget'], on_step=on_step,
+                                                     cancel_event=job.cancel_event)
+                    for row in rows:
+                        row["Family"] = "Classic" if ("RSA" in algo or "SECP" in algo) else "Post-Quantum"
+                    results.extend(rows)
                 except Exception as e:
-                    st.warning(f"{t['failed_to_test']} {kem} + {sig}: {e}")
+                    job.warn(f"{t['failed_to_benchmark']} {algo} ({backend}): {e}")
                 
-                progress_bar.progress(idx / total_tests)
+                step += len(worker_counts)
+                job.report(step / total_steps)
     
-    else:
-        # Regular benchmarks with multiple iterations
-        op_labels = ["Encaps", "Decaps"] if mode.startswith("KEM") or mode.startswith("Hybrid") else ["Sign", "Verify"]
+    elif mode == "Parallel Encryption":
+        import parallel_encryption
+        thread_counts = parallel_encryption.get_thread_counts(params['encryption_threads'])
         
-        for idx, algo in enumerate(selected_algos):
-            status_text.text(f"{t['testing']} {idx+1}/{len(selected_algos)}: {algo} ({iterations} {t['iterations'].lower()})")
-            
-            is_rsa = "RSA" in algo
-            is_ecc = "SECP" in algo
-            
-            acc = {"KG": [], "OP1": [], "OP2": []}
-            if mode.startswith("Hybrid"):
-                acc["AES_ENC"] = []
-                acc["AES_DEC"] = []
-            
-            meta = {}
-            
-            try:
-                for iter_num in range(iterations):
-                    if mode == "Hybrid Encryption (KEM+AES)":
-                        res = hybrid_encryption.benchmark_hybrid_encryption(algo, payload_bytes)
-                        acc["KG"].append(res["KeyGen (ms)"])
-                        acc["OP1"].append(res["KEM Encaps (ms)"])
-                        acc["OP2"].append(res["KEM Decaps (ms)"])
-                        acc["AES_ENC"].append(res["AES Encrypt (ms)"])
-                        acc["AES_DEC"].append(res["AES Decrypt (ms)"])
-                        
-                        meta = {
-                            "PK Size": res["PK Size (B)"],
-                            "SK Size": res["SK Size (B)"],
-                            "KEM CT Size": res["KEM CT Size (B)"],
-                            "File Size": res["File Size (B)"],
-                            "Ciphertext Size": res["Ciphertext Size (B)"],
-                            "Total Overhead": res["Total Overhead (B)"],
-                            "Overhead %": res["Overhead (%)"]
-                        }
-                    elif is_rsa:
-                        res = classic_algo.benchmark_rsa_kem(algo, payload_bytes)
-                        acc["KG"].append(res["KeyGen (ms)"])
-                        acc["OP1"].append(res[f"{op_labels[0]} (ms)"])
-                        acc["OP2"].append(res[f"{op_labels[1]} (ms)"])
-                        meta = {
-                            "PK Size": res["PK Size (B)"],
-                            "SK Size": res["SK Size (B)"],
-                            "Output Size": res["CT/Sig Size (B)"]
-                        }
-                    elif is_ecc:
-                        res = classic_algo.benchmark_ecdsa_sign(algo, payload_bytes)
-                        acc["KG"].append(res["KeyGen (ms)"])
-                        acc["OP1"].append(res[f"{op_labels[0]} (ms)"])
-                        acc["OP2"].append(res[f"{op_labels[1]} (ms)"])
-                        meta = {
-                            "PK Size": res["PK Size (B)"],
-                            "SK Size": res["SK Size (B)"],
-                            "Output Size": res["CT/Sig Size (B)"]
-                        }
-                    elif mode.startswith("KEM") or mode.startswith("Hybrid"):
-                        res = pqc_algo.benchmark_pqc_kem(algo, payload_bytes)
-                        acc["KG"].append(res["KeyGen (ms)"])
-                        acc["OP1"].append(res[f"{op_labels[0]} (ms)"])
-                        acc["OP2"].append(res[f"{op_labels[1]} (ms)"])
-                        meta = {
-                            "PK Size": res["PK Size (B)"],
-                            "SK Size": res["SK Size (B)"],
-                            "Output Size": res["CT/Sig Size (B)"]
-                        }
-                    else:
-                        res = pqc_algo.benchmark_pqc_sign(algo, payload_bytes)
-                        acc["KG"].append(res["KeyGen (ms)"])
-                        acc["OP1"].append(res[f"{op_labels[0]} (ms)"])
-                        acc["OP2"].append(res[f"{op_labels[1]} (ms)"])
-                        meta = {
-                            "PK Size": res["PK Size (B)"],
-                            "SK Size": res["SK Size (B)"],
-                            "Output Size": res["CT/Sig Size (B)"]
-                        }
-                
-                # Calculate statistics
-                kg_stats = statistics_utils.compute_statistics(acc["KG"])
-                op1_stats = statistics_utils.compute_statistics(acc["OP1"])
-                op2_stats = statistics_utils.compute_statistics(acc["OP2"])
-                
-                avg_res = {
-                    "Algorithm": algo,
-                    "Family": "Classic" if (is_rsa or is_ecc) else "Post-Quantum",
-                    "KeyGen (ms)": kg_stats["mean"],
-                    f"{op_labels[0]} (ms)": op1_stats["mean"],
-                    f"{op_labels[1]} (ms)": op2_stats["mean"],
-                    "Total Time (ms)": kg_stats["mean"] + op1_stats["mean"] + op2_stats["mean"],
-                }
-                
-                if mode.startswith("Hybrid"):
-                    aes_enc_stats = statistics_utils.compute_statistics(acc["AES_ENC"])
-                    aes_dec_stats = statistics_utils.compute_statistics(acc["AES_DEC"])
-                    avg_res["AES Encrypt (ms)"] = aes_enc_stats["mean"]
-                    avg_res["AES Decrypt (ms)"] = aes_dec_stats["mean"]
-                    avg_res["Total Encrypt (ms)"] = op1_stats["mean"] + aes_enc_stats["mean"]
-                    avg_res["Total Decrypt (ms)"] = op2_stats["mean"] + aes_dec_stats["mean"]
-                    avg_res["Total Time (ms)"] = (kg_stats["mean"] + op1_stats["mean"] + 
-                                                  op2_stats["mean"] + aes_enc_stats["mean"] + 
-                                                  aes_dec_stats["mean"])
-                
-                # Add statistical metrics
-                avg_res["KeyGen StdDev"] = kg_stats["std"]
-                avg_res["KeyGen P95"] = kg_stats["p95"]
-                avg_res["Consistency Score"] = statistics_utils.calculate_consistency_score(acc["KG"])
-                
-                # Add metadata
-                avg_res.update(meta)
-                
-                # Calculate bandwidth
-                if mode.startswith("Hybrid"):
-                    # For hybrid, Total Overhead (B) is already in meta from benchmark_hybrid_encryption
-                    # Use it if available, otherwise calculate from components
-                    if "Total Overhead (B)" in meta:
-                        avg_res["Total Bandwidth (B)"] = meta["Total Overhead (B)"]
-                    else:
-                        # Fallback: PK Size + KEM CT Size
-                        avg_res["Total Bandwidth (B)"] = meta.get("PK Size", 0) + meta.get("KEM CT Size", 0)
-                else:
-                    avg_res["Total Bandwidth (B)"] = meta.get("PK Size", 0) + meta.get("Output Size", 0)
-                
-                results.append(avg_res)
-                raw_measurements[algo] = acc
-                
-            except Exception as e:
-                st.warning(f"{t['failed_to_benchmark']} {algo}: {e}")
-            
-            progress_bar.progress((idx + 1) / len(selected_algos))
+        def on_step(threads):
+            job.report(thread_counts.index(threads) / len(thread_counts),
+                       f"{t['testing']} AES-256-GCM: {threads} {t['threads_short']}")
+        
+        results = parallel_encryption.benchmark_parallel_encryption(
+            params['file_path'] or params['payload_bytes'], thread_counts, params['chunk_size'],
+            on_step=on_step, cancel_event=job.cancel_event)
     
-    status_text.text(t['benchmark_complete'])
-    progress_bar.empty()
-    status_text.empty()
+    else:
+        # Regular benchmarks with multiple iterations, one job per algorithm
+        algos = params['selected_algos']
+        
+        def on_job_complete(done, bench_job, result, error):
+            if error is not None:
+                job.warn(f"{t['failed_to_benchmark']} {bench_job['algo']}: {error}")
+            job.report(done / len(algos),
+                       f"{t['testing']} {done}/{len(algos)}: {bench_job['algo']} ({params['iterations']} {t['iterations'].lower()})")
+        
+        results, raw_measurements, histograms, _ = benchmark_engine.run_benchmark(
+            mode, algos, params['payload_bytes'], params['iterations'], params['iteration_mode'],
+            params['keypairs'], params['time_budget'], params['chunk_size'], params['file_path'],
+            params['encryption_threads'], max_workers=params['parallel_workers'], pin_cpus=params['pin_cpus'],
+            on_complete=on_job_complete, cancel_event=job.cancel_event, precision=params['precision'],
+            warmup=params['warmup'], timer=params['timer'], cycles=params['count_cycles'],
+            isolate=params['isolate'], isolate_cpu=params['isolate_cpu'],
+            context_pool=params['context_pool'], report_setup=params['report_setup'])
+        
+        if raw_measurements:
+            import statistics_utils
+            job.report(1.0, t['computing_confidence'])
+            statistics_df = statistics_utils.create_statistics_dataframe(raw_measurements)
     
-    # Create DataFrame
-    df = pd.DataFrame(results)
+    return {"results": results, "raw_measurements": raw_measurements, "histograms": histograms,
+            "statistics": statistics_df, "noise": noise_report}
+
+
+import jobs
+
+if 'job_manager' not in st.session_state:
+    st.session_state['job_manager'] = jobs.JobManager()
+job_manager = st.session_state['job_manager']
+
+if run_button:
+    # Validate selection
+    if mode == "Real-World Scenarios":
+        if not selected_kem or not selected_sig:
+            st.error(t['error_select_kem_sig'])
+            st.stop()
+    elif mode != "Parallel Encryption":
+        if not selected_algos:
+            st.error(t['error_select_algos'])
+            st.stop()
+        if mode == "Multi-core Scaling" and not scaling_backends:
+            st.error(t['error_select_backend'])
+            st.stop()
     
-    if len(df) == 0:
-        st.error(t['error_no_results'])
-        st.stop()
+    # Cancel a sweep that is still running before starting the new one
+    for running_job in job_manager.active():
+        running_job.cancel()
     
-    # Store results in session state for export
-    st.session_state['benchmark_results'] = df
-    st.session_state['raw_measurements'] = raw_measurements
-    st.session_state['config'] = {
+    params = {
         'mode': mode,
+        'scenario': scenario if mode == "Real-World Scenarios" else None,
+        'scenario_options': scenario_options,
+        'selected_algos': selected_algos,
+        'selected_kem': selected_kem,
+        'selected_sig': selected_sig,
+        'payload_bytes': payload_bytes,
+        'payload_seed': payload_seed,
+        'file_path': file_path,
         'iterations': iterations,
-        'payload_size': len(payload_bytes)
+        'iteration_mode': iteration_mode,
+        'keypairs': keypairs,
+        'time_budget': time_budget,
+        'precision': precision,
+        'warmup': warmup,
+        'context_pool': context_pool,
+        'report_setup': report_setup,
+        'timer': timer,
+        'count_cycles': count_cycles,
+        'chunk_size': chunk_size,
+        'encryption_threads': encryption_threads,
+        'parallel_workers': parallel_workers,
+        'pin_cpus': pin_cpus,
+        'isolate': isolate,
+        'isolate_cpu': isolate_cpu,
+        'scaling_mode': scaling_mode if mode == "Multi-core Scaling" else None,
+        'scaling_operation': scaling_operation if mode == "Multi-core Scaling" else None,
+        'scaling_max_workers': scaling_max_workers if mode == "Multi-core Scaling" else None,
+        'scaling_backends': scaling_backends,
+        'save_history': save_history,
+        'history_label': history_label,
     }
+    job = job_manager.submit(run_benchmark_job, params, t, description=mode)
+    st.session_state['benchmark_job_id'] = job.id
+    st.session_state['benchmark_job_params'] = params
+
+job = job_manager.get(st.session_state.get('benchmark_job_id'))
+# Snapshot before collecting, so a job finishing in between is picked up by the progress fragment
+job_running = job is not None and not job.done
+
+# Collect the results of a finished job once
+if job is not None and not job_running and st.session_state.get('collected_job_id') != job.id:
+    import pandas as pd
+    import result_store
+    
+    st.session_state['collected_job_id'] = job.id
+    params = st.session_state['benchmark_job_params']
+    
+    for warning in job.warnings:
+        st.warning(warning)
+    
+    if job.status == jobs.FAILED:
+        st.error(f"{t['failed_to_benchmark']} {job.error}")
+    elif job.result is None or len(job.result['results']) == 0:
+        st.error(t['error_no_results'])
+    else:
+        # Create DataFrame
+        df = pd.DataFrame(job.result['results'])
+        raw_measurements = job.result['raw_measurements']
+        
+        # Store results in session state for export
+        st.session_state['benchmark_results'] = df
+        st.session_state['raw_measurements'] = raw_measurements
+        st.session_state['histograms'] = job.result['histograms']
+        st.session_state['statistics_df'] = job.result['statistics']
+        st.session_state['noise_report'] = job.result['noise']
+        st.session_state['results_view'] = {
+            'mode': params['mode'],
+            'scenario': params['scenario'],
+            'scaling_operation': params['scaling_operation'],
+        }
+        st.session_state['config'] = {
+            'mode': params['mode'],
+            'iterations': params['iterations'],
+            'iteration_mode': params['iteration_mode'],
+            'keypairs': params['keypairs'],
+            'time_budget': params['time_budget'],
+            'precision': params['precision'],
+            'warmup': params['warmup'],
+            'context_pool': params['context_pool'],
+            'report_setup': params['report_setup'],
+            'timer': params['timer'],
+            'count_cycles': params['count_cycles'],
+            'isolate': params['isolate'],
+            'isolate_cpu': params['isolate_cpu'],
+            'noise': job.result['noise'],
+            'chunk_size': params['chunk_size'],
+            'encryption_threads': params['encryption_threads'],
+            'parallel_workers': params['parallel_workers'],
+            'payload_seed': params['payload_seed'],
+            'payload_size': os.path.getsize(params['file_path']) if params['file_path'] else len(params['payload_bytes'])
+        }
+        if params['scenario_options']:
+            st.session_state['config']['scenario_options'] = params['scenario_options']
+        
+        if job.status == jobs.CANCELLED:
+            st.warning(f"{t['benchmark_cancelled']} {len(df)} {t['algo_configs']}")
+        else:
+            st.success(f"{t['benchmark_success']} {len(df)} {t['algo_configs']}")
+        
+        if params['save_history']:
+            try:
+                with result_store.ResultStore() as store:
+                    run_id = store.save_run(df, raw_measurements, st.session_state['config'],
+                                            export_utils.get_system_info(), label=params['history_label'] or None,
+                                            histograms=job.result['histograms'])
+                st.info(f"{t['saved_to_history']} #{run_id}")
+            except Exception as e:
+                st.warning(f"{t['history_failed']} {e}")
+
+if job_running:
+    # Progress tracking, polled without blocking the rest of the UI
+    st.header(t['running_benchmarks'])
+    
+    @st.fragment(run_every=1.0)
+    def show_job_progress():
+        st.progress(job.progress)
+        st.text(job.message or t['testing'])
+        if job.cancel_event.is_set():
+            st.caption(t['cancelling'])
+        if job.done:
+            st.rerun(scope="app")
+    
+    show_job_progress()
+    
+    if st.button(t['cancel_benchmark'], disabled=job.cancel_event.is_set()):
+        job.cancel()
+        st.rerun()
+
+elif 'benchmark_results' in st.session_state and 'results_view' in st.session_state:
+    import pandas as pd
+    import plotly.express as px
+    import statistics_utils
+    import analysis_utils
+    import result_store
+    import benchmark_engine
     
-    st.success(f"{t['benchmark_success']} {len(df)} {t['algo_configs']}")
+    df = st.session_state['benchmark_results']
+    raw_measurements = st.session_state['raw_measurements']
+    histograms = st.session_state.get('histograms', {})
+    statistics_df = st.session_state.get('statistics_df')
+    noise_report = st.session_state.get('noise_report')
+    mode = st.session_state['results_view']['mode']
+    scenario = st.session_state['results_view']['scenario']
+    scaling_operation = st.session_state['results_view']['scaling_operation']
+    is_standard_mode = mode not in ("Real-World Scenarios", "Multi-core Scaling", "Parallel Encryption")
     
     # ========== RESULTS VISUALIZATION ==========
     
@@ -436,6 +698,10 @@ if run_button:
     # Create tabs based on mode
     if mode == "Real-World Scenarios":
         tab_names = [t['tab_results'], t['tab_perf_analysis'], t['tab_export']]
+    elif mode == "Multi-core Scaling":
+        tab_names = [t['tab_scaling'], t['tab_export']]
+    elif mode == "Parallel Encryption":
+        tab_names = [t['tab_parallel'], t['tab_export']]
     else:
         tab_names = [t['tab_performance'], t['tab_size'], t['tab_tradeoff'], t['tab_statistics'], 
                      t['tab_analysis'], t['tab_recommendations'], t['tab_export']]
@@ -447,6 +713,40 @@ if run_button:
         if mode == "Real-World Scenarios":
             st.subheader(f"{scenario} {t['tab_results']}")
             st.dataframe(df.style.format(precision=3), use_container_width=True)
+        elif mode == "Multi-core Scaling":
+            st.subheader(f"{t['tab_scaling']}: {scaling_operation}")
+            st.info(t['metrics_scaling_desc'])
+            
+            fig_agg = px.line(df, x="Workers", y="Aggregate (ops/s)", color="Algorithm",
+                              line_dash="Backend", markers=True,
+                              title=t['scaling_throughput_title'], height=500)
+            st.plotly_chart(fig_agg, use_container_width=True)
+            
+            fig_eff = px.line(df, x="Workers", y="Efficiency (%)", color="Algorithm",
+                              line_dash="Backend", markers=True,
+                              title=t['scaling_efficiency_title'], height=450)
+            fig_eff.add_hline(y=100, line_dash="dash", line_color="gray", opacity=0.5)
+            st.plotly_chart(fig_eff, use_container_width=True)
+            
+            st.subheader(t['summary_table'])
+            st.dataframe(df.style.format(precision=2), use_container_width=True)
+        elif mode == "Parallel Encryption":
+            st.subheader(t['tab_parallel'])
+            st.info(t['metrics_parallel_desc'])
+            
+            df_rate = df.melt(id_vars=["Threads"], value_vars=["Encrypt (GB/s)", "Decrypt (GB/s)"],
+                              var_name="Operation", value_name="GB/s")
+            fig_rate = px.line(df_rate, x="Threads", y="GB/s", color="Operation", markers=True,
+                               title=t['parallel_throughput_title'], height=500)
+            st.plotly_chart(fig_rate, use_container_width=True)
+            
+            fig_eff = px.line(df, x="Threads", y="Efficiency (%)", markers=True,
+                              title=t['parallel_efficiency_title'], height=450)
+            fig_eff.add_hline(y=100, line_dash="dash", line_color="gray", opacity=0.5)
+            st.plotly_chart(fig_eff, use_container_width=True)
+            
+            st.subheader(t['summary_table'])
+            st.dataframe(df.style.format(precision=3), use_container_width=True)
         else:
             st.subheader(t['performance_metrics'])
             st.caption(t['perf_caption'])
@@ -459,11 +759,26 @@ if run_button:
                                   value_vars=perf_cols,
                                   var_name="Operation", value_name="Time (ms)")
                 
+                # Bootstrap confidence intervals of the per-operation means as error bars
+                error_args = {}
+                if statistics_df is not None and not statistics_df.empty and "mean_ci_low" in statistics_df.columns:
+                    op1, op2 = benchmark_engine.get_operation_labels(mode)
+                    columns = {"KG": "KeyGen (ms)", "OP1": f"{op1} (ms)", "OP2": f"{op2} (ms)",
+                               "AES_ENC": "AES Encrypt (ms)", "AES_DEC": "AES Decrypt (ms)"}
+                    ci = statistics_df.assign(Operation=statistics_df["Metric"].map(columns))
+                    df_long = df_long.merge(ci[["Algorithm", "Operation", "mean_ci_low", "mean_ci_high"]],
+                                            on=["Algorithm", "Operation"], how="left")
+                    df_long["CI +"] = df_long["mean_ci_high"] - df_long["Time (ms)"]
+                    df_long["CI -"] = df_long["Time (ms)"] - df_long["mean_ci_low"]
+                    error_args = {"error_y": "CI +", "error_y_minus": "CI -"}
+                
                 fig_time = px.bar(df_long, x="Algorithm", y="Time (ms)", color="Operation",
                                  title=t.get('exec_time_breakdown', 'Execution Time Breakdown'),
-                                 height=500, barmode='group')
+                                 height=500, barmode='group', **error_args)
                 fig_time.update_xaxes(tickangle=45)
                 st.plotly_chart(fig_time, use_container_width=True)
+                if error_args:
+                    st.caption(t['ci_error_bars'])
             else:
                 st.warning(t.get('no_perf_data', 'No performance data available for visualization'))
             
@@ -486,7 +801,31 @@ if run_button:
             st.subheader(t['tab_perf_analysis'])
             st.info(t['metrics_scenarios_desc'])
             
-            if len(df) > 0:
+            if len(df) > 0 and 'Handshakes/s' in df.columns:
+                # Load test: one row per (algorithm pair, concurrency level)
+                if 'Client Bound' in df.columns and df['Client Bound'].any():
+                    st.warning(t['client_bound_warning'])
+                
+                fig_rate = px.line(df, x='Concurrency', y='Handshakes/s', color='Algorithm', markers=True,
+                                   log_x=True, title=f"{scenario} - {t['handshake_rate']}", height=450)
+                st.plotly_chart(fig_rate, use_container_width=True)
+                
+                latency_cols = [c for c in ['P50 Latency (ms)', 'P99 Latency (ms)'] if c in df.columns]
+                latency_df = df.melt(id_vars=['Algorithm', 'Concurrency'], value_vars=latency_cols,
+                                     var_name='Percentile', value_name='Latency (ms)')
+                fig_latency = px.line(latency_df, x='Concurrency', y='Latency (ms)', color='Algorithm',
+                                      line_dash='Percentile', markers=True, log_x=True, log_y=True,
+                                      title=f"{scenario} - {t['handshake_latency']}", height=450)
+                st.plotly_chart(fig_latency, use_container_width=True)
+                
+                fig_cpu = px.bar(df, x='Concurrency', y='Server CPU per Handshake (ms)', color='Algorithm',
+                                 barmode='group', title=t['server_cpu_per_handshake'], height=400)
+                fig_cpu.update_xaxes(type='category')
+                st.plotly_chart(fig_cpu, use_container_width=True)
+                
+                st.subheader(t['summary_table'])
+                st.dataframe(df.style.format(precision=3), use_container_width=True)
+            elif len(df) > 0:
                 # Performance comparison chart - use Total Time (ms) which should always exist
                 if 'Total Time (ms)' in df.columns or 'Total Session Setup (ms)' in df.columns:
                     time_col = 'Total Time (ms)' if 'Total Time (ms)' in df.columns else 'Total Session Setup (ms)'
@@ -500,6 +839,28 @@ if run_button:
                     fig_scenario.update_yaxes(title="Time (ms)")
                     st.plotly_chart(fig_scenario, use_container_width=True)
                     
+                    if 'Time to First Byte (ms)' in df.columns:
+                        # Split time to first byte into computation and wire time over the link profile
+                        ttfb_df = pd.DataFrame({
+                            'Algorithm': df['Algorithm'],
+                            t['crypto_time']: df['Total Time (ms)'],
+                            t['network_time']: df['Time to First Byte (ms)'] - df['Total Time (ms)'],
+                        }).melt(id_vars='Algorithm', var_name='Component', value_name='Time (ms)')
+                        fig_ttfb = px.bar(ttfb_df, x='Algorithm', y='Time (ms)', color='Component',
+                                          title=f"{t['time_to_first_byte']} ({df['Link Profile'].iloc[0]})",
+                                          height=450)
+                        fig_ttfb.update_xaxes(tickangle=45)
+                        st.plotly_chart(fig_ttfb, use_container_width=True)
+                    
+                    if 'Steady-State Packets/s' in df.columns:
+                        # VPN data plane: packet rate with and without rekey stalls
+                        rate_df = df.melt(id_vars='Algorithm', value_vars=['Packets/s', 'Steady-State Packets/s'],
+                                          var_name='Rate', value_name='Packets/s')
+                        fig_rate = px.bar(rate_df, x='Algorithm', y='Packets/s', color='Rate', barmode='group',
+                                          title=t['vpn_packet_rate'], height=450)
+                        fig_rate.update_xaxes(tickangle=45)
+                        st.plotly_chart(fig_rate, use_container_width=True)
+                    
                     # Detailed metrics table
                     st.subheader(t['summary_table'])
                     st.dataframe(df.style.format(precision=3), use_container_width=True)
@@ -509,7 +870,7 @@ if run_button:
                 st.warning(t.get('no_perf_data', 'No performance data available'))
     
     # Tab 1: Size Analysis (for non-scenario modes)
-    if mode != "Real-World Scenarios" and len(tabs) > 1:
+    if is_standard_mode and len(tabs) > 1:
         with tabs[1]:
             st.subheader(t['crypto_sizes'])
             st.caption(t['sizes_caption'])
@@ -542,7 +903,7 @@ if run_button:
                 st.warning(t['no_size_data'])
     
     # Tab 2: Trade-off Analysis
-    if mode != "Real-World Scenarios" and len(tabs) > 2:
+    if is_standard_mode and len(tabs) > 2:
         with tabs[2]:
             st.subheader(t['tradeoff_title'])
             st.caption(t['tradeoff_caption'])
@@ -609,7 +970,7 @@ if run_button:
                     subset=["Efficiency Score"], cmap="RdYlGn_r"), use_container_width=True)
     
     # Tab 3: Statistics
-    if mode != "Real-World Scenarios" and len(tabs) > 3:
+    if is_standard_mode and len(tabs) > 3:
         with tabs[3]:
             st.subheader(t['detailed_stats'])
             st.info(t['metrics_stats_desc'])
@@ -636,6 +997,40 @@ if run_button:
                 st.dataframe(df[["Algorithm", "Family"] + stats_cols].style.format(precision=3),
                            use_container_width=True)
             
+            # System settings that add noise to the timings
+            if noise_report is not None:
+                st.markdown(f"### {t['noise_title']}")
+                if noise_report['load_average'] is not None:
+                    st.caption(f"{t['load_average']}: " +
+                               " / ".join(f"{load:.2f}" for load in noise_report['load_average']) +
+                               f" ({noise_report['cpu_count']} CPU)")
+                for warning in noise_report['warnings']:
+                    st.warning(warning)
+                if not noise_report['warnings']:
+                    st.success(t['no_noise'])
+            
+            # CPU cycles per operation (comparable with liboqs / SUPERCOP figures)
+            cycle_cols = [c for c in df.columns if c.endswith("(cycles/op)")]
+            if cycle_cols:
+                st.markdown(f"### {t['cycles_title']}")
+                st.caption(t['cycles_caption'])
+                st.dataframe(df[["Algorithm", "Family"] + cycle_cols].style.format(precision=0),
+                             use_container_width=True)
+            
+            # Warmup calls discarded before recording samples
+            if "Warmup Calls" in df.columns:
+                st.markdown(f"### {t['warmup_title']}")
+                st.caption(t['warmup_caption'])
+                st.dataframe(df[["Algorithm", "Family", "Warmup Calls", "Warmup Time (s)", "Warmup Steady"]]
+                             .style.format(precision=3), use_container_width=True)
+            
+            # Bootstrap confidence intervals per operation
+            if statistics_df is not None and not statistics_df.empty and "mean_ci_low" in statistics_df.columns:
+                st.markdown(f"### {t['confidence_intervals']}")
+                ci_cols = ["Algorithm", "Metric", "mean", "mean_ci_low", "mean_ci_high",
+                           "median", "median_ci_low", "median_ci_high", "p95", "p95_ci_low", "p95_ci_high"]
+                st.dataframe(statistics_df[ci_cols].style.format(precision=4), use_container_width=True)
+            
             # Outlier detection
             if raw_measurements:
                 st.markdown(f"### {t['outlier_analysis']}")
@@ -655,9 +1050,24 @@ if run_button:
                     st.dataframe(pd.DataFrame(outlier_data), use_container_width=True)
                 else:
                     st.success(t['no_outliers'])
+            
+            # Tail latency from the HDR histograms
+            if histograms:
+                st.markdown(f"### {t['tail_latency_title']}")
+                st.caption(t['tail_latency_caption'])
+                op1, op2 = benchmark_engine.get_operation_labels(mode)
+                op_names = {"KG": "KeyGen", "OP1": op1, "OP2": op2,
+                            "AES_ENC": "AES Encrypt", "AES_DEC": "AES Decrypt"}
+                tail_data = []
+                for algo, algo_histograms in histograms.items():
+                    for key, histogram in algo_histograms.items():
+                        row = {t['algorithm']: algo, t['metric']: op_names.get(key, key)}
+                        row.update(histogram.summary())
+                        tail_data.append(row)
+                st.dataframe(pd.DataFrame(tail_data).style.format(precision=4), use_container_width=True)
     
     # Tab 4: Analysis
-    if mode != "Real-World Scenarios" and len(tabs) > 4:
+    if is_standard_mode and len(tabs) > 4:
         with tabs[4]:
             st.subheader(t['comparative_analysis'])
             
@@ -747,7 +1157,7 @@ if run_button:
                         st.caption(bw['verdict'])
     
     # Tab 5: Recommendations
-    if mode != "Real-World Scenarios" and len(tabs) > 5:
+    if is_standard_mode and len(tabs) > 5:
         with tabs[5]:
             st.subheader(t['recommendations_title'])
             
@@ -842,6 +1252,8 @@ if run_button:
                     "metadata": metadata,
                     "results": df.to_dict('records')
                 }
+                if histograms:
+                    export_data["histograms"] = export_utils.histograms_to_dict(histograms)
                 json_data = json.dumps(export_data, indent=2).encode('utf-8')
                 st.download_button(
                     label=t['export_json'],
@@ -853,6 +1265,17 @@ if run_button:
                 )
             except Exception as e:
                 st.error(f"{t['export_failed']} {e}")
+        
+        with st.expander(t['run_history']):
+            try:
+                with result_store.ResultStore() as store:
+                    history_df = store.list_runs(mode=mode, limit=50)
+                if len(history_df) > 0:
+                    st.dataframe(history_df, use_container_width=True, hide_index=True)
+                else:
+                    st.caption(t['no_history'])
+            except Exception as e:
+                st.warning(f"{t['history_failed']} {e}")
 
 else:
     # Initial welcome screen
@@ -877,7 +1300,10 @@ else:
     
     st.divider()
     
-    # Example results
+    # Example results (text above is already rendered while plotting libraries load)
+    import pandas as pd
+    import plotly.express as px
+    
     st.subheader(t['example_title'])
     
     example_data = {
@@ -900,3 +1326,28 @@ else:
 # Footer
 st.divider()
 st.caption(f"{t['footer']} | [{t['documentation']}](https://github.com/open-quantum-safe/liboqs) | {t['version']} | © 2026")
+
+
+@st.cache_resource(show_spinner=False)
+def get_startup_report():
+    """Process-wide record of the first (cold) script run."""
+    return {}
+
+
+_script_end = time.perf_counter()
+run_timing = {
+    "imports_ms": (_imports_done - _script_start) * 1000,
+    "render_ms": (_script_end - _imports_done) * 1000,
+    "total_ms": (_script_end - _script_start) * 1000,
+}
+startup_report = get_startup_report()
+if not startup_report:
+    startup_report.update(run_timing)
+    print(f"Cold start: imports {run_timing['imports_ms']:.0f} ms, "
+          f"render {run_timing['render_ms']:.0f} ms, total {run_timing['total_ms']:.0f} ms", file=sys.stderr)
+
+with st.expander(t['startup_timing']):
+    st.caption(f"{t['cold_start']}: {t['imports']} {startup_report['imports_ms']:.0f} ms, "
+               f"{t['render']} {startup_report['render_ms']:.0f} ms, {t['total']} {startup_report['total_ms']:.0f} ms")
+    st.caption(f"{t['this_run']}: {t['imports']} {run_timing['imports_ms']:.0f} ms, "
+               f"{t['render']} {run_timing['render_ms']:.0f} ms, {t['total']} {run_timing['total_ms']:.0f} ms")
@@ -0,0 +1,356 @@
+"""
+Measurement primitives shared by the benchmark modules.
+Times individual cryptographic operations against a prepared keypair so
+that key generation is measured separately from the operations using it.
+"""
+
+import math
+import time
+import statistics
+import hdr_histogram
+import statistics_utils
+import timers
+
+
+# Two-sided normal quantile of the adaptive stopping rule's confidence level (95%)
+CONFIDENCE_Z = 1.96
+
+# Warmup steady-state detection: window size and relative tolerance of the rolling median
+WARMUP_WINDOW = 5
+WARMUP_TOLERANCE = 0.05
+
+
+def warm_up(operation, window=WARMUP_WINDOW, tolerance=WARMUP_TOLERANCE, max_calls=200, max_time=1.0,
+            timer=None):
+    """
+    Call an operation until its timing reaches a steady state.
+
+    Cold caches, lazy library initialisation and CPU frequency ramp-up make
+    the first calls of an operation slower. The operation is called until
+    the median of the last `window` calls is within `tolerance` of the
+    median of the `window` calls before it, or until `max_calls` calls or
+    `max_time` seconds have been spent. All warmup calls are discarded by
+    the caller.
+
+    Args:
+        operation: Zero-argument callable to warm up
+        window: Rolling window size in calls
+        tolerance: Maximum relative change between consecutive window medians
+        max_calls: Maximum number of warmup calls
+        max_time: Maximum seconds spent warming up
+        timer: Clock returning nanoseconds (default time.perf_counter_ns),
+               see timers.TIMERS; pass the clock the samples are timed with
+
+    Returns:
+        Tuple (list with the duration of each warmup call in milliseconds,
+        True if a steady state was detected)
+    """
+    timer = timer or time.perf_counter_ns
+    budget_ns = int(max_time * 1e9)
+    samples = []
+    spent_ns = 0
+    while len(samples) < max_calls:
+        t0 = timer()
+        operation()
+        elapsed = timer() - t0
+        spent_ns += elapsed
+        samples.append(elapsed / 1e6)
+        if len(samples) >= 2 * window:
+            previous = statistics.median(samples[-2 * window:-window])
+            current = statistics.median(samples[-window:])
+            if abs(current - previous) <= tolerance * previous:
+                return samples, True
+        if spent_ns >= budget_ns:
+            break
+    return samples, False
+
+
+def time_operation(operation, iterations, histogram=None, timer=None, cycles=None):
+    """
+    Call an operation repeatedly and time every call.
+
+    Args:
+        operation: Zero-argument callable to benchmark
+        iterations: Number of calls
+        histogram: Optional hdr_histogram.HdrHistogram receiving every
+                   duration in nanoseconds
+        timer: Clock returning nanoseconds (default time.perf_counter_ns),
+               see timers.TIMERS
+        cycles: Optional list receiving the CPU cycles of every call; left
+                empty if cycle counting is unavailable
+
+    Returns:
+        List with the duration of each call in milliseconds
+    """
+    timer = timer or time.perf_counter_ns
+    counter = timers.get_cycle_counter() if cycles is not None else None
+    samples = []
+    for _ in range(iterations):
+        if counter is not None:
+            c0 = counter.read()
+        t0 = timer()
+        operation()
+        elapsed = timer() - t0
+        if counter is not None:
+            cycles.append(counter.measure(c0, counter.read()))
+        samples.append(elapsed / 1e6)
+        if histogram is not None:
+            histogram.record(elapsed)
+    return samples
+
+
+def time_operation_adaptive(operation, precision=0.02, time_budget=1.0, min_iterations=10,
+                            max_iterations=1000000, histogram=None, timer=None, cycles=None):
+    """
+    Call an operation until its mean is known to a target relative precision.
+
+    Iteration stops once `time_budget` seconds of calls have been spent
+    (checked after every call, so slow operations cannot overrun it by
+    `min_iterations` calls), or, after at least `min_iterations` calls, as
+    soon as the 95% confidence interval half-width of the mean
+    (1.96 * s / sqrt(n), kept with Welford's online variance) is at most
+    `precision` times the mean.
+
+    Args:
+        operation: Zero-argument callable to benchmark
+        precision: Target relative CI half-width (e.g. 0.02 for +/-2%)
+        time_budget: Maximum seconds spent calling the operation
+        min_iterations: Calls made before the precision target can stop
+                        iteration (the time budget always applies)
+        max_iterations: Hard cap on the number of calls
+        histogram: Optional hdr_histogram.HdrHistogram receiving every
+                   duration in nanoseconds
+        timer, cycles: See time_operation; the time budget is measured
+                       with `timer`
+
+    Returns:
+        Tuple (list with the duration of each call in milliseconds,
+        achieved relative CI half-width (inf if the budget ran out after a
+        single call), True if the target precision was reached)
+    """
+    timer = timer or time.perf_counter_ns
+    counter = timers.get_cycle_counter() if cycles is not None else None
+    budget_ns = int(time_budget * 1e9)
+    min_iterations = max(2, min_iterations)
+    stats = statistics_utils.StreamingStatistics(quantiles=())
+    samples = []
+    spent_ns = 0
+    half_width = math.inf
+    converged = False
+    while len(samples) < max(max_iterations, min_iterations):
+        if counter is not None:
+            c0 = counter.read()
+        t0 = timer()
+        operation()
+        elapsed = timer() - t0
+        if counter is not None:
+            cycles.append(counter.measure(c0, counter.read()))
+        spent_ns += elapsed
+        samples.append(elapsed / 1e6)
+        stats.update(elapsed)
+        if histogram is not None:
+            histogram.record(elapsed)
+        if stats.count >= 2:
+            # Sample standard deviation from Welford's population variance
+            std = math.sqrt(stats.variance * stats.count / (stats.count - 1))
+            half_width = CONFIDENCE_Z * std / math.sqrt(stats.count) / stats.mean if stats.mean > 0 else 0.0
+            converged = stats.count >= min_iterations and half_width <= precision
+            if converged:
+                break
+        if spent_ns >= budget_ns:
+            break
+    return samples, half_width, converged
+
+
+def benchmark_operations(open_operations, iterations, keypairs=1, histograms=None, warmup=None,
+                         timer=None, cycles=None):
+    """
+    Run an operation-level benchmark.
+
+    Instead of regenerating a keypair for every iteration, `keypairs` key sets
+    are prepared and the `iterations` operation calls are spread across them.
+    KeyGen is timed once per prepared key set.
+
+    Args:
+        open_operations: Zero-argument callable returning a context manager that
+                         yields (operations, sizes) where operations maps an
+                         operation label (e.g. 'KeyGen', 'Encaps') to a
+                         zero-argument callable and sizes maps size columns
+                         (e.g. 'PK Size (B)') to values
+        iterations: Total number of timed calls per operation
+        keypairs: Number of key sets to spread the iterations across
+        histograms: Optional dictionary that receives one HdrHistogram per
+                    operation label with every call's duration
+        warmup: Optional dictionary; if given, every operation is warmed up
+                (see warm_up) on the first key set before it is timed, and
+                the dictionary receives {label: (warmup samples, steady)}
+        timer: Clock returning nanoseconds, see time_operation
+        cycles: Optional dictionary that receives {label: [CPU cycles per call]}
+
+    Returns:
+        Dictionary with '<operation> (ms)' lists of samples plus size columns
+    """
+    iterations = max(1, iterations)
+    keypairs = max(1, min(keypairs, iterations))
+
+    results = {}
+    sizes = {}
+
+    for k in range(keypairs):
+        count = iterations // keypairs + (1 if k < iterations % keypairs else 0)
+        with open_operations() as (operations, sizes):
+            for label, operation in operations.items():
+                if warmup is not None and k == 0:
+                    warmup[label] = warm_up(operation, timer=timer)
+                calls = 1 if label == "KeyGen" else count
+                histogram = None
+                if histograms is not None:
+                    histogram = histograms.setdefault(label, hdr_histogram.HdrHistogram())
+                label_cycles = cycles.setdefault(label, []) if cycles is not None else None
+                results.setdefault(f"{label} (ms)", []).extend(
+                    time_operation(operation, calls, histogram, timer, label_cycles))
+
+    results.update(sizes)
+    return results
+
+
+def benchmark_operations_adaptive(open_operations, precision=0.02, time_budget=1.0,
+                                  min_iterations=10, histograms=None, warmup=None,
+                                  timer=None, cycles=None):
+    """
+    Run an operation-level benchmark with an adaptive number of iterations.
+
+    One key set is prepared and every operation (KeyGen included) is timed
+    with time_operation_adaptive, so fast, stable operations stop after a few
+    calls while noisy ones are sampled until their mean is precise enough or
+    their time budget runs out.
+
+    Args:
+        open_operations: Zero-argument callable returning a context manager that
+                         yields (operations, sizes), see benchmark_operations
+        precision: Target relative CI half-width of each operation's mean
+        time_budget: Maximum seconds spent on each operation
+        min_iterations: Minimum calls per operation
+        histograms: Optional dictionary that receives one HdrHistogram per
+                    operation label with every call's duration
+        warmup, timer, cycles: See benchmark_operations
+
+    Returns:
+        Dictionary with '<operation> (ms)' lists of samples,
+        '<operation> Iterations', '<operation> Precision (%)' (achieved CI
+        half-width) and '<operation> Converged' entries plus size columns
+    """
+    results = {}
+    with open_operations() as (operations, sizes):
+        for label, operation in operations.items():
+            if warmup is not None:
+                warmup[label] = warm_up(operation, timer=timer)
+            histogram = None
+            if histograms is not None:
+                histogram = histograms.setdefault(label, hdr_histogram.HdrHistogram())
+            samples, half_width, converged = time_operation_adaptive(
+                operation, precision, time_budget, min_iterations, histogram=histogram, timer=timer,
+                cycles=cycles.setdefault(label, []) if cycles is not None else None)
+            results[f"{label} (ms)"] = samples
+            results[f"{label} Iterations"] = len(samples)
+            results[f"{label} Precision (%)"] = half_width * 100
+            results[f"{label} Converged"] = converged
+    results.update(sizes)
+    return results
+
+
+def measure_throughput(operation, time_budget=1.0, min_batch_time=0.001, timer=None, cycles=None):
+    """
+    Measure sustained throughput of an operation within a fixed time budget.
+
+    Calls are batched so that the timer is only read once per batch; the batch
+    size is doubled until one batch takes at least `min_batch_time` seconds,
+    which keeps timer resolution and overhead out of sub-microsecond results.
+
+    Args:
+        operation: Zero-argument callable to benchmark
+        time_budget: Seconds to keep running the operation
+        min_batch_time: Minimum duration of a single timed batch in seconds
+        timer: Clock returning nanoseconds (default time.perf_counter_ns)
+        cycles: Optional list receiving the mean CPU cycles per call of every
+                batch; left empty if cycle counting is unavailable
+
+    Returns:
+        Dictionary with total operations, elapsed seconds, ops/sec, ns/op,
+        the calibrated batch size and the mean per-call time (ms) of each batch
+    """
+    timer = timer or time.perf_counter_ns
+    counter = timers.get_cycle_counter() if cycles is not None else None
+    budget_ns = int(time_budget * 1e9)
+    min_batch_ns = int(min_batch_time * 1e9)
+
+    def run_batch(batch):
+        if counter is not None:
+            c0 = counter.read()
+        t0 = timer()
+        for _ in range(batch):
+            operation()
+        elapsed = timer() - t0
+        if counter is not None:
+            cycles.append(counter.measure(c0, counter.read()) / batch)
+        return elapsed
+
+    # Calibrate batch size (calibration calls count towards the budget)
+    batch = 1
+    total_ops = 0
+    total_ns = 0
+    batch_ms = []
+    while True:
+        elapsed = run_batch(batch)
+        total_ops += batch
+        total_ns += elapsed
+        if elapsed >= min_batch_ns or total_ns >= budget_ns:
+            batch_ms.append(elapsed / batch / 1e6)
+            break
+        batch *= 2
+
+    while total_ns < budget_ns:
+        elapsed = run_batch(batch)
+        total_ops += batch
+        total_ns += elapsed
+        batch_ms.append(elapsed / batch / 1e6)
+
+    return {
+        "operations": total_ops,
+        "elapsed_s": total_ns / 1e9,
+        "ops_per_sec": total_ops / (total_ns / 1e9) if total_ns > 0 else 0,
+        "ns_per_op": total_ns / total_ops if total_ops > 0 else 0,
+        "batch_size": batch,
+        "batch_ms": batch_ms,
+    }
+
+
+def benchmark_throughput(open_operations, time_budget=1.0, warmup=None, timer=None, cycles=None):
+    """
+    Run every operation of a prepared operation set for a fixed time budget.
+
+    Args:
+        open_operations: Zero-argument callable returning a context manager that
+                         yields (operations, sizes), see benchmark_operations
+        time_budget: Seconds to spend on each operation
+        warmup, timer: See benchmark_operations
+        cycles: Optional dictionary that receives {label: [mean CPU cycles
+                per call of every batch]}
+
+    Returns:
+        Dictionary with '<operation> (ops/s)', '<operation> (ns/op)' and
+        '<operation> (ms)' (mean per-call time of every batch) entries plus
+        size columns
+    """
+    results = {}
+    with open_operations() as (operations, sizes):
+        for label, operation in operations.items():
+            if warmup is not None:
+                warmup[label] = warm_up(operation, timer=timer)
+            throughput = measure_throughput(operation, time_budget, timer=timer,
+                                            cycles=cycles.setdefault(label, []) if cycles is not None else None)
+            results[f"{label} (ops/s)"] = throughput["ops_per_sec"]
+            results[f"{label} (ns/op)"] = throughput["ns_per_op"]
+            results[f"{label} (ms)"] = throughput["batch_ms"]
+    results.update(sizes)
+    return results
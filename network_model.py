@@ -0,0 +1,131 @@
+"""
+Network link model for scenario bandwidth costs.
+Converts the messages a scenario exchanges into TCP segments, round trips
+and estimated wire time over a link profile (bandwidth, RTT, MTU, initial
+congestion window, packet loss), so that large post-quantum keys and
+signatures that overflow the initial congestion window show the extra
+round trip they cost on real links.
+
+The model is analytic, not a packet simulation: every flight is sent in
+TCP slow start, loss is charged as its expected retransmission-timeout
+cost, and queueing / pacing are ignored.
+"""
+
+import math
+
+
+# IPv4 (20 B) + TCP (20 B) headers per segment
+TCP_IP_HEADER = 40
+# IPv4 (20 B) + UDP (8 B) headers per datagram
+UDP_IP_HEADER = 28
+# Retransmission timeouts (RFC 6298 initial RTO, Linux minimum RTO)
+INITIAL_RTO_MS = 1000.0
+MIN_RTO_MS = 200.0
+
+# Link profiles: bandwidth (Mbit/s), round-trip time (ms), MTU (B),
+# initial congestion window (segments) and packet loss rate (0-1)
+LINK_PROFILES = {
+    "Loopback": {"bandwidth_mbps": 10000, "rtt_ms": 0.05, "mtu": 65535, "initcwnd": 10, "loss": 0.0},
+    "LAN": {"bandwidth_mbps": 1000, "rtt_ms": 0.5, "mtu": 1500, "initcwnd": 10, "loss": 0.0},
+    "Broadband": {"bandwidth_mbps": 100, "rtt_ms": 20, "mtu": 1500, "initcwnd": 10, "loss": 0.001},
+    "4G LTE": {"bandwidth_mbps": 20, "rtt_ms": 60, "mtu": 1428, "initcwnd": 10, "loss": 0.005},
+    "3G": {"bandwidth_mbps": 2, "rtt_ms": 150, "mtu": 1400, "initcwnd": 10, "loss": 0.01},
+    "Satellite (GEO)": {"bandwidth_mbps": 10, "rtt_ms": 600, "mtu": 1500, "initcwnd": 10, "loss": 0.005},
+}
+
+DEFAULT_LINK_PROFILE = "Broadband"
+
+
+def get_link_profile(name=DEFAULT_LINK_PROFILE):
+    """
+    Return the link parameters for a profile name.
+
+    Args:
+        name: One of LINK_PROFILES
+
+    Returns:
+        Dictionary with bandwidth_mbps, rtt_ms, mtu, initcwnd and loss
+    """
+    if name not in LINK_PROFILES:
+        raise ValueError(f"Unknown link profile '{name}', expected one of {', '.join(LINK_PROFILES)}")
+    return LINK_PROFILES[name]
+
+
+def segment_count(size, mtu, header=TCP_IP_HEADER):
+    """Number of segments (or datagrams) needed to carry `size` payload bytes."""
+    return max(1, math.ceil(size / (mtu - header)))
+
+
+def _slow_start_rounds(segments, cwnd):
+    """Round trips needed to send `segments` starting from `cwnd`; returns (rounds, new cwnd)."""
+    rounds = 0
+    sent = 0
+    while sent < segments:
+        flight = min(cwnd, segments - sent)
+        sent += flight
+        # Slow start: every acknowledged segment grows the window by one
+        cwnd += flight
+        rounds += 1
+    return rounds, cwnd
+
+
+def _loss_penalty(segments, loss, rto):
+    """Expected retransmission delay of a flight: P(any segment lost) * RTO."""
+    return (1 - (1 - loss) ** segments) * rto
+
+
+def exchange_time(flights, link, tcp=True):
+    """
+    Estimate the wire time of an alternating request / response exchange.
+
+    The first flight goes from the initiator to the responder, the next one
+    back, and so on; each flight costs one one-way delay (RTT / 2) plus its
+    serialization time. Over TCP the exchange is preceded by the three-way
+    handshake and each direction keeps its own congestion window, starting
+    at the link's initcwnd, so a flight larger than the window needs extra
+    round trips. Over UDP (tcp=False) flights are only fragmented to the
+    MTU.
+
+    Args:
+        flights: Payload bytes of each flight in order
+        link: Link parameters (see LINK_PROFILES)
+        tcp: Model a fresh TCP connection instead of UDP datagrams
+
+    Returns:
+        Dictionary with 'Segments' (per flight), 'Round Trips' (including the
+        TCP handshake and extra congestion-window rounds), 'Extra Round
+        Trips (cwnd)', 'Bytes on Wire (B)' and 'Network Time (ms)'
+    """
+    rtt = link["rtt_ms"]
+    bytes_per_ms = link["bandwidth_mbps"] * 1e6 / 8 / 1000
+    header = TCP_IP_HEADER if tcp else UDP_IP_HEADER
+    rto = max(MIN_RTO_MS, 2 * rtt)
+
+    segments = []
+    extra_rounds = 0
+    wire_bytes = 0
+    time_ms = 0.0
+    # The SYN / SYN-ACK exchange: one round trip; a lost SYN waits for the initial RTO
+    if tcp:
+        time_ms += rtt + _loss_penalty(2, link["loss"], INITIAL_RTO_MS) + 2 * header / bytes_per_ms
+        wire_bytes += 2 * header
+
+    cwnd = [link["initcwnd"], link["initcwnd"]] if tcp else None
+    for i, size in enumerate(flights):
+        count = segment_count(size, link["mtu"], header)
+        flight_bytes = size + count * header
+        time_ms += rtt / 2 + flight_bytes / bytes_per_ms + _loss_penalty(count, link["loss"], rto)
+        if tcp:
+            rounds, cwnd[i % 2] = _slow_start_rounds(count, cwnd[i % 2])
+            extra_rounds += rounds - 1
+            time_ms += (rounds - 1) * rtt
+        segments.append(count)
+        wire_bytes += flight_bytes
+
+    return {
+        "Segments": segments,
+        "Round Trips": (1 if tcp else 0) + len(flights) / 2 + extra_rounds,
+        "Extra Round Trips (cwnd)": extra_rounds,
+        "Bytes on Wire (B)": wire_bytes,
+        "Network Time (ms)": time_ms,
+    }
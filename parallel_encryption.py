@@ -0,0 +1,197 @@
+"""
+Parallel chunk encryption for hybrid encryption.
+Encrypts the independent AES-GCM chunks of a stream across a thread pool
+(cryptography releases the GIL inside AEAD calls) and reassembles the
+output in order, keeping only a bounded number of chunks in flight.
+"""
+
+import os
+import time
+import hashlib
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+import hybrid_encryption
+from hybrid_encryption import DEFAULT_CHUNK_SIZE, GCM_TAG_SIZE, NONCE_PREFIX_SIZE
+
+
+def _map_ordered(function, items, threads, max_in_flight=None):
+    """
+    Apply function(*item) to every item on a thread pool, yielding results in input order.
+
+    At most max_in_flight items (default: 2 per thread) are submitted but not
+    yet yielded, which bounds the memory held by pending chunks.
+    """
+    if max_in_flight is None:
+        max_in_flight = 2 * threads
+    max_in_flight = max(1, max_in_flight)
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        pending = deque()
+        for item in items:
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+            pending.append(executor.submit(function, *item))
+        while pending:
+            yield pending.popleft().result()
+
+
+def _nonced(chunks, nonce_prefix):
+    """Yield (nonce, chunk) pairs following the stream nonce layout."""
+    for counter, (chunk, last) in enumerate(hybrid_encryption._mark_last(chunks)):
+        yield hybrid_encryption.stream_nonce(nonce_prefix, counter, last), chunk
+
+
+def encrypt_stream_parallel(aes_key, chunks, nonce_prefix, threads=4, max_in_flight=None):
+    """
+    Encrypt a stream of plaintext chunks with AES-256-GCM on a thread pool.
+
+    Produces exactly the same ciphertext chunks as
+    hybrid_encryption.encrypt_stream, so either side can be parallel.
+
+    Args:
+        aes_key: 32-byte AES key
+        chunks: Iterable of plaintext chunks
+        nonce_prefix: 7-byte random per-stream nonce prefix
+        threads: Number of worker threads
+        max_in_flight: Maximum chunks submitted but not yet yielded
+                       (default: 2 per thread)
+
+    Yields:
+        Ciphertext chunks in stream order
+    """
+    aesgcm = AESGCM(aes_key)
+    encrypt = lambda nonce, chunk: aesgcm.encrypt(nonce, chunk, None)
+    yield from _map_ordered(encrypt, _nonced(chunks, nonce_prefix), threads, max_in_flight)
+
+
+def decrypt_stream_parallel(aes_key, ciphertext_chunks, nonce_prefix, threads=4, max_in_flight=None):
+    """
+    Decrypt a stream produced by encrypt_stream / encrypt_stream_parallel on a thread pool.
+
+    Raises cryptography.exceptions.InvalidTag if any chunk was modified,
+    reordered or dropped.
+
+    Args:
+        aes_key: 32-byte AES key
+        ciphertext_chunks: Iterable of ciphertext chunks (chunk_size + 16 bytes)
+        nonce_prefix: 7-byte nonce prefix used for encryption
+        threads: Number of worker threads
+        max_in_flight: Maximum chunks submitted but not yet yielded
+                       (default: 2 per thread)
+
+    Yields:
+        Plaintext chunks in stream order
+    """
+    aesgcm = AESGCM(aes_key)
+    decrypt = lambda nonce, chunk: aesgcm.decrypt(nonce, chunk, None)
+    yield from _map_ordered(decrypt, _nonced(ciphertext_chunks, nonce_prefix), threads, max_in_flight)
+
+
+def get_thread_counts(max_threads=None):
+    """Return thread counts for a sweep: powers of two up to max_threads, always including it."""
+    if max_threads is None:
+        max_threads = os.cpu_count() or 1
+    max_threads = max(1, max_threads)
+
+    counts = []
+    n = 1
+    while n < max_threads:
+        counts.append(n)
+        n *= 2
+    counts.append(max_threads)
+    return counts
+
+
+def benchmark_parallel_encryption(source, thread_counts=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                                  max_in_flight=None, on_step=None, cancel_event=None):
+    """
+    Measure AES-256-GCM chunk encryption throughput for several thread counts.
+
+    A reference ciphertext is produced single-threaded and spooled to a
+    temporary file; every thread count must reproduce its digest, and its
+    decryption must reproduce the plaintext digest. Times are wall-clock and
+    include reading the source, as a pipeline would see them.
+
+    Args:
+        source: bytes-like object, file path, binary file object or iterable
+                of byte strings (see hybrid_encryption.iter_chunks); file
+                objects and iterators can only be consumed once, so pass a
+                path or bytes when testing more than one thread count
+        thread_counts: Thread counts to test (default: 1, 2, 4, ... CPU count)
+        chunk_size: Plaintext chunk size in bytes
+        max_in_flight: Maximum chunks in flight (default: 2 per thread)
+        on_step: Optional callback(threads) invoked before each thread count
+        cancel_event: Optional threading.Event that stops the sweep before
+                      the next thread count once set
+
+    Returns:
+        List of result rows (one per thread count) with encrypt/decrypt GB/s,
+        speedup and efficiency relative to the first thread count
+    """
+    if thread_counts is None:
+        thread_counts = get_thread_counts()
+
+    aes_key = AESGCM.generate_key(bit_length=256)
+    nonce_prefix = os.urandom(NONCE_PREFIX_SIZE)
+
+    plaintext_digest = hashlib.sha256()
+    ciphertext_digest = hashlib.sha256()
+    file_size = 0
+
+    rows = []
+    baseline = None
+
+    with tempfile.TemporaryFile() as spool:
+        plaintext = hybrid_encryption._hashed(hybrid_encryption.iter_chunks(source, chunk_size), plaintext_digest)
+        for ciphertext in hybrid_encryption.encrypt_stream(aes_key, plaintext, nonce_prefix):
+            spool.write(ciphertext)
+            ciphertext_digest.update(ciphertext)
+            file_size += len(ciphertext) - GCM_TAG_SIZE
+
+        for threads in thread_counts:
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            if on_step:
+                on_step(threads)
+
+            digest = hashlib.sha256()
+            t0 = time.perf_counter()
+            chunks = hybrid_encryption.iter_chunks(source, chunk_size)
+            for ciphertext in encrypt_stream_parallel(aes_key, chunks, nonce_prefix, threads, max_in_flight):
+                digest.update(ciphertext)
+            t_enc = time.perf_counter() - t0
+            assert digest.digest() == ciphertext_digest.digest()
+
+            digest = hashlib.sha256()
+            spool.seek(0)
+            t0 = time.perf_counter()
+            ciphertext_chunks = iter(lambda: spool.read(chunk_size + GCM_TAG_SIZE), b"")
+            for chunk in decrypt_stream_parallel(aes_key, ciphertext_chunks, nonce_prefix, threads, max_in_flight):
+                digest.update(chunk)
+            t_dec = time.perf_counter() - t0
+            assert digest.digest() == plaintext_digest.digest()
+
+            enc_gbps = (file_size / 1e9) / t_enc if t_enc > 0 else 0
+            dec_gbps = (file_size / 1e9) / t_dec if t_dec > 0 else 0
+            if baseline is None:
+                baseline = enc_gbps
+
+            speedup = enc_gbps / baseline if baseline > 0 else 0
+            rows.append({
+                "Algorithm": "AES-256-GCM",
+                "Threads": threads,
+                "Chunk Size (B)": chunk_size,
+                "File Size (B)": file_size,
+                "Encrypt (ms)": t_enc * 1000,
+                "Decrypt (ms)": t_dec * 1000,
+                "Encrypt (GB/s)": enc_gbps,
+                "Decrypt (GB/s)": dec_gbps,
+                "Speedup": speedup,
+                "Efficiency (%)": speedup / threads * 100,
+            })
+
+    return rows
@@ -0,0 +1,61 @@
+"""
+Seeded benchmark payloads.
+Kept free of heavy imports so the UI sidebar can use the default seed
+without loading the benchmark engine; numpy is only imported once a
+seeded payload is actually generated.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+
+DEFAULT_PAYLOAD_SEED = 42
+
+# Total payload bytes a PayloadCache keeps by default
+PAYLOAD_CACHE_BYTES = 256 * 1024 * 1024
+
+
+def generate_payload(size, seed=DEFAULT_PAYLOAD_SEED):
+    """
+    Generate a pseudo-random payload of `size` bytes.
+
+    The same (size, seed) always yields the same bytes, so runs are
+    reproducible; seed=None draws from os.urandom instead.
+    """
+    if seed is None:
+        return os.urandom(size)
+    import numpy as np
+    return np.random.default_rng(seed).bytes(size)
+
+
+class PayloadCache:
+    """
+    Thread-safe LRU cache of seeded payloads, bounded by their total size.
+
+    Payloads are evicted least recently used first until the new one fits;
+    a payload larger than `max_bytes` is generated but not kept.
+    """
+
+    def __init__(self, max_bytes=PAYLOAD_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self._payloads = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, size, seed=DEFAULT_PAYLOAD_SEED):
+        """Return generate_payload(size, seed), from the cache when possible."""
+        key = (size, seed)
+        with self._lock:
+            if key in self._payloads:
+                self._payloads.move_to_end(key)
+                return self._payloads[key]
+            payload = generate_payload(size, seed)
+            if seed is None or size > self.max_bytes:
+                return payload
+            while self.size_bytes + size > self.max_bytes:
+                _, evicted = self._payloads.popitem(last=False)
+                self.size_bytes -= len(evicted)
+            self._payloads[key] = payload
+            self.size_bytes += size
+            return payload
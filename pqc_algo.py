@@ -1,5 +1,9 @@
 import time
 import sys
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
 
 # Global flag to check library availability
 OQS_AVAILABLE = False
@@ -10,10 +14,110 @@ try:
 except ImportError:
     OQS_AVAILABLE = False
 
+class ContextPool:
+    """
+    Bounded pool of reusable liboqs contexts keyed by mechanism name.
+
+    Constructing ``oqs.KeyEncapsulation`` / ``oqs.Signature`` objects is not free,
+    so benchmarks borrow idle contexts from here instead of building two new ones
+    per iteration. At most ``max_per_mechanism`` idle contexts are kept for each
+    mechanism and at most ``max_mechanisms`` mechanisms are tracked; the least
+    recently used mechanism is evicted (and its contexts freed) beyond that.
+    """
+
+    def __init__(self, max_per_mechanism=4, max_mechanisms=32):
+        self.max_per_mechanism = max_per_mechanism
+        self.max_mechanisms = max_mechanisms
+        self._idle = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _construct(kind, algo_name):
+        if kind == "kem":
+            return oqs.KeyEncapsulation(algo_name)
+        return oqs.Signature(algo_name)
+
+    @staticmethod
+    def _free(ctx):
+        free = getattr(ctx, "free", None)
+        if free is not None:
+            free()
+
+    def acquire(self, kind, algo_name):
+        """Return an idle context for (kind, algo_name), constructing one if needed."""
+        key = (kind, algo_name)
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                self._idle.move_to_end(key)
+                return idle.pop()
+        return self._construct(kind, algo_name)
+
+    def release(self, kind, algo_name, ctx):
+        """Return a context to the pool, freeing it if the pool is full."""
+        key = (kind, algo_name)
+        evicted = []
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            self._idle.move_to_end(key)
+            if len(idle) < self.max_per_mechanism:
+                idle.append(ctx)
+                ctx = None
+            while len(self._idle) > self.max_mechanisms:
+                _, contexts = self._idle.popitem(last=False)
+                evicted.extend(contexts)
+        if ctx is not None:
+            evicted.append(ctx)
+        for old in evicted:
+            self._free(old)
+
+    def clear(self):
+        """Free every idle context held by the pool."""
+        with self._lock:
+            evicted = [ctx for contexts in self._idle.values() for ctx in contexts]
+            self._idle.clear()
+        for ctx in evicted:
+            self._free(ctx)
+
+    def size(self, kind=None, algo_name=None):
+        """Number of idle contexts, optionally restricted to one kind/mechanism."""
+        with self._lock:
+            return sum(len(contexts) for (k, name), contexts in self._idle.items()
+                       if (kind is None or k == kind) and (algo_name is None or name == algo_name))
+
+
+# Shared pool used by the benchmark functions below
+CONTEXT_POOL = ContextPool()
+
+
+def _open_contexts(kind, algo_name, count, use_pool):
+    """Borrow (or construct) `count` contexts and time how long it took."""
+    t0 = time.perf_counter()
+    if use_pool:
+        contexts = [CONTEXT_POOL.acquire(kind, algo_name) for _ in range(count)]
+    else:
+        contexts = [ContextPool._construct(kind, algo_name) for _ in range(count)]
+    t_setup = (time.perf_counter() - t0) * 1000
+    return contexts, t_setup
+
+
+def _close_contexts(kind, algo_name, contexts, use_pool):
+    for ctx in contexts:
+        if use_pool:
+            CONTEXT_POOL.release(kind, algo_name, ctx)
+        else:
+            ContextPool._free(ctx)
+
+
 def get_available_kem():
     """Returns a list of enabled PQC Key Encapsulation Mechanisms."""
+    return list(_discover_kem())
+
+@lru_cache(maxsize=None)
+def _discover_kem():
+    """Query liboqs once per process; the enabled mechanisms cannot change at runtime."""
     if not OQS_AVAILABLE:
-        return []
+        return ()
 
     if hasattr(oqs, "get_enabled_kem_mechanisms"):
         all_kems = oqs.get_enabled_kem_mechanisms()
@@ -23,16 +127,21 @@ def get_available_kem():
         try:
             all_kems = oqs.KeyEncapsulation.get_enabled_mechanisms()
         except AttributeError:
-            return []
+            return ()
 
     priority_list = ["Kyber", "ML-KEM", "BIKE", "HQC", "FrodoKEM"] 
     filtered = [alg for alg in all_kems if any(p in alg for p in priority_list)]
-    return filtered if filtered else all_kems
+    return tuple(filtered if filtered else all_kems)
 
 def get_available_sig():
     """Returns a list of enabled PQC Digital Signature algorithms."""
+    return list(_discover_sig())
+
+@lru_cache(maxsize=None)
+def _discover_sig():
+    """Query liboqs once per process; the enabled mechanisms cannot change at runtime."""
     if not OQS_AVAILABLE:
-        return []
+        return ()
     
     if hasattr(oqs, "get_enabled_sig_mechanisms"):
         all_sigs = oqs.get_enabled_sig_mechanisms()
@@ -42,58 +151,69 @@ def get_available_sig():
         try:
             all_sigs = oqs.Signature.get_enabled_mechanisms()
         except AttributeError:
-            return []
+            return ()
 
     priority_list = ["Dilithium", "ML-DSA", "Falcon", "SPHINCS", "SLH-DSA"]
     filtered = [alg for alg in all_sigs if any(p in alg for p in priority_list)]
-    return filtered if filtered else all_sigs
+    return tuple(filtered if filtered else all_sigs)
 
-def benchmark_pqc_kem(algo_name, payload=None):
+def benchmark_pqc_kem(algo_name, payload=None, use_pool=True, report_setup=False):
     """
     Benchmarks Post-Quantum Key Encapsulation.
+
+    Contexts are borrowed from CONTEXT_POOL unless use_pool is False. With
+    report_setup=True the time spent obtaining the contexts is returned
+    separately as "Setup (ms)".
     """
     if not OQS_AVAILABLE:
         raise RuntimeError("Liboqs not available")
 
     results = {}
     
-    # Context manager ensures memory is freed
-    with oqs.KeyEncapsulation(algo_name) as client:
-        with oqs.KeyEncapsulation(algo_name) as server:
-            
-            # 1. Key Generation
-            t0 = time.perf_counter()
-            public_key = client.generate_keypair()
-            t_gen = (time.perf_counter() - t0) * 1000
-            
-            secret_key = client.export_secret_key()
-            
-            # 2. Encapsulation
-            t0 = time.perf_counter()
-            ciphertext, shared_secret_client = server.encap_secret(public_key)
-            t_enc = (time.perf_counter() - t0) * 1000
-            
-            # 3. Decapsulation
-            t0 = time.perf_counter()
-            shared_secret_server = client.decap_secret(ciphertext)
-            t_dec = (time.perf_counter() - t0) * 1000
-            
-            assert shared_secret_client == shared_secret_server
-            
-            results = {
-                "KeyGen (ms)": t_gen,
-                "Encaps (ms)": t_enc,
-                "Decaps (ms)": t_dec,
-                "PK Size (B)": len(public_key),
-                "SK Size (B)": len(secret_key),
-                "CT/Sig Size (B)": len(ciphertext)
-            }
+    (client, server), t_setup = _open_contexts("kem", algo_name, 2, use_pool)
+    try:
+        # 1. Key Generation
+        t0 = time.perf_counter()
+        public_key = client.generate_keypair()
+        t_gen = (time.perf_counter() - t0) * 1000
+        
+        secret_key = client.export_secret_key()
+        
+        # 2. Encapsulation
+        t0 = time.perf_counter()
+        ciphertext, shared_secret_client = server.encap_secret(public_key)
+        t_enc = (time.perf_counter() - t0) * 1000
+        
+        # 3. Decapsulation
+        t0 = time.perf_counter()
+        shared_secret_server = client.decap_secret(ciphertext)
+        t_dec = (time.perf_counter() - t0) * 1000
+        
+        assert shared_secret_client == shared_secret_server
+        
+        results = {
+            "KeyGen (ms)": t_gen,
+            "Encaps (ms)": t_enc,
+            "Decaps (ms)": t_dec,
+            "PK Size (B)": len(public_key),
+            "SK Size (B)": len(secret_key),
+            "CT/Sig Size (B)": len(ciphertext)
+        }
+    finally:
+        _close_contexts("kem", algo_name, [client, server], use_pool)
+
+    if report_setup:
+        results["Setup (ms)"] = t_setup
 
     return results
 
-def benchmark_pqc_sign(algo_name, payload):
+def benchmark_pqc_sign(algo_name, payload, use_pool=True, report_setup=False):
     """
     Benchmarks Post-Quantum Digital Signatures.
+
+    Contexts are borrowed from CONTEXT_POOL unless use_pool is False. With
+    report_setup=True the time spent obtaining the contexts is returned
+    separately as "Setup (ms)".
     """
     if not OQS_AVAILABLE:
         raise RuntimeError("Liboqs not available")
@@ -104,33 +224,106 @@ def benchmark_pqc_sign(algo_name, payload):
     if isinstance(payload, str):
         payload = payload.encode()
         
-    with oqs.Signature(algo_name) as signer:
-        with oqs.Signature(algo_name) as verifier:
-            
-            # 1. Key Generation
-            t0 = time.perf_counter()
-            public_key = signer.generate_keypair()
-            t_gen = (time.perf_counter() - t0) * 1000
-            
-            secret_key = signer.export_secret_key()
-            
-            # 2. Signing
-            t0 = time.perf_counter()
-            signature = signer.sign(payload)
-            t_sign = (time.perf_counter() - t0) * 1000
-            
-            # 3. Verifying
-            t0 = time.perf_counter()
-            is_valid = verifier.verify(payload, signature, public_key)
-            t_vrfy = (time.perf_counter() - t0) * 1000
-            
-            results = {
-                "KeyGen (ms)": t_gen,
-                "Sign (ms)": t_sign,
-                "Verify (ms)": t_vrfy,
-                "PK Size (B)": len(public_key),
-                "SK Size (B)": len(secret_key),
-                "CT/Sig Size (B)": len(signature)
-            }
+    (signer, verifier), t_setup = _open_contexts("sig", algo_name, 2, use_pool)
+    try:
+        # 1. Key Generation
+        t0 = time.perf_counter()
+        public_key = signer.generate_keypair()
+        t_gen = (time.perf_counter() - t0) * 1000
+        
+        secret_key = signer.export_secret_key()
+        
+        # 2. Signing
+        t0 = time.perf_counter()
+        signature = signer.sign(payload)
+        t_sign = (time.perf_counter() - t0) * 1000
+        
+        # 3. Verifying
+        t0 = time.perf_counter()
+        is_valid = verifier.verify(payload, signature, public_key)
+        t_vrfy = (time.perf_counter() - t0) * 1000
+        
+        results = {
+            "KeyGen (ms)": t_gen,
+            "Sign (ms)": t_sign,
+            "Verify (ms)": t_vrfy,
+            "PK Size (B)": len(public_key),
+            "SK Size (B)": len(secret_key),
+            "CT/Sig Size (B)": len(signature)
+        }
+    finally:
+        _close_contexts("sig", algo_name, [signer, verifier], use_pool)
+
+    if report_setup:
+        results["Setup (ms)"] = t_setup
             
-    return results
\ No newline at end of file
+    return results
+
+
+@contextmanager
+def pqc_kem_operations(algo_name, use_pool=True):
+    """
+    Prepare one KEM keypair and ciphertext, yielding (operations, sizes).
+
+    KeyGen runs on its own context so that repeated key generation does not
+    replace the secret key used by the Decaps operation.
+    """
+    if not OQS_AVAILABLE:
+        raise RuntimeError("Liboqs not available")
+
+    contexts, _ = _open_contexts("kem", algo_name, 3, use_pool)
+    keygen, client, server = contexts
+    try:
+        public_key = client.generate_keypair()
+        secret_key = client.export_secret_key()
+        ciphertext, _ = server.encap_secret(public_key)
+
+        operations = {
+            "KeyGen": keygen.generate_keypair,
+            "Encaps": lambda: server.encap_secret(public_key),
+            "Decaps": lambda: client.decap_secret(ciphertext),
+        }
+        sizes = {
+            "PK Size (B)": len(public_key),
+            "SK Size (B)": len(secret_key),
+            "CT/Sig Size (B)": len(ciphertext)
+        }
+        yield operations, sizes
+    finally:
+        _close_contexts("kem", algo_name, contexts, use_pool)
+
+
+@contextmanager
+def pqc_sign_operations(algo_name, payload, use_pool=True):
+    """
+    Prepare one signature keypair and signature, yielding (operations, sizes).
+
+    KeyGen runs on its own context so that repeated key generation does not
+    replace the signing key.
+    """
+    if not OQS_AVAILABLE:
+        raise RuntimeError("Liboqs not available")
+
+    if isinstance(payload, str):
+        payload = payload.encode()
+
+    contexts, _ = _open_contexts("sig", algo_name, 3, use_pool)
+    keygen, signer, verifier = contexts
+    try:
+        public_key = signer.generate_keypair()
+        secret_key = signer.export_secret_key()
+        signature = signer.sign(payload)
+
+        operations = {
+            "KeyGen": keygen.generate_keypair,
+            "Sign": lambda: signer.sign(payload),
+            "Verify": lambda: verifier.verify(payload, signature, public_key),
+        }
+        sizes = {
+            "PK Size (B)": len(public_key),
+            "SK Size (B)": len(secret_key),
+            "CT/Sig Size (B)": len(signature)
+        }
+        yield operations, sizes
+    finally:
+        _close_contexts("sig", algo_name, contexts, use_pool)
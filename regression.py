@@ -0,0 +1,188 @@
+"""
+Performance regression detection between benchmark runs.
+Compares the raw per-iteration measurements of two runs per
+(algorithm, operation) with a Mann-Whitney U test and an effect-size
+threshold, and reports regressions as a table and a process exit code.
+
+Usage:
+    python regression.py BASELINE_RUN CANDIDATE_RUN [--db PATH] [--alpha 0.05] [--threshold 5] [--force]
+"""
+
+import sys
+import argparse
+
+import pandas as pd
+
+import statistics_utils
+
+
+REPORT_COLUMNS = [
+    "Algorithm", "Operation", "Baseline Median (ms)", "Candidate Median (ms)",
+    "Change (%)", "Cliff's Delta", "p-value", "Baseline N", "Candidate N", "Status"
+]
+
+# Run configuration that must match for two runs' timings to be comparable
+COMPARABLE_CONFIG_KEYS = ["mode", "iteration_mode", "timer", "payload_size", "keypairs"]
+
+
+def get_operation_names(mode):
+    """Map raw measurement keys ('KG', 'OP1', ...) to operation names for a benchmark mode."""
+    if mode.startswith("KEM") or mode.startswith("Hybrid"):
+        op1, op2 = "Encaps", "Decaps"
+    else:
+        op1, op2 = "Sign", "Verify"
+    return {"KG": "KeyGen", "OP1": op1, "OP2": op2,
+            "AES_ENC": "AES Encrypt", "AES_DEC": "AES Decrypt"}
+
+
+def compare_samples(baseline, candidate, alpha=0.05, threshold=5.0, min_effect=0.147):
+    """
+    Classify the change between two samples of one operation's timings.
+
+    A change is significant only if the Mann-Whitney p-value is below alpha,
+    the relative median change is at least `threshold` percent and
+    |Cliff's delta| is at least `min_effect`, so tiny but statistically
+    significant shifts from large samples are not reported.
+
+    Args:
+        baseline: Baseline timings (ms)
+        candidate: Candidate timings (ms)
+        alpha: Significance level
+        threshold: Minimum relative median change in percent
+        min_effect: Minimum absolute Cliff's delta
+
+    Returns:
+        Dictionary with medians, change (%), effect size, p-value and status
+        ('regression', 'improvement', 'unchanged' or 'insufficient data')
+    """
+    base_stats = statistics_utils.compute_statistics(baseline)
+    cand_stats = statistics_utils.compute_statistics(candidate)
+    base_median = base_stats["median"]
+    cand_median = cand_stats["median"]
+    change = (cand_median - base_median) / base_median * 100 if base_median > 0 else 0.0
+
+    test = statistics_utils.mann_whitney_u(baseline, candidate)
+    delta = statistics_utils.cliffs_delta(baseline, candidate)
+
+    if len(baseline) < 2 or len(candidate) < 2:
+        status = "insufficient data"
+    elif test["p_value"] < alpha and abs(change) >= threshold and abs(delta) >= min_effect:
+        status = "regression" if change > 0 else "improvement"
+    else:
+        status = "unchanged"
+
+    return {
+        "Baseline Median (ms)": base_median,
+        "Candidate Median (ms)": cand_median,
+        "Change (%)": change,
+        "Cliff's Delta": delta,
+        "p-value": test["p_value"],
+        "Baseline N": len(baseline),
+        "Candidate N": len(candidate),
+        "Status": status,
+    }
+
+
+def detect_regressions(baseline_raw, candidate_raw, mode="", alpha=0.05, threshold=5.0, min_effect=0.147):
+    """
+    Compare two runs' raw measurements per (algorithm, operation).
+
+    Args:
+        baseline_raw: {algorithm: {key: [samples]}} of the baseline run
+        candidate_raw: {algorithm: {key: [samples]}} of the candidate run
+        mode: Benchmark mode, used to name operations
+        alpha: Significance level
+        threshold: Minimum relative median change in percent
+        min_effect: Minimum absolute Cliff's delta
+
+    Returns:
+        DataFrame with one row per (algorithm, operation) present in both runs
+    """
+    names = get_operation_names(mode)
+    rows = []
+    for algorithm, base_acc in baseline_raw.items():
+        cand_acc = candidate_raw.get(algorithm)
+        if not cand_acc:
+            continue
+        for key, base_values in base_acc.items():
+            cand_values = cand_acc.get(key)
+            if not base_values or not cand_values:
+                continue
+            row = {"Algorithm": algorithm, "Operation": names.get(key, key)}
+            row.update(compare_samples(base_values, cand_values, alpha, threshold, min_effect))
+            rows.append(row)
+    return pd.DataFrame(rows, columns=REPORT_COLUMNS)
+
+
+def config_mismatches(baseline_config, candidate_config):
+    """Return {key: (baseline value, candidate value)} for the COMPARABLE_CONFIG_KEYS that differ."""
+    return {key: (baseline_config.get(key), candidate_config.get(key))
+            for key in COMPARABLE_CONFIG_KEYS
+            if baseline_config.get(key) != candidate_config.get(key)}
+
+
+def compare_stored_runs(store, baseline_run, candidate_run, alpha=0.05, threshold=5.0, min_effect=0.147,
+                        force=False):
+    """
+    Run detect_regressions on two runs loaded from a result_store.ResultStore.
+
+    Raises ValueError if the runs differ in any of COMPARABLE_CONFIG_KEYS
+    (e.g. a round-trip baseline against an operation-mode candidate),
+    unless `force` is set.
+    """
+    info = store.get_run_info(baseline_run)
+    mismatches = config_mismatches(info["config"], store.get_run_info(candidate_run)["config"])
+    if mismatches and not force:
+        details = ", ".join(f"{key}: {base!r} vs {cand!r}" for key, (base, cand) in mismatches.items())
+        raise ValueError(f"Runs {baseline_run} and {candidate_run} were configured differently ({details})")
+    return detect_regressions(store.load_measurements(baseline_run), store.load_measurements(candidate_run),
+                              info["mode"], alpha, threshold, min_effect)
+
+
+def has_regressions(report):
+    """Return True if a regression report contains any regression."""
+    return bool((report["Status"] == "regression").any())
+
+
+def main(argv=None):
+    """Command-line entry point; returns 1 if any regression is detected, 2 if the runs are not comparable, else 0."""
+    import result_store
+
+    parser = argparse.ArgumentParser(description="Detect performance regressions between two stored benchmark runs.")
+    parser.add_argument("baseline", type=int, help="Baseline run ID")
+    parser.add_argument("candidate", type=int, help="Candidate run ID")
+    parser.add_argument("--db", default=result_store.DEFAULT_DB_PATH, help="Result store database path")
+    parser.add_argument("--alpha", type=float, default=0.05, help="Significance level (default: 0.05)")
+    parser.add_argument("--threshold", type=float, default=5.0,
+                        help="Minimum median change in percent (default: 5)")
+    parser.add_argument("--min-effect", type=float, default=0.147,
+                        help="Minimum absolute Cliff's delta (default: 0.147)")
+    parser.add_argument("--csv", help="Also write the report to this CSV file")
+    parser.add_argument("--force", action="store_true",
+                        help="Compare runs even if their mode, iteration mode, timer, payload size or keypairs differ")
+    args = parser.parse_args(argv)
+
+    with result_store.ResultStore(args.db) as store:
+        try:
+            report = compare_stored_runs(store, args.baseline, args.candidate,
+                                         args.alpha, args.threshold, args.min_effect, args.force)
+        except ValueError as e:
+            print(f"{e}; pass --force to compare them anyway.", file=sys.stderr)
+            return 2
+
+    if report.empty:
+        print("No common (algorithm, operation) measurements between the two runs.")
+        return 0
+
+    print(report.to_string(index=False, float_format=lambda v: f"{v:.4g}"))
+    if args.csv:
+        report.to_csv(args.csv, index=False)
+
+    print(f"\n{int((report['Status'] == 'regression').sum())} regression(s), "
+          f"{int((report['Status'] == 'improvement').sum())} improvement(s) "
+          f"out of {len(report)} comparisons")
+    return 1 if has_regressions(report) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
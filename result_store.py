@@ -0,0 +1,357 @@
+"""
+Persistent benchmark result store.
+Records every benchmark run (configuration, system information, summary
+rows and raw per-iteration measurements) in a local SQLite database so that
+runs can be listed, reloaded and compared across sessions.
+"""
+
+import os
+import json
+import socket
+import sqlite3
+import threading
+from datetime import datetime
+
+import pandas as pd
+
+import hdr_histogram
+
+
+DEFAULT_DB_PATH = os.environ.get(
+    "PQC_BENCHMARK_DB",
+    os.path.join(os.path.expanduser("~"), ".pqc_benchmark", "results.db")
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    host TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    label TEXT,
+    config TEXT NOT NULL,
+    system_info TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    algorithm TEXT NOT NULL,
+    family TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS measurements (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    algorithm TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    iteration INTEGER NOT NULL,
+    value REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS histograms (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    algorithm TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_timestamp ON runs(timestamp);
+CREATE INDEX IF NOT EXISTS idx_runs_host ON runs(host, timestamp);
+CREATE INDEX IF NOT EXISTS idx_runs_mode ON runs(mode, timestamp);
+CREATE INDEX IF NOT EXISTS idx_results_run ON results(run_id);
+CREATE INDEX IF NOT EXISTS idx_results_algorithm ON results(algorithm, run_id);
+CREATE INDEX IF NOT EXISTS idx_measurements_run ON measurements(run_id, algorithm, operation);
+CREATE INDEX IF NOT EXISTS idx_histograms_run ON histograms(run_id, algorithm);
+"""
+
+
+def _to_json(value):
+    """Serialize a value to JSON, converting numpy / pandas scalars."""
+    def default(obj):
+        if hasattr(obj, "item"):
+            return obj.item()
+        if hasattr(obj, "isoformat"):
+            return obj.isoformat()
+        return str(obj)
+    return json.dumps(value, default=default)
+
+
+class ResultStore:
+    """
+    SQLite-backed store of benchmark runs.
+
+    Each run has one row in `runs` (timestamp, host, mode, JSON config and
+    system info), one row per algorithm in `results` (the summary row as
+    JSON), one row per sample in `measurements` (the raw per-iteration
+    lists keyed by 'KG', 'OP1', 'OP2', ...) and one encoded HdrHistogram per
+    (algorithm, operation) in `histograms`.
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+
+    def save_run(self, df, raw_measurements=None, config=None, system_info=None,
+                 label=None, host=None, timestamp=None, histograms=None):
+        """
+        Store a benchmark run.
+
+        Args:
+            df: pandas DataFrame with one summary row per algorithm
+            raw_measurements: Optional {algorithm: {key: [samples]}} dictionary
+                              as kept in st.session_state['raw_measurements']
+            config: Benchmark configuration dictionary (must contain 'mode')
+            system_info: Optional dictionary from export_utils.get_system_info
+            label: Optional free-text label (e.g. 'liboqs 0.10.1')
+            host: Host name (default: socket.gethostname())
+            timestamp: ISO timestamp (default: now)
+            histograms: Optional {algorithm: {key: HdrHistogram}} dictionary
+
+        Returns:
+            ID of the new run
+        """
+        config = config or {}
+        host = host or socket.gethostname()
+        timestamp = timestamp or datetime.now().isoformat()
+
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO runs (timestamp, host, mode, label, config, system_info) VALUES (?, ?, ?, ?, ?, ?)",
+                (timestamp, host, config.get("mode", ""), label, _to_json(config), _to_json(system_info or {}))
+            )
+            run_id = cursor.lastrowid
+
+            self._conn.executemany(
+                "INSERT INTO results (run_id, algorithm, family, data) VALUES (?, ?, ?, ?)",
+                [(run_id, str(row.get("Algorithm", "")), row.get("Family"), _to_json(row))
+                 for row in df.to_dict("records")]
+            )
+
+            for algorithm, acc in (raw_measurements or {}).items():
+                self._conn.executemany(
+                    "INSERT INTO measurements (run_id, algorithm, operation, iteration, value) VALUES (?, ?, ?, ?, ?)",
+                    [(run_id, algorithm, operation, i, float(value))
+                     for operation, values in acc.items()
+                     for i, value in enumerate(values)]
+                )
+
+            for algorithm, algo_histograms in (histograms or {}).items():
+                self._conn.executemany(
+                    "INSERT INTO histograms (run_id, algorithm, operation, data) VALUES (?, ?, ?, ?)",
+                    [(run_id, algorithm, operation, histogram.encode())
+                     for operation, histogram in algo_histograms.items()]
+                )
+
+        return run_id
+
+    def list_runs(self, mode=None, host=None, algorithm=None, since=None, until=None, limit=100):
+        """
+        List stored runs, newest first.
+
+        Args:
+            mode: Only runs of this benchmark mode
+            host: Only runs recorded on this host
+            algorithm: Only runs that include this algorithm
+            since: Only runs at or after this ISO timestamp
+            until: Only runs before this ISO timestamp
+            limit: Maximum number of runs returned
+
+        Returns:
+            DataFrame with run id, timestamp, host, mode, label and algorithm count
+        """
+        query = """
+            SELECT runs.id AS "Run", runs.timestamp AS "Timestamp", runs.host AS "Host",
+                   runs.mode AS "Mode", runs.label AS "Label",
+                   (SELECT COUNT(*) FROM results WHERE results.run_id = runs.id) AS "Algorithms"
+            FROM runs
+        """
+        conditions, params = [], []
+        if mode:
+            conditions.append("runs.mode = ?")
+            params.append(mode)
+        if host:
+            conditions.append("runs.host = ?")
+            params.append(host)
+        if algorithm:
+            conditions.append("EXISTS (SELECT 1 FROM results WHERE results.run_id = runs.id AND results.algorithm = ?)")
+            params.append(algorithm)
+        if since:
+            conditions.append("runs.timestamp >= ?")
+            params.append(since)
+        if until:
+            conditions.append("runs.timestamp < ?")
+            params.append(until)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY runs.timestamp DESC, runs.id DESC LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            return pd.read_sql_query(query, self._conn, params=params)
+
+    def get_run_info(self, run_id):
+        """Return the run's timestamp, host, mode, label, config and system info."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT timestamp, host, mode, label, config, system_info FROM runs WHERE id = ?", (run_id,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(f"No run with id {run_id}")
+        return {
+            "id": run_id,
+            "timestamp": row[0],
+            "host": row[1],
+            "mode": row[2],
+            "label": row[3],
+            "config": json.loads(row[4]),
+            "system_info": json.loads(row[5]),
+        }
+
+    def load_results(self, run_id):
+        """Return the summary rows of a run as a DataFrame."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM results WHERE run_id = ? ORDER BY id", (run_id,)
+            ).fetchall()
+        return pd.DataFrame([json.loads(row[0]) for row in rows])
+
+    def load_measurements(self, run_id, algorithm=None, operation=None):
+        """
+        Return the raw measurements of a run.
+
+        Returns:
+            Dictionary {algorithm: {operation key: [samples]}} in the same
+            shape as st.session_state['raw_measurements']
+        """
+        query = "SELECT algorithm, operation, value FROM measurements WHERE run_id = ?"
+        params = [run_id]
+        if algorithm:
+            query += " AND algorithm = ?"
+            params.append(algorithm)
+        if operation:
+            query += " AND operation = ?"
+            params.append(operation)
+        query += " ORDER BY algorithm, operation, iteration"
+
+        raw = {}
+        with self._lock:
+            for algo, op, value in self._conn.execute(query, params):
+                raw.setdefault(algo, {}).setdefault(op, []).append(value)
+        return raw
+
+    def load_histograms(self, run_id, algorithm=None):
+        """
+        Return the latency histograms of a run.
+
+        Returns:
+            Dictionary {algorithm: {operation key: HdrHistogram}}
+        """
+        query = "SELECT algorithm, operation, data FROM histograms WHERE run_id = ?"
+        params = [run_id]
+        if algorithm:
+            query += " AND algorithm = ?"
+            params.append(algorithm)
+
+        histograms = {}
+        with self._lock:
+            for algo, op, data in self._conn.execute(query, params):
+                histograms.setdefault(algo, {})[op] = hdr_histogram.HdrHistogram.decode(data)
+        return histograms
+
+    def load_run(self, run_id):
+        """
+        Load a complete run.
+
+        Returns:
+            Tuple (summary DataFrame, raw measurements, run info)
+        """
+        info = self.get_run_info(run_id)
+        return self.load_results(run_id), self.load_measurements(run_id), info
+
+    def algorithm_history(self, algorithm, metric="Total Time (ms)", mode=None, host=None, limit=100):
+        """
+        Return one metric of an algorithm across stored runs, oldest first.
+
+        Returns:
+            DataFrame with run id, timestamp, host, mode and the metric value
+        """
+        query = """
+            SELECT runs.id, runs.timestamp, runs.host, runs.mode, results.data
+            FROM results JOIN runs ON runs.id = results.run_id
+            WHERE results.algorithm = ?
+        """
+        params = [algorithm]
+        if mode:
+            query += " AND runs.mode = ?"
+            params.append(mode)
+        if host:
+            query += " AND runs.host = ?"
+            params.append(host)
+        query += " ORDER BY runs.timestamp DESC, runs.id DESC LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        history = pd.DataFrame([
+            {"Run": run, "Timestamp": ts, "Host": h, "Mode": m, metric: json.loads(data).get(metric)}
+            for run, ts, h, m, data in reversed(rows)
+        ], columns=["Run", "Timestamp", "Host", "Mode", metric])
+        return history
+
+    def compare_runs(self, run_a, run_b, metrics=None):
+        """
+        Compare the summary metrics of two runs per algorithm.
+
+        Args:
+            run_a: Baseline run ID
+            run_b: Candidate run ID
+            metrics: Metric columns to compare (default: all numeric '(ms)' columns
+                     present in both runs)
+
+        Returns:
+            DataFrame with baseline value, candidate value and change (%) per
+            (algorithm, metric) for algorithms present in both runs
+        """
+        df_a = self.load_results(run_a)
+        df_b = self.load_results(run_b)
+        if df_a.empty or df_b.empty:
+            return pd.DataFrame(columns=["Algorithm", "Metric", "Baseline", "Candidate", "Change (%)"])
+
+        if metrics is None:
+            metrics = [c for c in df_a.columns if c.endswith("(ms)") and c in df_b.columns]
+
+        merged = df_a.merge(df_b, on="Algorithm", suffixes=(" [A]", " [B]"))
+        rows = []
+        for _, row in merged.iterrows():
+            for metric in metrics:
+                a = row.get(f"{metric} [A]")
+                b = row.get(f"{metric} [B]")
+                if a is None or b is None or pd.isna(a) or pd.isna(b):
+                    continue
+                rows.append({
+                    "Algorithm": row["Algorithm"],
+                    "Metric": metric,
+                    "Baseline": a,
+                    "Candidate": b,
+                    "Change (%)": (b - a) / a * 100 if a else 0,
+                })
+        return pd.DataFrame(rows, columns=["Algorithm", "Metric", "Baseline", "Candidate", "Change (%)"])
+
+    def delete_run(self, run_id):
+        """Delete a run together with its results and measurements."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM runs WHERE id = ?", (run_id,))
@@ -0,0 +1,107 @@
+"""
+Parallel benchmark runner.
+Dispatches independent (algorithm, mode) benchmark jobs to a process pool
+(or one isolated worker process per job) and reports each result as soon
+as it completes.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import multiprocessing
+
+
+def get_available_cpus():
+    """Return the sorted list of CPU ids this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _pin_worker(counter, cpus):
+    """Pool initializer: pin each new worker process to its own CPU."""
+    with counter.get_lock():
+        slot = counter.value
+        counter.value += 1
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {cpus[slot % len(cpus)]})
+
+
+def _run_job(job):
+    """Run one benchmark job, returning (result, error message)."""
+    import benchmark_engine
+    
+    try:
+        return benchmark_engine.benchmark_algorithm(**job), None
+    except Exception as e:
+        return None, str(e)
+
+
+def run_benchmark_jobs(jobs, max_workers=1, pin_cpus=False, on_complete=None, cancel_event=None,
+                       isolate=False, isolate_cpu=None):
+    """
+    Run benchmark jobs, optionally in parallel worker processes.
+
+    Args:
+        jobs: List of keyword-argument dictionaries for
+              benchmark_engine.benchmark_algorithm (mode, algo, payload_bytes, ...)
+        max_workers: Number of worker processes; 1 runs the jobs sequentially
+                     in the current process (or, with `isolate`, each in its
+                     own worker process)
+        pin_cpus: If True, pin every worker process to a distinct CPU
+        on_complete: Optional callback(done_count, job, result, error) invoked
+                     in completion order as each job finishes
+        cancel_event: Optional threading.Event; once set, jobs that have not
+                      started yet are skipped
+        isolate: Run sequential jobs one at a time in an isolated worker
+                 process (see isolation.run_isolated)
+        isolate_cpu: CPU id the isolated worker is pinned to
+
+    Returns:
+        List of (job, result, error) tuples in submission order, where result
+        is the (summary row, raw measurements, histograms) tuple from the
+        engine; skipped jobs are omitted
+    """
+    outcomes = [None] * len(jobs)
+    done = 0
+
+    if max_workers <= 1:
+        for i, job in enumerate(jobs):
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            if isolate:
+                import isolation
+                result, error = isolation.run_isolated(job, isolate_cpu)
+            else:
+                result, error = _run_job(job)
+            outcomes[i] = (job, result, error)
+            done += 1
+            if on_complete:
+                on_complete(done, job, result, error)
+        return [outcome for outcome in outcomes if outcome is not None]
+
+    initializer = None
+    initargs = ()
+    if pin_cpus:
+        cpus = get_available_cpus()
+        initializer = _pin_worker
+        initargs = (multiprocessing.Value('i', 0), cpus)
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=initializer, initargs=initargs) as executor:
+        futures = {executor.submit(_run_job, job): i for i, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            i = futures[future]
+            try:
+                result, error = future.result()
+            except Exception as e:  # worker crashed or job could not be pickled
+                result, error = None, str(e)
+            outcomes[i] = (jobs[i], result, error)
+            done += 1
+            if on_complete:
+                on_complete(done, jobs[i], result, error)
+            if cancel_event is not None and cancel_event.is_set():
+                for pending in futures:
+                    pending.cancel()
+
+    return [outcome for outcome in outcomes if outcome is not None]
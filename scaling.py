@@ -0,0 +1,168 @@
+"""
+Multi-core scaling benchmarks.
+Runs the same cryptographic operation concurrently in 1, 2, 4, ... N workers
+(processes or threads) and reports aggregate throughput and per-core efficiency.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import threading
+
+import benchmark_engine
+import measurement
+import runner
+
+
+# Seconds workers wait for each other after preparing their keys
+BARRIER_TIMEOUT = 60
+
+
+def get_worker_counts(max_workers=None):
+    """
+    Return the worker counts for a scaling sweep: powers of two up to
+    max_workers, always including max_workers itself.
+    """
+    if max_workers is None:
+        max_workers = len(runner.get_available_cpus())
+    max_workers = max(1, max_workers)
+
+    counts = []
+    n = 1
+    while n < max_workers:
+        counts.append(n)
+        n *= 2
+    counts.append(max_workers)
+    return counts
+
+
+def get_operations(mode):
+    """Return the operations that can be swept for a benchmark mode."""
+    return ["KeyGen"] + benchmark_engine.get_operation_labels(mode)
+
+
+def _throughput_worker(mode, algo, payload_bytes, operation, time_budget, barrier):
+    """Prepare keys, wait for all workers, then measure one operation's throughput."""
+    try:
+        open_operations = benchmark_engine.get_operations_factory(mode, algo, payload_bytes)
+        with open_operations() as (operations, _):
+            barrier.wait()
+            return measurement.measure_throughput(operations[operation], time_budget)["ops_per_sec"]
+    except threading.BrokenBarrierError:
+        raise
+    except Exception:
+        # Release the workers still waiting for this one
+        barrier.abort()
+        raise
+
+
+def _collect(futures):
+    """Return every worker's result, raising the first real worker error."""
+    results = []
+    broken = False
+    error = None
+    for future in futures:
+        try:
+            results.append(future.result())
+        except threading.BrokenBarrierError:
+            broken = True
+        except Exception as e:
+            error = error or e
+    if error is not None:
+        raise error
+    if broken:
+        raise RuntimeError(f"Workers did not all start within {BARRIER_TIMEOUT} s")
+    return results
+
+
+def measure_concurrent_throughput(mode, algo, payload_bytes, operation, workers,
+                                  backend="process", time_budget=1.0):
+    """
+    Run one operation concurrently in `workers` processes or threads.
+
+    All workers prepare their keys first and start the timed loop together.
+    If a worker fails before the start, or the workers are not all ready
+    within BARRIER_TIMEOUT seconds, the barrier is broken and the step fails
+    instead of blocking.
+
+    Args:
+        mode: Benchmark mode (e.g. 'KEM (Key Exchange Only)')
+        algo: Algorithm name
+        payload_bytes: Message to sign (signature modes)
+        operation: Operation label ('KeyGen', 'Encaps', 'Sign', ...)
+        workers: Number of concurrent workers
+        backend: 'process' or 'thread'
+        time_budget: Seconds each worker runs the operation
+
+    Returns:
+        List with the ops/sec achieved by each worker
+    """
+    args = (mode, algo, payload_bytes, operation, time_budget)
+
+    if backend == "thread":
+        barrier = threading.Barrier(workers, timeout=BARRIER_TIMEOUT)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_throughput_worker, *args, barrier) for _ in range(workers)]
+            return _collect(futures)
+
+    with multiprocessing.Manager() as manager:
+        barrier = manager.Barrier(workers, timeout=BARRIER_TIMEOUT)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_throughput_worker, *args, barrier) for _ in range(workers)]
+            return _collect(futures)
+
+
+def run_scaling_sweep(mode, algo, payload_bytes, operation, worker_counts=None,
+                      backend="process", time_budget=1.0, on_step=None, cancel_event=None):
+    """
+    Measure how an operation's throughput scales with the number of workers.
+
+    Args:
+        mode: Benchmark mode (e.g. 'KEM (Key Exchange Only)')
+        algo: Algorithm name
+        payload_bytes: Message to sign (signature modes)
+        operation: Operation label ('KeyGen', 'Encaps', 'Sign', ...)
+        worker_counts: Worker counts to test (default: 1, 2, 4, ... CPU count)
+        backend: 'process' or 'thread'
+        time_budget: Seconds each worker runs the operation per step
+        on_step: Optional callback(workers) invoked before each step
+        cancel_event: Optional threading.Event that stops the sweep before
+                      the next step once set
+
+    Returns:
+        List of result rows (one per worker count) with aggregate ops/sec,
+        per-worker ops/sec, speedup and efficiency relative to one worker
+    """
+    if worker_counts is None:
+        worker_counts = get_worker_counts()
+
+    rows = []
+    baseline = None
+
+    for workers in worker_counts:
+        if cancel_event is not None and cancel_event.is_set():
+            break
+        if on_step:
+            on_step(workers)
+
+        try:
+            per_worker = measure_concurrent_throughput(mode, algo, payload_bytes, operation,
+                                                       workers, backend, time_budget)
+        except Exception as e:
+            raise RuntimeError(f"{workers} worker(s): {e}") from e
+        aggregate = sum(per_worker)
+        if baseline is None:
+            baseline = aggregate / workers
+
+        speedup = aggregate / baseline if baseline > 0 else 0
+        rows.append({
+            "Algorithm": algo,
+            "Operation": operation,
+            "Backend": backend,
+            "Workers": workers,
+            "Aggregate (ops/s)": aggregate,
+            "Per-Worker (ops/s)": aggregate / workers,
+            "Speedup": speedup,
+            "Efficiency (%)": speedup / workers * 100,
+        })
+
+    return rows
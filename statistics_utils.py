@@ -3,8 +3,9 @@ Statistical utilities for benchmarking analysis.
 Provides comprehensive statistical metrics for performance evaluation.
 """
 
+import copy
+import math
 import numpy as np
-import pandas as pd
 
 
 def compute_statistics(measurements):
@@ -17,7 +18,7 @@ def compute_statistics(measurements):
     Returns:
         Dictionary with statistical metrics
     """
-    if not measurements or len(measurements) == 0:
+    if measurements is None or len(measurements) == 0:
         return {
             "mean": 0, "median": 0, "std": 0, "min": 0, "max": 0,
             "p25": 0, "p75": 0, "p95": 0, "p99": 0, "cv": 0, "iqr": 0
@@ -25,39 +26,54 @@ def compute_statistics(measurements):
     
     arr = np.array(measurements)
     mean_val = np.mean(arr)
+    std_val = np.std(arr)
+    # One pass over the sorted data for all percentiles
+    p25, p50, p75, p95, p99 = np.percentile(arr, [25, 50, 75, 95, 99])
     
     return {
         "mean": float(mean_val),
-        "median": float(np.median(arr)),
-        "std": float(np.std(arr)),
+        "median": float(p50),
+        "std": float(std_val),
         "min": float(np.min(arr)),
         "max": float(np.max(arr)),
-        "p25": float(np.percentile(arr, 25)),
-        "p75": float(np.percentile(arr, 75)),
-        "p95": float(np.percentile(arr, 95)),
-        "p99": float(np.percentile(arr, 99)),
-        "cv": float(np.std(arr) / mean_val) if mean_val > 0 else 0,  # Coefficient of variation
-        "iqr": float(np.percentile(arr, 75) - np.percentile(arr, 25))  # Interquartile range
+        "p25": float(p25),
+        "p75": float(p75),
+        "p95": float(p95),
+        "p99": float(p99),
+        "cv": float(std_val / mean_val) if mean_val > 0 else 0,  # Coefficient of variation
+        "iqr": float(p75 - p25)  # Interquartile range
     }
 
 
-def create_statistics_dataframe(results_dict):
+def create_statistics_dataframe(results_dict, confidence=0.95, n_resamples=2000, seed=None):
     """
     Create a detailed statistics DataFrame from raw measurement data.
     
     Args:
         results_dict: Dictionary with algorithm names as keys and 
                      measurement dictionaries as values
+        confidence: Confidence level of the bootstrap intervals
+        n_resamples: Bootstrap resamples per metric (0 disables intervals)
+        seed: Optional seed for reproducible intervals
                      
     Returns:
-        pandas DataFrame with statistical summaries
+        pandas DataFrame with statistical summaries, including
+        '<statistic>_ci_low' / '<statistic>_ci_high' bootstrap bounds for
+        mean, median and p95
     """
+    import pandas as pd
+    
     stats_data = []
     
     for algo_name, measurements in results_dict.items():
         for metric_name, values in measurements.items():
             if isinstance(values, list) and len(values) > 0:
                 stats = compute_statistics(values)
+                if n_resamples > 0:
+                    for name, (low, high) in bootstrap_ci(values, n_resamples=n_resamples,
+                                                          confidence=confidence, seed=seed).items():
+                        stats[f"{name}_ci_low"] = low
+                        stats[f"{name}_ci_high"] = high
                 stats['Algorithm'] = algo_name
                 stats['Metric'] = metric_name
                 stats_data.append(stats)
@@ -237,3 +253,382 @@ def calculate_consistency_score(measurements):
     # Convert CV to consistency score (lower CV = higher consistency)
     consistency = max(0, 100 - (cv * 100))
     return round(consistency, 2)
+
+
+def _average_ranks(values):
+    """Return 1-based ranks with ties given their average rank, plus tie group sizes."""
+    _, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+    upper = np.cumsum(counts)
+    return (upper - (counts - 1) / 2.0)[inverse], counts
+
+
+def mann_whitney_u(baseline, candidate):
+    """
+    Two-sided Mann-Whitney U test (normal approximation with tie and continuity correction).
+    
+    Args:
+        baseline: List or array of measurements
+        candidate: List or array of measurements
+        
+    Returns:
+        Dictionary with U statistic (of the candidate sample), z score and p-value
+    """
+    a = np.asarray(baseline, dtype=float)
+    b = np.asarray(candidate, dtype=float)
+    n1, n2 = len(a), len(b)
+    if n1 == 0 or n2 == 0:
+        return {"u": 0.0, "z": 0.0, "p_value": 1.0}
+    
+    ranks, ties = _average_ranks(np.concatenate([a, b]))
+    u = float(ranks[n1:].sum() - n2 * (n2 + 1) / 2.0)
+    
+    n = n1 + n2
+    mu = n1 * n2 / 2.0
+    tie_term = float(np.sum(ties ** 3 - ties)) / (n * (n - 1)) if n > 1 else 0.0
+    sigma = np.sqrt(n1 * n2 / 12.0 * ((n + 1) - tie_term))
+    if sigma == 0:
+        return {"u": u, "z": 0.0, "p_value": 1.0}
+    
+    z = (u - mu - 0.5 * np.sign(u - mu)) / sigma
+    p_value = math.erfc(abs(z) / math.sqrt(2))
+    return {"u": u, "z": float(z), "p_value": float(min(1.0, p_value))}
+
+
+def cliffs_delta(baseline, candidate):
+    """
+    Cliff's delta effect size: P(candidate > baseline) - P(candidate < baseline).
+    
+    Ranges from -1 to 1; |delta| < 0.147 is conventionally negligible,
+    < 0.33 small, < 0.474 medium and larger values large.
+    
+    Args:
+        baseline: List or array of measurements
+        candidate: List or array of measurements
+        
+    Returns:
+        Effect size in [-1, 1]
+    """
+    n1, n2 = len(baseline), len(candidate)
+    if n1 == 0 or n2 == 0:
+        return 0.0
+    u = mann_whitney_u(baseline, candidate)["u"]
+    return 2.0 * u / (n1 * n2) - 1.0
+
+
+# Statistics supported by bootstrap_ci: None is the mean, numbers are percentiles
+BOOTSTRAP_STATISTICS = {"mean": None, "median": 50, "p95": 95, "p99": 99}
+
+# Larger samples are bootstrapped through a random subsample of this size
+BOOTSTRAP_MAX_SAMPLES = 5000
+
+
+def bootstrap_ci(measurements, statistics=("mean", "median", "p95"), n_resamples=2000,
+                 confidence=0.95, seed=None, max_block_elements=2 ** 22,
+                 max_samples=BOOTSTRAP_MAX_SAMPLES):
+    """
+    Percentile bootstrap confidence intervals for mean, median and tail percentiles.
+    
+    All resamples are drawn as one index matrix per block of resamples and
+    evaluated with array operations; blocks only bound memory use
+    (`max_block_elements` indices at a time). Percentiles are read from the
+    sorted index rows, since sorting resampled indices of pre-sorted data
+    yields sorted resamples, and interpolated like np.percentile.
+    
+    The cost grows with n * n_resamples, so samples larger than
+    `max_samples` are bootstrapped through a random subsample of that size:
+    its interval is placed around the full-sample estimate and narrowed by
+    sqrt(max_samples / n), as mean and percentile estimates converge at
+    rate sqrt(n).
+    
+    Args:
+        measurements: List or array of measurements
+        statistics: Names from BOOTSTRAP_STATISTICS
+        n_resamples: Number of bootstrap resamples
+        confidence: Confidence level of the intervals
+        seed: Optional seed for reproducible intervals
+        max_block_elements: Maximum resample matrix size held in memory
+        max_samples: Largest sample bootstrapped directly (None: no limit)
+        
+    Returns:
+        Dictionary {statistic: (low, high)}
+    """
+    arr = np.sort(np.asarray(measurements, dtype=float))
+    n = len(arr)
+    if n == 0:
+        return {name: (0.0, 0.0) for name in statistics}
+    if n == 1:
+        return {name: (float(arr[0]), float(arr[0])) for name in statistics}
+    
+    rng = np.random.default_rng(seed)
+    
+    if max_samples is not None and n > max_samples:
+        subsample = rng.choice(arr, size=max_samples, replace=False)
+        sub_intervals = bootstrap_ci(subsample, statistics, n_resamples, confidence, rng,
+                                     max_block_elements, max_samples=None)
+        scale = math.sqrt(max_samples / n)
+        intervals = {}
+        for name in statistics:
+            p = BOOTSTRAP_STATISTICS[name]
+            full = float(arr.mean()) if p is None else float(np.percentile(arr, p))
+            sub = float(subsample.mean()) if p is None else float(np.percentile(subsample, p))
+            low, high = sub_intervals[name]
+            intervals[name] = (full - (sub - low) * scale, full + (high - sub) * scale)
+        return intervals
+    
+    percentiles = [BOOTSTRAP_STATISTICS[name] for name in statistics]
+    need_sort = any(p is not None for p in percentiles)
+    
+    # Linear interpolation positions as in np.percentile
+    positions = {}
+    for p in percentiles:
+        if p is not None:
+            h = (n - 1) * p / 100.0
+            lower = int(math.floor(h))
+            positions[p] = (lower, min(lower + 1, n - 1), h - lower)
+    
+    estimates = np.empty((len(statistics), n_resamples))
+    block = max(1, min(n_resamples, max_block_elements // n))
+    for start in range(0, n_resamples, block):
+        stop = min(start + block, n_resamples)
+        indices = rng.integers(0, n, size=(stop - start, n), dtype=np.int32 if n < 2 ** 31 else np.int64)
+        if need_sort:
+            indices.sort(axis=1)
+        for i, p in enumerate(percentiles):
+            if p is None:
+                estimates[i, start:stop] = arr[indices].mean(axis=1)
+            else:
+                lower, upper, fraction = positions[p]
+                low_values = arr[indices[:, lower]]
+                estimates[i, start:stop] = low_values + fraction * (arr[indices[:, upper]] - low_values)
+    
+    alpha = (1.0 - confidence) / 2.0
+    bounds = np.quantile(estimates, [alpha, 1.0 - alpha], axis=1)
+    return {name: (float(bounds[0, i]), float(bounds[1, i])) for i, name in enumerate(statistics)}
+
+
+class P2Quantile:
+    """
+    Streaming quantile estimate using the P² algorithm (Jain & Chlamtac, 1985).
+    
+    Keeps five markers whose heights approximate the minimum, p/2, p,
+    (1+p)/2 quantiles and the maximum, adjusting them with a piecewise
+    parabolic fit as samples arrive; memory is O(1) per quantile.
+    """
+    
+    def __init__(self, p):
+        self.p = p
+        self.count = 0
+        self._initial = []
+        self._q = []
+        self._n = []
+        self._desired = []
+        self._increments = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+    
+    def update(self, x):
+        """Add one observation."""
+        self.count += 1
+        if len(self._initial) < 5 and not self._q:
+            self._initial.append(x)
+            if len(self._initial) == 5:
+                self._set_markers(sorted(self._initial), [1, 2, 3, 4, 5])
+                self._initial = []
+            return
+        
+        q, n = self._q, self._n
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+        
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+        
+        for i in range(1, 4):
+            d = self._desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                candidate = self._parabolic(i, d)
+                if not q[i - 1] < candidate < q[i + 1]:
+                    candidate = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                q[i] = candidate
+                n[i] += d
+    
+    def _parabolic(self, i, d):
+        q, n = self._q, self._n
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i]) +
+            (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+    
+    def _set_markers(self, heights, positions):
+        p, total = self.p, positions[-1]
+        self._q = list(heights)
+        self._n = list(positions)
+        self._desired = [1, 1 + (total - 1) * p / 2, 1 + (total - 1) * p,
+                         1 + (total - 1) * (1 + p) / 2, total]
+    
+    def _rank(self, x):
+        """Approximate number of observations <= x."""
+        if not self._q:
+            return float(np.searchsorted(np.sort(self._initial), x, side="right"))
+        if x < self._q[0]:
+            return 0.0
+        return float(np.interp(x, self._q, self._n))
+    
+    def _heights(self):
+        return sorted(self._initial) if not self._q else list(self._q)
+    
+    def value(self):
+        """Return the current quantile estimate (0 if empty)."""
+        if self.count == 0:
+            return 0.0
+        if not self._q:
+            return float(np.percentile(self._initial, self.p * 100))
+        return float(self._q[2])
+    
+    def merge(self, other):
+        """
+        Merge another estimator for the same quantile into this one (in place).
+        
+        Exact while either side still holds its first five raw samples;
+        otherwise the combined rank function of both marker sets is inverted
+        at the new desired marker positions, which is an approximation.
+        """
+        if other.count == 0:
+            return self
+        if not other._q:
+            for x in other._initial:
+                self.update(x)
+            return self
+        if not self._q:
+            initial = self._initial
+            self.__dict__.update(copy.deepcopy(other.__dict__))
+            for x in initial:
+                self.update(x)
+            return self
+        
+        total = self.count + other.count
+        heights = np.unique(self._heights() + other._heights())
+        ranks = np.array([self._rank(h) + other._rank(h) for h in heights])
+        ranks = np.maximum.accumulate(ranks)
+        
+        p = self.p
+        targets = [1, 1 + (total - 1) * p / 2, 1 + (total - 1) * p, 1 + (total - 1) * (1 + p) / 2, total]
+        positions = [int(round(t)) for t in targets]
+        for i in range(1, 5):
+            positions[i] = max(positions[i], positions[i - 1] + 1)
+        for i in range(3, -1, -1):
+            positions[i] = min(positions[i], positions[i + 1] - 1)
+        
+        merged_heights = [float(np.interp(t, ranks, heights)) for t in positions]
+        merged_heights[0] = min(self._q[0], other._q[0])
+        merged_heights[4] = max(self._q[4], other._q[4])
+        
+        self._set_markers(merged_heights, positions)
+        self.count = total
+        return self
+
+
+class StreamingStatistics:
+    """
+    Online accumulator for benchmark measurements in O(1) memory.
+    
+    Mean and variance are updated with Welford's algorithm and quantiles
+    with P² estimators, so million-iteration runs can be summarised without
+    storing every sample. Instances are picklable and can be merged, e.g.
+    to combine the statistics of several worker processes (mean, variance,
+    min and max merge exactly; quantiles approximately).
+    """
+    
+    QUANTILES = (0.25, 0.5, 0.75, 0.95, 0.99)
+    
+    def __init__(self, quantiles=QUANTILES):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+        self._quantiles = {p: P2Quantile(p) for p in quantiles}
+    
+    @classmethod
+    def from_samples(cls, samples, quantiles=QUANTILES):
+        """Build an accumulator from an iterable of samples."""
+        stats = cls(quantiles)
+        stats.update_many(samples)
+        return stats
+    
+    def update(self, x):
+        """Add one measurement."""
+        x = float(x)
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+        for estimator in self._quantiles.values():
+            estimator.update(x)
+    
+    def update_many(self, samples):
+        """Add several measurements."""
+        for x in samples:
+            self.update(x)
+    
+    def merge(self, other):
+        """Merge another accumulator into this one (in place) and return self."""
+        if other.count == 0:
+            return self
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self._m2 += other._m2 + delta * delta * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        for p, estimator in self._quantiles.items():
+            if p in other._quantiles:
+                estimator.merge(other._quantiles[p])
+        return self
+    
+    @property
+    def variance(self):
+        """Population variance (as np.var)."""
+        return self._m2 / self.count if self.count > 0 else 0.0
+    
+    @property
+    def std(self):
+        """Population standard deviation (as np.std)."""
+        return math.sqrt(self.variance)
+    
+    def quantile(self, p):
+        """Return the estimate for a tracked quantile p (0-1)."""
+        return self._quantiles[p].value()
+    
+    def to_dict(self):
+        """Return statistics with the same keys as compute_statistics."""
+        if self.count == 0:
+            return compute_statistics([])
+        p25, p75 = self.quantile(0.25), self.quantile(0.75)
+        return {
+            "mean": self.mean,
+            "median": self.quantile(0.5),
+            "std": self.std,
+            "min": self.min,
+            "max": self.max,
+            "p25": p25,
+            "p75": p75,
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "cv": self.std / self.mean if self.mean > 0 else 0,
+            "iqr": p75 - p25
+        }
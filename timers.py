@@ -0,0 +1,153 @@
+"""
+Timing backends for the measurement layer.
+Provides the clocks benchmark samples can be taken with (wall-clock
+perf_counter_ns, process or thread CPU time) and, on Linux, a per-thread
+CPU cycle counter read through perf_event_open, so results can be reported
+in cycles/op as published by liboqs and SUPERCOP.
+"""
+
+import os
+import sys
+import time
+import ctypes
+import struct
+import platform
+import threading
+from functools import lru_cache
+
+
+# Clocks returning integer nanoseconds
+TIMERS = {
+    "perf_counter": time.perf_counter_ns,    # Monotonic wall clock, highest resolution
+    "process_time": time.process_time_ns,    # CPU time of the whole process (user + system)
+    "thread_time": time.thread_time_ns,      # CPU time of the calling thread
+}
+
+DEFAULT_TIMER = "perf_counter"
+
+# perf_event_open(2) syscall numbers per machine architecture
+PERF_EVENT_OPEN_SYSCALL = {"x86_64": 298, "aarch64": 241}
+
+PERF_TYPE_HARDWARE = 0
+PERF_COUNT_HW_CPU_CYCLES = 0
+# perf_event_attr flag bits
+PERF_ATTR_EXCLUDE_KERNEL = 1 << 5
+PERF_ATTR_EXCLUDE_HV = 1 << 6
+
+
+def get_timer(name=DEFAULT_TIMER):
+    """
+    Return the clock function for a timer name.
+
+    Args:
+        name: One of TIMERS
+
+    Returns:
+        Zero-argument callable returning nanoseconds
+    """
+    if name not in TIMERS:
+        raise ValueError(f"Unknown timer '{name}', expected one of {', '.join(TIMERS)}")
+    return TIMERS[name]
+
+
+class _PerfEventAttr(ctypes.Structure):
+    # PERF_ATTR_SIZE_VER0 layout (64 bytes); the kernel accepts this minimal size
+    _fields_ = [
+        ("type", ctypes.c_uint32),
+        ("size", ctypes.c_uint32),
+        ("config", ctypes.c_uint64),
+        ("sample_period", ctypes.c_uint64),
+        ("sample_type", ctypes.c_uint64),
+        ("read_format", ctypes.c_uint64),
+        ("flags", ctypes.c_uint64),
+        ("wakeup_events", ctypes.c_uint32),
+        ("bp_type", ctypes.c_uint32),
+        ("config1", ctypes.c_uint64),
+    ]
+
+
+class CycleCounter:
+    """
+    CPU cycle counter of the calling thread via perf_event_open.
+
+    Counts user-space cycles only (kernel and hypervisor excluded), which is
+    permitted with the default perf_event_paranoid setting. The counter
+    belongs to the thread that created it; `overhead` is the calibrated
+    number of cycles consumed by one pair of reads and is subtracted by
+    measure().
+
+    Raises:
+        OSError: If hardware cycle counting is unavailable (non-Linux, no PMU
+                 access in a VM or container, or restricted by
+                 perf_event_paranoid)
+    """
+
+    def __init__(self):
+        self._fd = None
+        syscall = PERF_EVENT_OPEN_SYSCALL.get(platform.machine())
+        if syscall is None or not sys.platform.startswith("linux"):
+            raise OSError("perf_event_open is not supported on this platform")
+
+        attr = _PerfEventAttr()
+        attr.type = PERF_TYPE_HARDWARE
+        attr.size = ctypes.sizeof(_PerfEventAttr)
+        attr.config = PERF_COUNT_HW_CPU_CYCLES
+        attr.flags = PERF_ATTR_EXCLUDE_KERNEL | PERF_ATTR_EXCLUDE_HV
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        # pid=0, cpu=-1: count the calling thread on any CPU
+        fd = libc.syscall(syscall, ctypes.byref(attr), 0, -1, -1, 0)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"perf_event_open failed: {os.strerror(errno)}")
+        self._fd = fd
+        self.overhead = min(self._read_pair() for _ in range(100))
+
+    def read(self):
+        """Return the current cycle count."""
+        return struct.unpack("q", os.read(self._fd, 8))[0]
+
+    def _read_pair(self):
+        start = self.read()
+        return self.read() - start
+
+    def measure(self, start, end):
+        """Return the cycles between two read() values, minus the read overhead."""
+        return max(0, end - start - self.overhead)
+
+    def close(self):
+        """Close the counter's file descriptor."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __del__(self):
+        self.close()
+
+
+_thread_counters = threading.local()
+
+
+def get_cycle_counter():
+    """
+    Return the calling thread's CycleCounter, opening it on first use.
+
+    Returns:
+        CycleCounter, or None if cycle counting is unavailable
+    """
+    if not hasattr(_thread_counters, "counter"):
+        try:
+            _thread_counters.counter = CycleCounter()
+        except OSError:
+            _thread_counters.counter = None
+    return _thread_counters.counter
+
+
+@lru_cache(maxsize=1)
+def cycle_counter_available():
+    """Return True if CPU cycles can be counted on this machine."""
+    try:
+        CycleCounter().close()
+        return True
+    except OSError:
+        return False
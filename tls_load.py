@@ -0,0 +1,525 @@
+"""
+Concurrent TLS-style handshake load generator over loopback.
+Runs an asyncio handshake server in its own process, pinned to one core, and
+drives it with many concurrent asyncio clients spread over client processes
+on the remaining cores over localhost TCP. Every handshake performs the real
+key exchange and authentication of a TLS 1.3 full handshake: ephemeral KEM
+keypair in the ClientHello, encapsulation by the server, certificate
+signature over the transcript and HMAC Finished messages in both directions,
+all sent as length-prefixed frames. Reports handshakes/s, latency
+percentiles and server / client CPU utilization per concurrency level, and
+flags levels where the clients rather than the server were the bottleneck.
+"""
+
+import os
+import time
+import hmac
+import struct
+import asyncio
+import hashlib
+import itertools
+import threading
+import multiprocessing
+
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from cryptography.exceptions import InvalidSignature
+
+import classic_algo
+import pqc_algo
+import hdr_histogram
+import runner
+
+
+DEFAULT_CONCURRENCY_LEVELS = [1, 4, 16, 64]
+
+# Handshake message types (TLS 1.3 numbering)
+CLIENT_HELLO = 1
+SERVER_HELLO = 2
+NEW_SESSION_TICKET = 4
+CERTIFICATE = 11
+CERTIFICATE_VERIFY = 15
+FINISHED = 20
+
+# Frame header: message type (1 byte) + body length (4 bytes, big endian)
+FRAME_HEADER = struct.Struct("!BI")
+MAX_FRAME_SIZE = 1 << 20
+RANDOM_SIZE = 32
+TICKET_SIZE = 192
+SERVER_START_TIMEOUT = 30
+
+# RSA client keypairs generated per client process before the load starts;
+# a fresh RSA keygen per handshake would make the clients the bottleneck
+CLIENT_KEY_POOL_SIZE = 8
+# Client process CPU utilization (%) above which a level is client-bound
+CLIENT_BOUND_CPU = 90.0
+
+
+class HandshakeError(Exception):
+    """Raised when a peer sends an unexpected or invalid handshake message."""
+
+
+def _frame(msg_type, body):
+    return FRAME_HEADER.pack(msg_type, len(body)) + body
+
+
+async def _read_frame(reader, expected_type):
+    """Read one frame; returns (raw frame bytes, body)."""
+    header = await reader.readexactly(FRAME_HEADER.size)
+    msg_type, length = FRAME_HEADER.unpack(header)
+    if msg_type != expected_type:
+        raise HandshakeError(f"Expected message type {expected_type}, got {msg_type}")
+    if length > MAX_FRAME_SIZE:
+        raise HandshakeError(f"Frame of {length} bytes exceeds the limit")
+    body = await reader.readexactly(length)
+    return header + body, body
+
+
+def _finished_keys(shared_secret, hello_hash):
+    """Derive the server and client Finished keys from the KEM shared secret."""
+    keys = HKDF(algorithm=hashes.SHA256(), length=64, salt=None,
+                info=b"pqc-bench handshake" + hello_hash).derive(shared_secret)
+    return keys[:32], keys[32:]
+
+
+def _mac(key, transcript):
+    return hmac.new(key, transcript.digest(), hashlib.sha256).digest()
+
+
+# ----- key exchange and signature primitives -----
+
+def _kem_keygen(kem_algo):
+    """Generate an ephemeral KEM keypair; returns (public key bytes, private state)."""
+    if "RSA" in kem_algo:
+        size = int(kem_algo.split("-")[1])
+        private_key = classic_algo.rsa.generate_private_key(public_exponent=65537, key_size=size)
+        public_key = private_key.public_key().public_bytes(serialization.Encoding.DER,
+                                                           serialization.PublicFormat.SubjectPublicKeyInfo)
+        return public_key, private_key
+    kem = pqc_algo.CONTEXT_POOL.acquire("kem", kem_algo)
+    return kem.generate_keypair(), kem
+
+
+def _client_keys(kem_algo):
+    """
+    Return a zero-argument callable producing client KEM keypairs.
+
+    RSA keypairs are drawn round-robin from CLIENT_KEY_POOL_SIZE keypairs
+    generated up front, so the client measures the server rather than its
+    own RSA key generation; liboqs keypairs are cheap and stay fresh.
+    """
+    if "RSA" in kem_algo:
+        pool = itertools.cycle([_kem_keygen(kem_algo) for _ in range(CLIENT_KEY_POOL_SIZE)])
+        return lambda: next(pool)
+    return lambda: _kem_keygen(kem_algo)
+
+
+def _kem_encaps(kem_algo, public_key):
+    """Encapsulate to a peer public key; returns (ciphertext, shared secret)."""
+    if "RSA" in kem_algo:
+        shared_secret = os.urandom(32)
+        peer_key = serialization.load_der_public_key(public_key)
+        return peer_key.encrypt(shared_secret, classic_algo._oaep()), shared_secret
+    kem = pqc_algo.CONTEXT_POOL.acquire("kem", kem_algo)
+    try:
+        return kem.encap_secret(public_key)
+    finally:
+        pqc_algo.CONTEXT_POOL.release("kem", kem_algo, kem)
+
+
+def _kem_decaps(kem_algo, state, ciphertext):
+    """Decapsulate with the private state from _kem_keygen (released afterwards)."""
+    if "RSA" in kem_algo:
+        return state.decrypt(ciphertext, classic_algo._oaep())
+    try:
+        return state.decap_secret(ciphertext)
+    finally:
+        pqc_algo.CONTEXT_POOL.release("kem", kem_algo, state)
+
+
+def _kem_release(kem_algo, state):
+    """Return unused private state from _kem_keygen after a failed handshake."""
+    if "RSA" not in kem_algo:
+        pqc_algo.CONTEXT_POOL.release("kem", kem_algo, state)
+
+
+class _ServerIdentity:
+    """Long-lived server signing key and the certificate (public key) it presents."""
+
+    def __init__(self, sig_algo):
+        self.sig_algo = sig_algo
+        if "SECP" in sig_algo:
+            self._private_key = ec.generate_private_key(classic_algo._curve(sig_algo))
+            self.certificate = self._private_key.public_key().public_bytes(
+                serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo)
+            self._signer = None
+        else:
+            self._signer = pqc_algo.ContextPool._construct("sig", sig_algo)
+            self.certificate = self._signer.generate_keypair()
+
+    def sign(self, message):
+        if self._signer is None:
+            return self._private_key.sign(message, ec.ECDSA(hashes.SHA256()))
+        return self._signer.sign(message)
+
+
+def _verify(sig_algo, certificate, message, signature):
+    if "SECP" in sig_algo:
+        try:
+            serialization.load_der_public_key(certificate).verify(signature, message, ec.ECDSA(hashes.SHA256()))
+            return True
+        except InvalidSignature:
+            return False
+    verifier = pqc_algo.CONTEXT_POOL.acquire("sig", sig_algo)
+    try:
+        return verifier.verify(message, signature, certificate)
+    finally:
+        pqc_algo.CONTEXT_POOL.release("sig", sig_algo, verifier)
+
+
+# ----- server -----
+
+class _HandshakeServer:
+    """Server side of the handshake; one instance per server process."""
+
+    def __init__(self, kem_algo, sig_algo):
+        self.kem_algo = kem_algo
+        self.identity = _ServerIdentity(sig_algo)
+        self.handshakes = 0
+        self.errors = 0
+
+    async def handle(self, reader, writer):
+        try:
+            transcript = hashlib.sha256()
+            client_hello, body = await _read_frame(reader, CLIENT_HELLO)
+            transcript.update(client_hello)
+            public_key = body[RANDOM_SIZE:]
+
+            ciphertext, shared_secret = _kem_encaps(self.kem_algo, public_key)
+            server_hello = _frame(SERVER_HELLO, os.urandom(RANDOM_SIZE) + ciphertext)
+            transcript.update(server_hello)
+            server_key, client_key = _finished_keys(shared_secret, transcript.digest())
+
+            certificate = _frame(CERTIFICATE, self.identity.certificate)
+            transcript.update(certificate)
+            certificate_verify = _frame(CERTIFICATE_VERIFY, self.identity.sign(transcript.digest()))
+            transcript.update(certificate_verify)
+            server_finished = _frame(FINISHED, _mac(server_key, transcript))
+            transcript.update(server_finished)
+
+            # The whole server flight goes out in one write, as in TLS 1.3
+            writer.write(server_hello + certificate + certificate_verify + server_finished)
+            await writer.drain()
+
+            _, client_finished = await _read_frame(reader, FINISHED)
+            if not hmac.compare_digest(client_finished, _mac(client_key, transcript)):
+                raise HandshakeError("Client Finished MAC mismatch")
+
+            writer.write(_frame(NEW_SESSION_TICKET, os.urandom(TICKET_SIZE)))
+            await writer.drain()
+            self.handshakes += 1
+        except (OSError, asyncio.IncompleteReadError, HandshakeError):
+            self.errors += 1
+        finally:
+            writer.close()
+
+
+async def _serve(conn, kem_algo, sig_algo, host):
+    try:
+        state = _HandshakeServer(kem_algo, sig_algo)
+        server = await asyncio.start_server(state.handle, host, 0, backlog=1024)
+    except Exception as e:
+        conn.send(("error", str(e)))
+        return
+    conn.send(("ready", server.sockets[0].getsockname()[1]))
+
+    loop = asyncio.get_running_loop()
+    stopped = loop.create_future()
+
+    def commands():
+        # Control commands are served on a thread so the event loop only handles handshakes
+        while True:
+            command = conn.recv()
+            if command == "stats":
+                conn.send((time.process_time(), state.handshakes, state.errors))
+            elif command == "stop":
+                loop.call_soon_threadsafe(stopped.set_result, None)
+                return
+
+    threading.Thread(target=commands, daemon=True).start()
+    async with server:
+        await stopped
+
+
+def _pin(cpu):
+    """Pin the calling process to one CPU, where supported."""
+    if cpu is not None and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {cpu})
+
+
+def _server_process(conn, kem_algo, sig_algo, host, cpu=None):
+    """Server process body: serve handshakes until told to stop."""
+    _pin(cpu)
+    asyncio.run(_serve(conn, kem_algo, sig_algo, host))
+
+
+# ----- client -----
+
+async def _client_handshake(host, port, kem_algo, sig_algo, keygen):
+    """Perform one handshake with a keypair from `keygen`; returns (bytes sent, bytes received)."""
+    reader, writer = await asyncio.open_connection(host, port)
+    state = None
+    try:
+        transcript = hashlib.sha256()
+        public_key, state = keygen()
+        client_hello = _frame(CLIENT_HELLO, os.urandom(RANDOM_SIZE) + public_key)
+        transcript.update(client_hello)
+        writer.write(client_hello)
+        await writer.drain()
+
+        server_hello, body = await _read_frame(reader, SERVER_HELLO)
+        transcript.update(server_hello)
+        shared_secret = _kem_decaps(kem_algo, state, body[RANDOM_SIZE:])
+        state = None
+        server_key, client_key = _finished_keys(shared_secret, transcript.digest())
+
+        certificate_frame, certificate = await _read_frame(reader, CERTIFICATE)
+        transcript.update(certificate_frame)
+        signed_hash = transcript.digest()
+        certificate_verify, signature = await _read_frame(reader, CERTIFICATE_VERIFY)
+        if not _verify(sig_algo, certificate, signed_hash, signature):
+            raise HandshakeError("Invalid CertificateVerify signature")
+        transcript.update(certificate_verify)
+
+        server_finished, mac = await _read_frame(reader, FINISHED)
+        if not hmac.compare_digest(mac, _mac(server_key, transcript)):
+            raise HandshakeError("Server Finished MAC mismatch")
+        transcript.update(server_finished)
+
+        client_finished = _frame(FINISHED, _mac(client_key, transcript))
+        writer.write(client_finished)
+        await writer.drain()
+        ticket, _ = await _read_frame(reader, NEW_SESSION_TICKET)
+
+        sent = len(client_hello) + len(client_finished)
+        received = (len(server_hello) + len(certificate_frame) + len(certificate_verify) +
+                    len(server_finished) + len(ticket))
+        return sent, received
+    finally:
+        if state is not None:
+            _kem_release(kem_algo, state)
+        writer.close()
+
+
+async def _run_level(host, port, kem_algo, sig_algo, concurrency, duration, keygen):
+    """Run `concurrency` clients back to back for `duration` seconds."""
+    histogram = hdr_histogram.HdrHistogram()
+    totals = {"handshakes": 0, "errors": 0, "sent": 0, "received": 0}
+    deadline = time.perf_counter() + duration
+
+    async def client():
+        while time.perf_counter() < deadline:
+            t0 = time.perf_counter_ns()
+            try:
+                sent, received = await _client_handshake(host, port, kem_algo, sig_algo, keygen)
+            except (OSError, asyncio.IncompleteReadError, HandshakeError):
+                totals["errors"] += 1
+                continue
+            histogram.record(time.perf_counter_ns() - t0)
+            totals["handshakes"] += 1
+            totals["sent"] += sent
+            totals["received"] += received
+
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return histogram, totals
+
+
+def _client_process(conn, host, port, kem_algo, sig_algo, cpu=None):
+    """
+    Client process body: prepare keys, then run one load level per command.
+
+    Replies to ("run", concurrency, duration) with ("done", histogram,
+    totals, process CPU seconds, wall-clock seconds), or ("error", message)
+    if the level fails, until told to stop.
+    """
+    try:
+        _pin(cpu)
+        keygen = _client_keys(kem_algo)
+    except Exception as e:
+        conn.send(("error", str(e)))
+        return
+    conn.send(("ready", None))
+
+    while True:
+        command = conn.recv()
+        if command == "stop":
+            return
+        _, concurrency, duration = command
+        cpu0 = time.process_time()
+        t0 = time.perf_counter()
+        try:
+            histogram, totals = asyncio.run(_run_level(host, port, kem_algo, sig_algo, concurrency, duration, keygen))
+        except Exception as e:
+            conn.send(("error", str(e)))
+            return
+        conn.send(("done", histogram, totals, time.process_time() - cpu0, time.perf_counter() - t0))
+
+
+def _split(total, parts):
+    """Split `total` clients as evenly as possible over at most `parts` processes."""
+    parts = max(1, min(parts, total))
+    return [total // parts + (1 if i < total % parts else 0) for i in range(parts)]
+
+
+def _start(target, args, name):
+    """Start a daemon process and wait for its ("ready", value) message; returns (process, conn, value)."""
+    conn, child_conn = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=target, args=(child_conn, *args), name=name, daemon=True)
+    process.start()
+    child_conn.close()
+    if not conn.poll(SERVER_START_TIMEOUT):
+        raise RuntimeError(f"{name} did not start")
+    status, value = conn.recv()
+    if status != "ready":
+        raise RuntimeError(f"{name} failed: {value}")
+    return process, conn, value
+
+
+def _stop(process, conn):
+    """Ask a process started with _start to stop, terminating it if it does not."""
+    if process.is_alive():
+        try:
+            conn.send("stop")
+        except OSError:
+            pass
+        process.join(5)
+        if process.is_alive():
+            process.terminate()
+            process.join()
+    conn.close()
+
+
+def run_tls_load(kem_algo, sig_algo, concurrency_levels=None, duration=2.0, host="127.0.0.1",
+                 on_level=None, cancel_event=None, client_processes=None):
+    """
+    Measure TLS-style handshake throughput and latency under concurrent load.
+
+    The server runs on one asyncio event loop in a separate process pinned to
+    one core, like a single TLS worker. The clients of each level are spread
+    over client processes pinned to the remaining cores, each running its
+    share of the clients on its own event loop. CPU utilization is the CPU
+    time of the server process and of all client processes divided by the
+    wall-clock duration of each level.
+
+    A level where any client process was busy for at least CLIENT_BOUND_CPU
+    percent of the time, or, on a single CPU, where clients and server
+    together kept the shared core that busy, is marked 'Client Bound': its
+    handshakes/s and latencies reflect the load generator's capacity, not
+    the server's.
+
+    Args:
+        kem_algo: KEM algorithm (RSA-* or a liboqs KEM)
+        sig_algo: Signature algorithm (SECP* or a liboqs signature)
+        concurrency_levels: Numbers of concurrent clients to test
+                            (default: DEFAULT_CONCURRENCY_LEVELS)
+        duration: Seconds of load per concurrency level
+        host: Loopback address to serve on
+        on_level: Optional callback(concurrency) before each level starts
+        cancel_event: Optional threading.Event that stops before the next level
+        client_processes: Number of client processes (default: one per
+                          available CPU besides the server's, at least one)
+
+    Returns:
+        List with one result row per concurrency level
+    """
+    if not pqc_algo.OQS_AVAILABLE and ("RSA" not in kem_algo or "SECP" not in sig_algo):
+        raise RuntimeError("Liboqs not available")
+    levels = concurrency_levels or DEFAULT_CONCURRENCY_LEVELS
+
+    # The server gets the last core to itself; the clients share the rest
+    cpus = runner.get_available_cpus()
+    server_cpu_id = cpus[-1] if len(cpus) > 1 else None
+    client_cpus = cpus[:-1] if len(cpus) > 1 else [None]
+    if client_processes is None:
+        client_processes = len(client_cpus)
+    client_processes = max(1, min(client_processes, max(levels)))
+
+    server = None
+    clients = []
+    rows = []
+    try:
+        server = _start(_server_process, (kem_algo, sig_algo, host, server_cpu_id), "tls-load-server")
+        _, conn, port = server
+        for i in range(client_processes):
+            clients.append(_start(_client_process, (host, port, kem_algo, sig_algo, client_cpus[i % len(client_cpus)]),
+                                  f"tls-load-client-{i}"))
+
+        for concurrency in levels:
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            if on_level:
+                on_level(concurrency)
+
+            conn.send("stats")
+            server_cpu0, server_done0, server_errors0 = conn.recv()
+            shares = _split(concurrency, len(clients))
+            t0 = time.perf_counter()
+            for (_, client_conn, _), share in zip(clients, shares):
+                client_conn.send(("run", share, duration))
+            replies = [client_conn.recv() for (_, client_conn, _), _ in zip(clients, shares)]
+            wall = time.perf_counter() - t0
+            conn.send("stats")
+            server_cpu1, server_done1, server_errors1 = conn.recv()
+
+            histogram = hdr_histogram.HdrHistogram()
+            totals = {"handshakes": 0, "errors": 0, "sent": 0, "received": 0}
+            client_cpu = 0.0
+            client_busy = 0.0
+            for reply in replies:
+                if reply[0] == "error":
+                    raise RuntimeError(f"Load client failed: {reply[1]}")
+                _, client_histogram, client_totals, cpu_time, client_wall = reply
+                histogram.merge(client_histogram)
+                for key in totals:
+                    totals[key] += client_totals[key]
+                client_cpu += cpu_time
+                client_busy = max(client_busy, cpu_time / client_wall * 100 if client_wall > 0 else 0)
+
+            handshakes = totals["handshakes"]
+            server_cpu = server_cpu1 - server_cpu0
+            client_bound = client_busy >= CLIENT_BOUND_CPU
+            if server_cpu_id is None and wall > 0:
+                # Clients and server share one core, so the server never has it to itself
+                client_bound = client_bound or (client_cpu + server_cpu) / wall * 100 >= CLIENT_BOUND_CPU
+            server_done = server_done1 - server_done0
+            latency = histogram.summary((50, 90, 99, 99.9))
+            rows.append({
+                "Scenario": "TLS Handshake Load",
+                "KEM Algorithm": kem_algo,
+                "Signature Algorithm": sig_algo,
+                "Concurrency": concurrency,
+                "Client Processes": len(shares),
+                "Handshakes": handshakes,
+                "Handshakes/s": handshakes / wall if wall > 0 else 0,
+                "Mean Latency (ms)": latency["Mean (ms)"],
+                "P50 Latency (ms)": latency["P50 (ms)"],
+                "P90 Latency (ms)": latency["P90 (ms)"],
+                "P99 Latency (ms)": latency["P99 (ms)"],
+                "P99.9 Latency (ms)": latency["P99.9 (ms)"],
+                "Server CPU (%)": server_cpu / wall * 100 if wall > 0 else 0,
+                "Client CPU (%)": client_cpu / wall * 100 if wall > 0 else 0,
+                "Max Client Process CPU (%)": client_busy,
+                "Client Bound": client_bound,
+                "Server CPU per Handshake (ms)": server_cpu / server_done * 1000 if server_done else 0,
+                "Client→Server (B)": totals["sent"] / handshakes if handshakes else 0,
+                "Server→Client (B)": totals["received"] / handshakes if handshakes else 0,
+                "Errors": totals["errors"] + (server_errors1 - server_errors0),
+            })
+    finally:
+        for process, client_conn, _ in clients:
+            _stop(process, client_conn)
+        if server is not None:
+            _stop(server[0], server[1])
+
+    return rows
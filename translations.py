@@ -27,23 +27,55 @@ TRANSLATIONS = {
         "no_file_uploaded": "No file uploaded, using default",
         "generated": "Generated",
         "loaded": "Loaded",
+        "local_file_path": "Local file path (memory-mapped)",
+        "file_path": "File path:",
+        "file_path_help": "The file is memory-mapped and passed to AES-GCM / hashing without copying it into memory",
+        "file_not_found": "File not found",
+        "mapped": "Memory-mapped",
         
         # Modes
         "mode_kem": "KEM (Key Exchange Only)",
         "mode_signatures": "Digital Signatures",
         "mode_hybrid": "Hybrid Encryption (KEM+AES)",
         "mode_scenarios": "Real-World Scenarios",
+        "mode_scaling": "Multi-core Scaling",
+        "mode_parallel": "Parallel Encryption",
         
         # Mode descriptions
         "mode_kem_desc": "**Pure KEM Mode**\n\nTests key encapsulation/decapsulation only (32-byte shared secret). No actual data encryption.",
         "mode_hybrid_desc": "**Hybrid Encryption**\n\nCombines KEM for key exchange with AES-256-GCM for data encryption. Tests real file encryption scenario.",
         "mode_scenarios_desc": "**Scenario Simulation**\n\nSimulates real-world cryptographic applications like TLS handshake, secure email, VPN, etc.",
+        "mode_scaling_desc": "**Multi-core Scaling**\n\nRuns the same operation concurrently in 1, 2, 4, ... N workers and measures aggregate throughput and per-core efficiency.",
+        "mode_parallel_desc": "**Parallel Encryption**\n\nEncrypts and decrypts the same data as AES-256-GCM chunks on 1, 2, 4, ... N threads and reports throughput and per-thread efficiency.",
         
         # Scenarios
         "scenario_tls": "TLS 1.3 Handshake",
+        "scenario_tls_load": "TLS Handshake Load (loopback)",
+        "link_profile": "Network link",
+        "link_profile_help": "Link used to turn message sizes into segments, round trips and wire time (bandwidth, RTT, MTU, initial congestion window, loss)",
+        "time_to_first_byte": "Time to first byte",
+        "crypto_time": "Cryptography",
+        "network_time": "Network",
+        "concurrency_levels": "Concurrent clients",
+        "concurrency_levels_help": "Each level runs this many clients performing back-to-back handshakes against the loopback server",
+        "load_duration": "Load duration per level (s)",
+        "handshake_rate": "Handshakes/s vs concurrency",
+        "handshake_latency": "Handshake latency vs concurrency",
+        "server_cpu_per_handshake": "Server CPU time per handshake (ms)",
+        "client_bound_warning": "Some concurrency levels are client-bound (marked in the 'Client Bound' column): the load generator, not the server, limited their handshakes/s and latencies. Use a machine with more cores for server numbers.",
         "scenario_email": "Secure Email (S/MIME)",
         "scenario_vpn": "VPN Session",
         "scenario_code": "Code Signing",
+        "scenario_messaging": "Secure Messaging (ratchet)",
+        "vpn_packets": "Packets in session",
+        "vpn_packet_size": "Packet size (B)",
+        "rekey_interval": "Re-key every N packets",
+        "rekey_interval_help": "A fresh KEM exchange derives a new AES-256-GCM SA key every N packets; packets arriving during the re-key wait for it",
+        "vpn_packet_rate": "Data plane packets/s (with and without re-key stalls)",
+        "chat_message_size": "Message size (B)",
+        "message_count": "Messages in session",
+        "ratchet_interval": "KEM ratchet every N messages",
+        "ratchet_interval_help": "A KEM ratchet step (new keypair, encapsulation, decapsulation) runs every N messages; all other messages only advance the symmetric chain",
         "email_size": "Email Size (KB):",
         "file_size_mb": "File Size (MB):",
         
@@ -51,6 +83,79 @@ TRANSLATIONS = {
         "algo_selection": "Algorithm Selection",
         "iterations": "Iterations (for statistics):",
         "iterations_help": "More iterations = better statistical accuracy",
+        "iteration_mode": "Iteration Mode:",
+        "iteration_mode_roundtrip": "Full round-trip (new keypair per iteration)",
+        "iteration_mode_operation": "Operation-level (reuse keypair)",
+        "iteration_mode_throughput": "Throughput (ops/sec, fixed time budget)",
+        "iteration_mode_adaptive": "Adaptive (iterate until precise)",
+        "iteration_mode_help": "Operation-level mode generates a few keypairs once and times each Encaps/Decaps or Sign/Verify call against them. Throughput mode runs each operation in a tight loop for a fixed time and reports ops/sec and ns/op. Adaptive mode ignores the iteration count and times each operation until its mean is known to the target precision or the time budget runs out",
+        "time_budget": "Time Budget per Operation (s):",
+        "time_budget_help": "How long each operation runs in throughput mode, or at most in adaptive mode",
+        "timer": "Timer:",
+        "timer_help": "Clock used to time each call. Wall clock includes waiting and other processes; CPU time only counts time this process (or thread) actually ran",
+        "timer_perf_counter": "Wall clock (perf_counter_ns)",
+        "timer_process_time": "Process CPU time",
+        "timer_thread_time": "Thread CPU time",
+        "count_cycles": "Count CPU cycles",
+        "count_cycles_help": "Also read the hardware cycle counter (perf_event_open) around every call and report the median cycles/op, the figure published by liboqs and SUPERCOP",
+        "cycles_unavailable": "Hardware cycle counting (perf_event_open) is not available on this machine",
+        "cycles_title": "CPU Cycles per Operation",
+        "cycles_caption": "Median user-space CPU cycles per call, read with perf_event_open and corrected for the counter read overhead.",
+        "warmup": "Warm up until steady state",
+        "warmup_help": "Before recording samples, call every operation (the whole round trip in round-trip mode) until the median of the last 5 calls is within 5% of the 5 before, so cold caches and CPU frequency ramp-up do not skew the first algorithm",
+        "context_pool": "Reuse liboqs contexts",
+        "context_pool_help": "Borrow KeyEncapsulation / Signature objects from a bounded pool instead of constructing two new ones every round trip",
+        "report_setup": "Report context setup time",
+        "report_setup_help": "Show the time spent constructing or borrowing liboqs contexts per round trip as a separate 'Setup (ms)' column (post-quantum algorithms)",
+        "warmup_title": "Warmup",
+        "warmup_caption": "Calls discarded before recording samples. 'Steady' is false if the time or call limit was hit before the rolling median stabilized.",
+        "target_precision": "Target Precision (± % of mean):",
+        "target_precision_help": "Adaptive mode stops sampling an operation once the 95% confidence interval half-width of its mean is below this percentage",
+        "streaming_mode": "Streaming (chunked AES-GCM)",
+        "streaming_mode_help": "Encrypt the file in fixed-size chunks with per-chunk nonces so memory use stays at a few chunk sizes (applies to full round-trip iterations)",
+        "chunk_size_kb": "Chunk Size (KB):",
+        "payload_seed": "Payload seed:",
+        "startup_timing": "⏱ Startup timing",
+        "cold_start": "Cold start (first run in this process)",
+        "this_run": "This run",
+        "imports": "imports",
+        "render": "render",
+        "total": "total",
+        "payload_seed_help": "Generated payloads are deterministic for a given size and seed, so runs are reproducible",
+        "encryption_threads": "Encryption threads:",
+        "save_history": "Save runs to history",
+        "save_history_help": "Record every run (config, system info, raw measurements) in the local SQLite result store",
+        "history_label": "Run label (optional):",
+        "saved_to_history": "Saved to history as run",
+        "history_failed": "Result history unavailable:",
+        "run_history": "Run history",
+        "no_history": "No stored runs for this mode yet",
+        "encryption_threads_help": "Encrypt and decrypt chunks on a thread pool with ordered reassembly",
+        "keypairs": "Keypairs:",
+        "keypairs_help": "Number of keypairs the operation iterations are spread across",
+        "workers": "Parallel Workers:",
+        "workers_help": "Number of worker processes; each algorithm runs as a separate job",
+        "pin_cpus": "Pin workers to CPUs",
+        "pin_cpus_help": "Bind every worker process to its own CPU core",
+        "isolate": "Isolated worker process",
+        "isolate_help": "Run each algorithm in a fresh worker process with the garbage collector disabled, so the Streamlit server does not share a process with the timed code",
+        "isolate_cpu": "Benchmark CPU core:",
+        "isolate_cpu_help": "Core the isolated worker is pinned to; pick one the rest of the system uses least",
+        "noise_title": "Measurement Noise",
+        "load_average": "Load average (1 / 5 / 15 min)",
+        "no_noise": "No known noise sources detected (performance governor, turbo and SMT off, idle system)",
+        "scaling_operation_type": "Operation Type:",
+        "scaling_operation": "Operation:",
+        "scaling_max_workers": "Max Workers:",
+        "scaling_backends": "Worker Backends:",
+        "scaling_backends_help": "Processes show true multi-core scaling; threads additionally reveal whether the library releases the GIL",
+        "backend_process": "Processes",
+        "backend_thread": "Threads",
+        "workers_short": "workers",
+        "max_threads": "Max Threads:",
+        "max_threads_help": "The sweep tests 1, 2, 4, ... threads up to this value",
+        "threads_short": "threads",
+        "parallel_algo_fixed": "AES-256-GCM (the KEM only delivers the key and is not part of this sweep)",
         "classic_kem": "Classic KEM:",
         "pqc_kem": "PQC KEM:",
         "classic_sig": "Classic Signatures:",
@@ -68,6 +173,9 @@ TRANSLATIONS = {
         "testing": "Testing",
         "benchmark_complete": "Benchmark complete!",
         "benchmark_success": "Successfully benchmarked",
+        "benchmark_cancelled": "Benchmark cancelled; partial results for",
+        "cancel_benchmark": "⏹ Cancel Benchmark",
+        "cancelling": "Cancelling after the current step...",
         "algo_configs": "algorithm configurations!",
         
         # Errors
@@ -75,6 +183,7 @@ TRANSLATIONS = {
         "error_liboqs_help": "For Docker: ensure you've built with liboqs support. For local: install liboqs-python.",
         "error_select_algos": "Please select at least one algorithm to test.",
         "error_select_kem_sig": "Please select at least one KEM and one Signature algorithm for scenario testing.",
+        "error_select_backend": "Please select at least one worker backend.",
         "error_no_results": "No successful benchmark results. Please check algorithm availability.",
         "failed_to_test": "Failed to test",
         "failed_to_benchmark": "Failed to benchmark",
@@ -89,6 +198,12 @@ TRANSLATIONS = {
         "tab_export": "Export",
         "tab_results": "Results Table",
         "tab_perf_analysis": "Performance Analysis",
+        "tab_scaling": "Scaling",
+        "scaling_throughput_title": "Aggregate Throughput vs Workers",
+        "scaling_efficiency_title": "Per-Core Efficiency vs Workers",
+        "tab_parallel": "Thread Scaling",
+        "parallel_throughput_title": "AES-GCM Throughput vs Threads",
+        "parallel_efficiency_title": "Per-Thread Efficiency vs Threads",
         
         # Performance tab
         "performance_metrics": "Performance Metrics",
@@ -126,6 +241,11 @@ TRANSLATIONS = {
         "statistical_summary": "Statistical Summary",
         "outlier_analysis": "Outlier Analysis",
         "no_outliers": "No significant outliers detected in measurements",
+        "tail_latency_title": "Tail Latency (HDR Histogram)",
+        "computing_confidence": "Computing bootstrap confidence intervals...",
+        "ci_error_bars": "Error bars: 95% bootstrap confidence interval of the mean.",
+        "confidence_intervals": "Confidence Intervals (95% bootstrap)",
+        "tail_latency_caption": "Per-operation latency distribution recorded in log-bucketed histograms (3 significant digits), including extreme percentiles.",
         "algorithm": "Algorithm",
         "metric": "Metric",
         "outliers": "Outliers",
@@ -254,6 +374,8 @@ TRANSLATIONS = {
         "metrics_stats_desc": "📈 **Statistical Metrics:** Consistency Score (execution stability, higher=better), StdDev (standard deviation), P95 (95th percentile). Help assess algorithm predictability.",
         "metrics_scenarios_desc": "🌐 **Scenario Metrics:** Real-world use case simulation - TLS handshake, secure email, VPN session, code signing. Shows total time for all operations in a complete scenario.",
         "metrics_summary_table_desc": "📋 **Summary Table:** Contains all partial time measurements and key metrics. Color gradient helps quickly identify the fastest algorithms.",
+        "metrics_scaling_desc": "🧮 **Scaling Metrics:** Aggregate ops/sec across all workers and efficiency relative to perfect linear scaling (100%). Memory-bandwidth-heavy schemes flatten out earlier; thread curves that stay flat mean the library holds the GIL.",
+        "metrics_parallel_desc": "🧮 **Thread Scaling Metrics:** Encrypt / decrypt GB/s over the whole data, including reading it, and efficiency relative to perfect linear scaling (100%). The output is checked against a single-threaded reference for every thread count.",
     },
     
     "pl": {
@@ -279,23 +401,55 @@ TRANSLATIONS = {
         "no_file_uploaded": "Nie wgrano pliku, używam domyślnego",
         "generated": "Wygenerowano",
         "loaded": "Wczytano",
+        "local_file_path": "Ścieżka do pliku lokalnego (mapowanie w pamięci)",
+        "file_path": "Ścieżka do pliku:",
+        "file_path_help": "Plik jest mapowany w pamięci i przekazywany do AES-GCM / haszowania bez kopiowania",
+        "file_not_found": "Nie znaleziono pliku",
+        "mapped": "Zmapowano",
         
         # Modes
         "mode_kem": "KEM (tylko wymiana kluczy)",
         "mode_signatures": "Podpisy cyfrowe",
         "mode_hybrid": "Szyfrowanie hybrydowe (KEM+AES)",
         "mode_scenarios": "Scenariusze rzeczywiste",
+        "mode_scaling": "Skalowanie wielordzeniowe",
+        "mode_parallel": "Szyfrowanie równoległe",
         
         # Mode descriptions
         "mode_kem_desc": "**Tryb czystego KEM**\n\nTestuje tylko enkapsulację/dekapsulację kluczy (32-bajtowy sekret). Bez faktycznego szyfrowania danych.",
         "mode_hybrid_desc": "**Szyfrowanie hybrydowe**\n\nŁączy KEM do wymiany kluczy z AES-256-GCM do szyfrowania danych. Testuje rzeczywiste szyfrowanie plików.",
         "mode_scenarios_desc": "**Symulacja scenariuszy**\n\nSymuluje rzeczywiste zastosowania kryptograficzne jak handshake TLS, bezpieczny email, VPN, itp.",
+        "mode_scaling_desc": "**Skalowanie wielordzeniowe**\n\nUruchamia tę samą operację równolegle w 1, 2, 4, ... N procesach i mierzy łączną przepustowość oraz efektywność na rdzeń.",
+        "mode_parallel_desc": "**Szyfrowanie równoległe**\n\nSzyfruje i deszyfruje te same dane jako fragmenty AES-256-GCM w 1, 2, 4, ... N wątkach i podaje przepustowość oraz efektywność na wątek.",
         
         # Scenarios
         "scenario_tls": "Handshake TLS 1.3",
+        "scenario_tls_load": "Obciążenie handshake TLS (loopback)",
+        "link_profile": "Łącze sieciowe",
+        "link_profile_help": "Łącze, na którym rozmiary wiadomości są przeliczane na segmenty, round tripy i czas transmisji (przepustowość, RTT, MTU, początkowe okno przeciążenia, straty)",
+        "time_to_first_byte": "Czas do pierwszego bajtu",
+        "crypto_time": "Kryptografia",
+        "network_time": "Sieć",
+        "concurrency_levels": "Współbieżni klienci",
+        "concurrency_levels_help": "Na każdym poziomie tylu klientów wykonuje kolejne handshake'i z serwerem na loopbacku",
+        "load_duration": "Czas obciążenia na poziom (s)",
+        "handshake_rate": "Handshake'i/s a współbieżność",
+        "handshake_latency": "Opóźnienie handshake'u a współbieżność",
+        "server_cpu_per_handshake": "Czas CPU serwera na handshake (ms)",
+        "client_bound_warning": "Niektóre poziomy współbieżności są ograniczone przez klientów (kolumna 'Client Bound'): ich handshake/s i opóźnienia ograniczył generator obciążenia, a nie serwer. Do pomiaru serwera użyj maszyny z większą liczbą rdzeni.",
         "scenario_email": "Bezpieczny email (S/MIME)",
         "scenario_vpn": "Sesja VPN",
         "scenario_code": "Podpisywanie kodu",
+        "scenario_messaging": "Bezpieczny komunikator (ratchet)",
+        "vpn_packets": "Liczba pakietów w sesji",
+        "vpn_packet_size": "Rozmiar pakietu (B)",
+        "rekey_interval": "Re-key co N pakietów",
+        "rekey_interval_help": "Nowa wymiana KEM wyprowadza nowy klucz SA AES-256-GCM co N pakietów; pakiety przychodzące w trakcie re-key czekają na jej zakończenie",
+        "vpn_packet_rate": "Pakiety/s płaszczyzny danych (z przestojami re-key i bez)",
+        "chat_message_size": "Rozmiar wiadomości (B)",
+        "message_count": "Liczba wiadomości w sesji",
+        "ratchet_interval": "Krok ratchetu KEM co N wiadomości",
+        "ratchet_interval_help": "Krok ratchetu KEM (nowa para kluczy, enkapsulacja, dekapsulacja) wykonywany jest co N wiadomości; pozostałe wiadomości przesuwają tylko łańcuch symetryczny",
         "email_size": "Rozmiar emaila (KB):",
         "file_size_mb": "Rozmiar pliku (MB):",
         
@@ -303,6 +457,79 @@ TRANSLATIONS = {
         "algo_selection": "Wybór algorytmów",
         "iterations": "Iteracje (dla statystyk):",
         "iterations_help": "Więcej iteracji = lepsza dokładność statystyczna",
+        "iteration_mode": "Tryb iteracji:",
+        "iteration_mode_roundtrip": "Pełny cykl (nowa para kluczy w każdej iteracji)",
+        "iteration_mode_operation": "Na poziomie operacji (ponowne użycie pary kluczy)",
+        "iteration_mode_throughput": "Przepustowość (op/s, stały budżet czasu)",
+        "iteration_mode_adaptive": "Adaptacyjny (iteracje aż do osiągnięcia precyzji)",
+        "iteration_mode_help": "Tryb operacji generuje raz kilka par kluczy i mierzy każde wywołanie Encaps/Decaps lub Sign/Verify osobno. Tryb przepustowości wykonuje każdą operację w pętli przez stały czas i raportuje op/s oraz ns/op. Tryb adaptacyjny pomija liczbę iteracji i mierzy każdą operację, aż jej średnia osiągnie docelową precyzję lub skończy się budżet czasu",
+        "time_budget": "Budżet czasu na operację (s):",
+        "time_budget_help": "Jak długo każda operacja jest wykonywana w trybie przepustowości, lub maksymalnie w trybie adaptacyjnym",
+        "timer": "Zegar:",
+        "timer_help": "Zegar używany do pomiaru każdego wywołania. Czas rzeczywisty obejmuje oczekiwanie i inne procesy; czas CPU liczy tylko czas faktycznego działania procesu (lub wątku)",
+        "timer_perf_counter": "Czas rzeczywisty (perf_counter_ns)",
+        "timer_process_time": "Czas CPU procesu",
+        "timer_thread_time": "Czas CPU wątku",
+        "count_cycles": "Zliczaj cykle CPU",
+        "count_cycles_help": "Odczytuj sprzętowy licznik cykli (perf_event_open) wokół każdego wywołania i raportuj medianę cykli/op, wartość publikowaną przez liboqs i SUPERCOP",
+        "cycles_unavailable": "Sprzętowe zliczanie cykli (perf_event_open) nie jest dostępne na tej maszynie",
+        "cycles_title": "Cykle CPU na operację",
+        "cycles_caption": "Mediana cykli CPU w przestrzeni użytkownika na wywołanie, odczytana przez perf_event_open i skorygowana o koszt odczytu licznika.",
+        "warmup": "Rozgrzewka do stanu ustalonego",
+        "warmup_help": "Przed zapisem próbek każda operacja (cały cykl w trybie pełnego cyklu) jest wywoływana, aż mediana ostatnich 5 wywołań różni się o mniej niż 5% od poprzednich 5, aby zimne cache i zmiana taktowania CPU nie zaburzały wyników pierwszego algorytmu",
+        "context_pool": "Ponowne użycie kontekstów liboqs",
+        "context_pool_help": "Obiekty KeyEncapsulation / Signature są pobierane z ograniczonej puli zamiast tworzenia dwóch nowych w każdym cyklu",
+        "report_setup": "Raportuj czas tworzenia kontekstów",
+        "report_setup_help": "Pokaż czas tworzenia lub pobierania kontekstów liboqs w każdym cyklu jako osobną kolumnę 'Setup (ms)' (algorytmy postkwantowe)",
+        "warmup_title": "Rozgrzewka",
+        "warmup_caption": "Wywołania odrzucone przed zapisem próbek. 'Steady' ma wartość fałsz, jeśli limit czasu lub wywołań został osiągnięty przed ustabilizowaniem mediany.",
+        "target_precision": "Docelowa precyzja (± % średniej):",
+        "target_precision_help": "Tryb adaptacyjny kończy próbkowanie operacji, gdy połowa szerokości 95% przedziału ufności jej średniej spadnie poniżej tej wartości procentowej",
+        "streaming_mode": "Strumieniowo (AES-GCM w porcjach)",
+        "streaming_mode_help": "Szyfruje plik porcjami o stałym rozmiarze z osobnym nonce dla każdej porcji, więc zużycie pamięci to tylko kilka porcji (dotyczy iteracji pełnego cyklu)",
+        "chunk_size_kb": "Rozmiar porcji (KB):",
+        "payload_seed": "Ziarno danych:",
+        "startup_timing": "⏱ Czas uruchamiania",
+        "cold_start": "Zimny start (pierwsze uruchomienie w tym procesie)",
+        "this_run": "To uruchomienie",
+        "imports": "importy",
+        "render": "renderowanie",
+        "total": "łącznie",
+        "payload_seed_help": "Generowane dane są deterministyczne dla danego rozmiaru i ziarna, więc wyniki są powtarzalne",
+        "encryption_threads": "Wątki szyfrujące:",
+        "save_history": "Zapisuj uruchomienia w historii",
+        "save_history_help": "Zapisuje każde uruchomienie (konfigurację, informacje o systemie, surowe pomiary) w lokalnej bazie SQLite",
+        "history_label": "Etykieta uruchomienia (opcjonalnie):",
+        "saved_to_history": "Zapisano w historii jako uruchomienie",
+        "history_failed": "Historia wyników niedostępna:",
+        "run_history": "Historia uruchomień",
+        "no_history": "Brak zapisanych uruchomień dla tego trybu",
+        "encryption_threads_help": "Szyfrowanie i deszyfrowanie porcji w puli wątków z zachowaniem kolejności",
+        "keypairs": "Pary kluczy:",
+        "keypairs_help": "Liczba par kluczy, na które rozkładane są iteracje operacji",
+        "workers": "Procesy równoległe:",
+        "workers_help": "Liczba procesów roboczych; każdy algorytm jest osobnym zadaniem",
+        "pin_cpus": "Przypisz procesy do rdzeni CPU",
+        "pin_cpus_help": "Każdy proces roboczy działa na własnym rdzeniu CPU",
+        "isolate": "Izolowany proces roboczy",
+        "isolate_help": "Każdy algorytm działa w nowym procesie roboczym z wyłączonym odśmiecaniem pamięci, aby serwer Streamlit nie dzielił procesu z mierzonym kodem",
+        "isolate_cpu": "Rdzeń CPU benchmarku:",
+        "isolate_cpu_help": "Rdzeń, do którego przypisany jest izolowany proces; wybierz najmniej obciążony przez resztę systemu",
+        "noise_title": "Zakłócenia pomiarów",
+        "load_average": "Średnie obciążenie (1 / 5 / 15 min)",
+        "no_noise": "Nie wykryto znanych źródeł zakłóceń (governor performance, turbo i SMT wyłączone, bezczynny system)",
+        "scaling_operation_type": "Typ operacji:",
+        "scaling_operation": "Operacja:",
+        "scaling_max_workers": "Maks. liczba procesów:",
+        "scaling_backends": "Rodzaj procesów roboczych:",
+        "scaling_backends_help": "Procesy pokazują rzeczywiste skalowanie wielordzeniowe; wątki dodatkowo pokazują, czy biblioteka zwalnia GIL",
+        "backend_process": "Procesy",
+        "backend_thread": "Wątki",
+        "workers_short": "procesów",
+        "max_threads": "Maks. liczba wątków:",
+        "max_threads_help": "Test obejmuje 1, 2, 4, ... wątków aż do tej wartości",
+        "threads_short": "wątków",
+        "parallel_algo_fixed": "AES-256-GCM (KEM dostarcza jedynie klucz i nie jest częścią tego testu)",
         "classic_kem": "KEM klasyczne:",
         "pqc_kem": "KEM PQC:",
         "classic_sig": "Podpisy klasyczne:",
@@ -320,6 +547,9 @@ TRANSLATIONS = {
         "testing": "Testowanie",
         "benchmark_complete": "Benchmark zakończony!",
         "benchmark_success": "Pomyślnie przetestowano",
+        "benchmark_cancelled": "Test przerwany; częściowe wyniki dla",
+        "cancel_benchmark": "⏹ Przerwij test",
+        "cancelling": "Przerywanie po bieżącym kroku...",
         "algo_configs": "konfiguracji algorytmów!",
         
         # Errors
@@ -327,6 +557,7 @@ TRANSLATIONS = {
         "error_liboqs_help": "Dla Dockera: upewnij się, że zbudowałeś z obsługą liboqs. Lokalnie: zainstaluj liboqs-python.",
         "error_select_algos": "Wybierz przynajmniej jeden algorytm do testowania.",
         "error_select_kem_sig": "Wybierz przynajmniej jeden algorytm KEM i jeden podpisowy do testowania scenariuszy.",
+        "error_select_backend": "Wybierz przynajmniej jeden rodzaj procesów roboczych.",
         "error_no_results": "Brak wyników benchmarku. Sprawdź dostępność algorytmów.",
         "failed_to_test": "Nie udało się przetestować",
         "failed_to_benchmark": "Nie udało się wykonać benchmarku",
@@ -341,6 +572,12 @@ TRANSLATIONS = {
         "tab_export": "Eksport",
         "tab_results": "Tabela wyników",
         "tab_perf_analysis": "Analiza wydajności",
+        "tab_scaling": "Skalowanie",
+        "scaling_throughput_title": "Łączna przepustowość a liczba procesów",
+        "scaling_efficiency_title": "Efektywność na rdzeń a liczba procesów",
+        "tab_parallel": "Skalowanie wątków",
+        "parallel_throughput_title": "Przepustowość AES-GCM a liczba wątków",
+        "parallel_efficiency_title": "Efektywność na wątek a liczba wątków",
         
         # Performance tab
         "performance_metrics": "Metryki wydajności",
@@ -377,7 +614,13 @@ TRANSLATIONS = {
         "acceptable_threshold": "Akceptowalny próg",
         "statistical_summary": "Podsumowanie statystyczne",
         "outlier_analysis": "Analiza wartości odstających",
-        "no_outliers": "Nie wykryto znaczących wartości odstających w pomiarach",        "algorithm": "Algorytm",
+        "no_outliers": "Nie wykryto znaczących wartości odstających w pomiarach",
+        "tail_latency_title": "Opóźnienia ogonowe (histogram HDR)",
+        "computing_confidence": "Obliczanie przedziałów ufności metodą bootstrap...",
+        "ci_error_bars": "Słupki błędów: 95% przedział ufności średniej (bootstrap).",
+        "confidence_intervals": "Przedziały ufności (95%, bootstrap)",
+        "tail_latency_caption": "Rozkład opóźnień operacji zapisany w histogramach logarytmicznych (3 cyfry znaczące), łącznie z percentylami skrajnymi.",
+        "algorithm": "Algorytm",
         "metric": "Metryka",
         "outliers": "Wartości odstępujące",
         "percentage": "Procent",        
@@ -504,6 +747,8 @@ TRANSLATIONS = {
         "metrics_stats_desc": "📈 **Metryki statystyczne:** Consistency Score (stabilność wykonania, wyższe=lepsze), StdDev (odchylenie standardowe), P95 (95 percentyl). Pomagają ocenić przewidywalność algorytmu.",
         "metrics_scenarios_desc": "🌐 **Metryki scenariuszowe:** Symulacja rzeczywistych przypadków użycia - TLS handshake, bezpieczny email, sesja VPN, podpisywanie kodu. Pokazuje całkowity czas wszystkich operacji w pełnym scenariuszu.",
         "metrics_summary_table_desc": "📋 **Tabela podsumowania:** Zawiera wszystkie cząstkowe pomiary czasu oraz kluczowe metryki. Gradient kolorów pomaga szybko zidentyfikować najszybsze algorytmy.",
+        "metrics_scaling_desc": "🧮 **Metryki skalowania:** Łączna liczba operacji na sekundę ze wszystkich procesów oraz efektywność względem idealnego skalowania liniowego (100%). Schematy obciążające pamięć wcześniej się wypłaszczają; płaskie krzywe dla wątków oznaczają, że biblioteka trzyma GIL.",
+        "metrics_parallel_desc": "🧮 **Metryki skalowania wątków:** Przepustowość szyfrowania / deszyfrowania w GB/s dla całych danych, łącznie z ich odczytem, oraz efektywność względem idealnego skalowania liniowego (100%). Wynik każdej liczby wątków jest porównywany z referencją jednowątkową.",
     }
 }
 